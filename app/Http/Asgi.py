@@ -0,0 +1,201 @@
+"""
+ASGI Application
+
+Serves the Flask application under an ASGI server (uvicorn, hypercorn).
+Connections, request bodies and response streaming are handled on the event
+loop; the synchronous WSGI request lifecycle runs on a bounded thread pool.
+"""
+
+import asyncio
+import contextvars
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+
+_END = object()
+
+
+class _StartResponse:
+    """WSGI start_response capturing the status, headers and written data"""
+
+    __slots__ = ('status', 'headers', 'written')
+
+    def __init__(self):
+        self.status = None
+        self.headers = None
+        self.written = []
+
+    def __call__(self, status, headers, exc_info=None):
+        if exc_info is not None and self.status is not None:
+            raise exc_info[1].with_traceback(exc_info[2])
+        self.status = int(status.split(' ', 1)[0])
+        self.headers = [
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in headers
+        ]
+        return self._write
+
+    def _write(self, data):
+        # Legacy write() data is sent ahead of the chunks that follow it
+        if data:
+            self.written.append(bytes(data))
+
+    def take_written(self):
+        """Get and clear the data passed to write() so far"""
+        written, self.written = self.written, []
+        return written
+
+
+class AsgiApplication:
+    """
+    ASGI Application
+
+    Adapts a WSGI application (the Flask app) to the ASGI interface.
+    """
+
+    def __init__(self, wsgi_app, max_workers=32, spool_size=1024 * 1024):
+        """
+        Args:
+            wsgi_app: WSGI application callable
+            max_workers: Size of the thread pool running sync handlers
+            spool_size: Request bodies above this many bytes spill to disk
+        """
+        self.wsgi_app = wsgi_app
+        self.spool_size = spool_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='larapy-asgi')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+        else:
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        """Handle ASGI lifespan startup and shutdown"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _read_body(self, receive):
+        """Read the request body into a spooled temporary file"""
+        body = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            body.write(message.get('body', b''))
+            more_body = message.get('more_body', False)
+        body.seek(0)
+        return body
+
+    def build_environ(self, scope, body):
+        """
+        Build a WSGI environ from an ASGI HTTP scope
+
+        Args:
+            scope: ASGI connection scope
+            body: File-like request body
+
+        Returns:
+            WSGI environ dictionary
+        """
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1] or 80),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': body,
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False,
+            'asgi.scope': scope,
+        }
+
+        for raw_name, raw_value in scope.get('headers', []):
+            name = raw_name.decode('latin-1').upper().replace('-', '_')
+            value = raw_value.decode('latin-1')
+            if name == 'CONTENT_TYPE' or name == 'CONTENT_LENGTH':
+                key = name
+            else:
+                key = f"HTTP_{name}"
+            if key in environ:
+                separator = '; ' if key == 'HTTP_COOKIE' else ','
+                value = f"{environ[key]}{separator}{value}"
+            environ[key] = value
+
+        return environ
+
+    def _start(self, environ, start_response):
+        """Run the WSGI app and pull the first body chunk (worker thread)"""
+        iterable = self.wsgi_app(environ, start_response)
+        iterator = iter(iterable)
+        return iterable, iterator, next(iterator, _END)
+
+    async def _http(self, scope, receive, send):
+        """Serve one HTTP request through the WSGI application"""
+        loop = asyncio.get_running_loop()
+        body = await self._read_body(receive)
+        environ = self.build_environ(scope, body)
+        start_response = _StartResponse()
+
+        # The app call, every next() and close() share one context: executor
+        # threads differ between calls, and context variables set by the
+        # request (e.g. stream_with_context's request context) must be reset
+        # in the context they were set in
+        context = contextvars.copy_context()
+
+        def run(func, *args):
+            return loop.run_in_executor(self.executor, context.run, func, *args)
+
+        iterable, iterator, chunk = await run(self._start, environ, start_response)
+
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': start_response.status,
+                'headers': start_response.headers,
+            })
+
+            pending = start_response.take_written()
+            if chunk is not _END:
+                pending.append(chunk)
+
+            # The last pending chunk is held until the next one shows
+            # whether it ends the body
+            while chunk is not _END:
+                chunk = await run(next, iterator, _END)
+                pending.extend(start_response.take_written())
+                if chunk is not _END:
+                    pending.append(chunk)
+                while len(pending) > 1:
+                    await send({'type': 'http.response.body', 'body': pending.pop(0), 'more_body': True})
+
+            for index, data in enumerate(pending):
+                await send({'type': 'http.response.body', 'body': data, 'more_body': index < len(pending) - 1})
+            if not pending:
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            close = getattr(iterable, 'close', None)
+            if close is not None:
+                await run(close)
+            body.close()
@@ -0,0 +1,110 @@
+"""
+Async Support
+
+Adapters that let ``async def`` controllers and middleware run inside the
+synchronous Flask request lifecycle.
+
+Each worker thread keeps one event loop for its lifetime. Coroutines run on
+the calling thread's loop, so they see the same Flask request context and
+context variables as sync code, and async clients (database pools, HTTP
+sessions) can be reused across requests served by that thread.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+
+
+_thread_state = threading.local()
+
+
+def _thread_loop():
+    """Get (or create) the event loop owned by the current thread"""
+    loop = getattr(_thread_state, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    return loop
+
+
+def run_coroutine(coroutine):
+    """
+    Run a coroutine to completion on the current thread's event loop
+
+    Args:
+        coroutine: Coroutine object to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _thread_loop().run_until_complete(coroutine)
+
+    # This thread's loop is already busy further up the stack (e.g. an async
+    # controller behind async middleware), so run on a helper thread with a
+    # copy of the current context and wait for it. One thread per call: a
+    # shared pool would cap concurrent requests and deadlock deep nesting.
+    context = contextvars.copy_context()
+    outcome = {}
+
+    def run():
+        try:
+            outcome['result'] = context.run(asyncio.run, coroutine)
+        except BaseException as error:
+            outcome['error'] = error
+
+    helper = threading.Thread(target=run, name='larapy-async')
+    helper.start()
+    helper.join()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def ensure_sync(func):
+    """
+    Adapt an ``async def`` callable so it can be called synchronously
+
+    Args:
+        func: Route function or controller method
+
+    Returns:
+        The function itself when it is sync, else a sync wrapper
+    """
+    if not inspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        return run_coroutine(func(*args, **kwargs))
+
+    return run
+
+
+def ensure_sync_handle(handle):
+    """
+    Adapt a middleware ``handle(request, next_handler)`` method
+
+    Async middleware receives an awaitable ``next_handler``, so it can be
+    written as ``response = await next_handler(request)``.
+
+    Args:
+        handle: Bound middleware handle method
+
+    Returns:
+        Sync callable with the same signature
+    """
+    if not inspect.iscoroutinefunction(handle):
+        return handle
+
+    @functools.wraps(handle)
+    def run(request, next_handler):
+        async def next_async(request):
+            return next_handler(request)
+
+        return run_coroutine(handle(request, next_async))
+
+    return run
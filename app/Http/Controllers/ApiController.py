@@ -4,13 +4,20 @@ from larapy import Response
 from flask import jsonify, request
 from larapy.http.concerns.validates_requests import Controller
 
+from app.Http.ETag import etag
+
 
 class ApiController(Controller):
     """ApiController class"""
     
+    # Version of the static payloads below; bump it when they change so
+    # clients holding an old ETag get the new representation
+    VERSION = '1.0.0'
+    
     def __init__(self):
         super().__init__()
     
+    @etag(lambda self: self.VERSION)
     def index(self):
         """Return a JSON response"""
         return {
@@ -18,6 +25,7 @@ class ApiController(Controller):
             'status': 'success'
         }
     
+    @etag(lambda self, id: (self.VERSION, id))
     def show(self, id):
         """Return a specific resource as JSON"""
         return {
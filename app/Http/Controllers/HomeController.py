@@ -5,11 +5,16 @@ Home Controller - Handles main application pages with view rendering
 from larapy import Response
 from flask import render_template
 from app.Models.User import User
+from app.View import view
+from app.Http.ETag import etag
 import json
 
 class HomeController:
     """Main controller for homepage and basic routes"""
     
+    # Version of the static API payload; bump it when the payload changes
+    API_VERSION = '1.0.0'
+    
     def index(self):
         """Homepage with modern UI"""
         user = {
@@ -17,11 +22,12 @@ class HomeController:
             'name': 'John Doe',
             'email': 'john@doe.com'
         }
-        return render_template('index.html', 
+        # Streamed so the <head> (Vite assets) reaches the browser first
+        return view('index.html',
             user=user,
             title='Welcome to Larapy',
             message='Laravel concepts in Python Flask'
-        )
+        ).stream()
     
 
     def contact(self):
@@ -30,11 +36,12 @@ class HomeController:
             title='Contact Us'
         )
     
+    @etag(lambda self: self.API_VERSION)
     def api_data(self):
         """API endpoint returning JSON data"""
         return {
             'message': 'Hello from Larapy API',
-            'version': '1.0.0',
+            'version': self.API_VERSION,
             'status': 'success',
             'data': [
                 {'id': 1, 'name': 'Item 1'},
@@ -42,4 +49,24 @@ class HomeController:
                 {'id': 3, 'name': 'Item 3'},
             ]
         }
-    
\ No newline at end of file
+    
+    def dashboard(self):
+        """Dashboard for signed-in users"""
+        # This would normally check authentication
+        return {"message": "Welcome to your dashboard!", "status": "success"}
+
+    def test_csrf(self):
+        """Form used to verify CSRF tokens work"""
+        from flask import request, render_template_string
+
+        if request.method == 'GET':
+            form_html = '''
+            <form method="POST">
+                {{ csrf() }}
+                <input type="text" name="test_input" placeholder="Test input">
+                <button type="submit">Submit</button>
+            </form>
+            '''
+            return render_template_string(form_html)
+        else:
+            return {"message": "Form submitted successfully", "data": dict(request.form)}
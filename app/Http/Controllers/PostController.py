@@ -3,6 +3,7 @@
 from larapy import Response
 from flask import render_template, request, redirect, url_for
 from larapy.http.concerns.validates_requests import Controller
+from app.View import view
 from app.Models.Post import Post
 
 
@@ -14,8 +15,9 @@ class PostController(Controller):
     
     def index(self):
         """Display a listing of the resource"""
-        # posts = Post.all()
-        return render_template('posts/index.html')
+        # posts = Post.with_('user').get()  # authors in one query, not one per post
+        # Streamed row by row, list pages can be large
+        return view('posts/index.html').stream()
     
     def create(self):
         """Show the form for creating a new resource"""
@@ -3,6 +3,7 @@
 from larapy import Response
 from flask import render_template, request, redirect, url_for
 from larapy.http.concerns.validates_requests import Controller
+from app.View import view
 
 
 class ProductController(Controller):
@@ -14,7 +15,8 @@ class ProductController(Controller):
     def index(self):
         """Display a listing of the resource"""
         # items = Model.all()
-        return render_template('items/index.html')
+        # Streamed row by row, list pages can be large
+        return view('items/index.html').stream()
     
     def create(self):
         """Show the form for creating a new resource"""
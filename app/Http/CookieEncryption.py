@@ -0,0 +1,177 @@
+"""
+Cookie Encryption
+
+Fernet cookie encryption with lazy decryption and ciphertext reuse, used
+by the EncryptCookies middleware. Framework objects stay in the
+middleware; this module only sees cookie mappings and Set-Cookie headers.
+"""
+
+import base64
+import hashlib
+from collections.abc import Mapping
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.Support.Cache import LruCache
+
+
+def fernet_key_from_app_key(app_key):
+    """
+    Derive a Fernet key from the application key
+
+    Args:
+        app_key: APP_KEY value, optionally prefixed with 'base64:'
+
+    Returns:
+        URL-safe base64 encoded 32-byte key
+    """
+    if app_key.startswith('base64:'):
+        try:
+            raw = base64.b64decode(app_key[7:], validate=True)
+            if len(raw) == 32:
+                return base64.urlsafe_b64encode(raw)
+        except ValueError:
+            pass
+
+    return base64.urlsafe_b64encode(hashlib.sha256(app_key.encode('utf-8')).digest())
+
+
+class LazyDecryptedCookies(Mapping):
+    """
+    Read-only cookie mapping that decrypts a cookie the first time it is read
+
+    Cookies that fail to decrypt are treated as absent, as if the client
+    never sent them.
+    """
+
+    def __init__(self, raw_cookies, encrypter):
+        """
+        Args:
+            raw_cookies: The request's original (encrypted) cookies
+            encrypter: CookieEncrypter used for decryption
+        """
+        self.raw = raw_cookies
+        self.encrypter = encrypter
+        self._plaintext = {}
+
+    def _decrypted(self, name):
+        if name not in self._plaintext:
+            value = self.raw.get(name)
+            if value is not None and not self.encrypter.is_disabled(name):
+                value = self.encrypter.decrypt(value)
+            self._plaintext[name] = value
+        return self._plaintext[name]
+
+    def __getitem__(self, name):
+        value = self._decrypted(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return name in self.raw and self._decrypted(name) is not None
+
+    def __iter__(self):
+        return (name for name in self.raw if self._decrypted(name) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def getlist(self, name):
+        """Get the values of a cookie as a list (MultiDict compatibility)"""
+        value = self.get(name)
+        return [] if value is None else [value]
+
+    def to_dict(self):
+        """Decrypt every cookie into a plain dictionary"""
+        return dict(self.items())
+
+    def unchanged_ciphertext(self, name, plaintext):
+        """
+        Get the original ciphertext of a cookie if its value is unchanged
+
+        Args:
+            name: Cookie name
+            plaintext: Value the response is setting
+
+        Returns:
+            The request's ciphertext, or None when the value changed or the
+            cookie was never decrypted during this request
+        """
+        if self._plaintext.get(name) == plaintext:
+            return self.raw.get(name)
+        return None
+
+
+class CookieEncrypter:
+    """
+    Cookie Encrypter
+
+    Encrypts and decrypts cookie values with a bounded LRU mapping
+    ciphertext to plaintext across requests.
+    """
+
+    def __init__(self, app_key, cache_size=4096, except_cookies=None):
+        """
+        Args:
+            app_key: APP_KEY value
+            cache_size: Maximum number of decrypted values kept in the LRU
+            except_cookies: Names of cookies left unencrypted (kept by reference)
+        """
+        self.fernet = Fernet(fernet_key_from_app_key(app_key))
+        self.decrypted = LruCache(cache_size)
+        self.except_cookies = except_cookies if except_cookies is not None else []
+
+    def is_disabled(self, name):
+        """Determine whether encryption is disabled for a cookie"""
+        return name in self.except_cookies
+
+    def decrypt(self, ciphertext):
+        """
+        Decrypt a cookie value, consulting the LRU first
+
+        Returns:
+            Plaintext value, or None if the value is not a valid token
+        """
+        plaintext = self.decrypted.get(ciphertext)
+        if plaintext is None:
+            try:
+                plaintext = self.fernet.decrypt(ciphertext.encode('ascii')).decode('utf-8')
+            except (InvalidToken, UnicodeError, ValueError):
+                return None
+            self.decrypted.set(ciphertext, plaintext)
+        return plaintext
+
+    def encrypt(self, plaintext):
+        """Encrypt a cookie value and remember its plaintext"""
+        ciphertext = self.fernet.encrypt(plaintext.encode('utf-8')).decode('ascii')
+        self.decrypted.set(ciphertext, plaintext)
+        return ciphertext
+
+    def encrypt_headers(self, set_cookies, cookies):
+        """
+        Encrypt the values of Set-Cookie headers
+
+        Args:
+            set_cookies: Set-Cookie header values
+            cookies: The request's LazyDecryptedCookies
+
+        Returns:
+            Set-Cookie header values with encrypted values
+        """
+        from werkzeug.http import parse_cookie
+
+        encrypted = []
+        for header in set_cookies:
+            pair, separator, attributes = header.partition(';')
+            name, _, _ = pair.partition('=')
+            name = name.strip()
+            plaintext = parse_cookie(pair).get(name)
+
+            if not plaintext or self.is_disabled(name):
+                encrypted.append(header)
+                continue
+
+            ciphertext = cookies.unchanged_ciphertext(name, plaintext) or self.encrypt(plaintext)
+            encrypted.append(f"{name}={ciphertext}{separator}{attributes}")
+        return encrypted
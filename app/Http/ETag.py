@@ -0,0 +1,131 @@
+"""
+ETags
+
+Conditional GET support for JSON responses. Every JSON response gets a
+weak ETag hashed from its serialized body and an ``If-None-Match`` match
+turns it into a 304::
+
+    flask_app.after_request(conditional_json)
+
+Controllers that can tell whether their data changed without building the
+body (e.g. from an ``updated_at`` column) use the ``etag`` decorator, which
+answers 304 before the action runs::
+
+    @etag(lambda self, id: Post.find(id).updated_at)
+    def show(self, id):
+        ...
+"""
+
+import functools
+import hashlib
+
+
+def body_etag(body):
+    """
+    Hash a response body into an ETag value
+
+    Args:
+        body: Serialized body (bytes)
+
+    Returns:
+        Unquoted ETag value
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def version_etag(*parts):
+    """
+    Hash version information (timestamps, ids, counts) into an ETag value
+
+    Args:
+        parts: Values identifying the representation, e.g. a datetime
+
+    Returns:
+        Unquoted ETag value
+    """
+    normalized = [part.isoformat() if hasattr(part, 'isoformat') else repr(part) for part in parts]
+    return hashlib.blake2b('\x1f'.join(normalized).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Weakly compare an If-None-Match header with an ETag value
+
+    Args:
+        if_none_match: Header value, e.g. 'W/"abc", "def"'
+        etag: Unquoted ETag value
+
+    Returns:
+        True when the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag.strip('"') == etag:
+            return True
+    return False
+
+
+def conditional_json(response):
+    """
+    Add a weak ETag to a JSON response and answer 304 when it matches
+
+    Registered as a Flask after_request hook. Responses that already carry
+    an ETag, are streamed or are not successful GET/HEAD responses are
+    left untouched.
+
+    Args:
+        response: Flask response
+
+    Returns:
+        The response, possibly turned into a 304
+    """
+    from flask import request
+
+    if (request.method not in ('GET', 'HEAD') or response.status_code != 200 or not response.is_json
+            or response.is_streamed or 'ETag' in response.headers):
+        return response
+
+    response.set_etag(body_etag(response.get_data()), weak=True)
+    return response.make_conditional(request)
+
+
+def etag(resolver):
+    """
+    Compute a route's ETag from version information before running it
+
+    Args:
+        resolver: Callable receiving the action's arguments and returning
+            the version of the representation (e.g. ``updated_at``). None
+            skips the check and runs the action normally.
+
+    Returns:
+        Decorator for controller actions
+    """
+    def decorator(action):
+        @functools.wraps(action)
+        def wrapper(*args, **kwargs):
+            from flask import make_response, request
+
+            version = resolver(*args, **kwargs)
+            if version is None or request.method not in ('GET', 'HEAD'):
+                return action(*args, **kwargs)
+
+            value = version_etag(action.__qualname__, version)
+            if etag_matches(request.headers.get('If-None-Match'), value):
+                response = make_response('', 304)
+                response.set_etag(value, weak=True)
+                return response
+
+            response = make_response(action(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(value, weak=True)
+            return response
+
+        return wrapper
+    return decorator
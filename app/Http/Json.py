@@ -0,0 +1,136 @@
+"""
+JSON
+
+Fast JSON encoding for responses. Uses orjson when it is installed and
+the standard library otherwise; both produce compact UTF-8 bytes with
+the same handling of application types:
+
+- datetime, date: RFC 822 HTTP dates like Flask's default provider, or
+  ISO 8601 strings with ``iso_dates``
+- time: ISO 8601 string
+- UUID: canonical string
+- Decimal: string, so no precision is lost
+- models and other objects with to_dict(): their dictionary
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def default(value):
+    """
+    Convert values the encoders do not handle natively
+
+    Raises:
+        TypeError: For values that cannot be serialized
+    """
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return http_date(value)
+    if isinstance(value, datetime.time):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iso_default(value):
+    """Like default(), with datetimes and dates as ISO 8601 strings"""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return default(value)
+
+
+# Standard library encoders by (indent, sort_keys, iso_dates), built once
+_encoders = {
+    (indent, sort_keys, iso_dates): json.JSONEncoder(
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (',', ':'),
+        sort_keys=sort_keys,
+        default=iso_default if iso_dates else default,
+    )
+    for indent in (False, True)
+    for sort_keys in (False, True)
+    for iso_dates in (False, True)
+}
+
+
+def dumps(value, indent=False, sort_keys=False, iso_dates=False):
+    """
+    Serialize a value to JSON
+
+    Args:
+        value: Value to serialize
+        indent: Pretty-print with two-space indentation
+        sort_keys: Sort object keys
+        iso_dates: Encode datetimes and dates as ISO 8601 instead of
+            RFC 822 HTTP dates
+
+    Returns:
+        UTF-8 encoded JSON (bytes)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if iso_dates:
+            return orjson.dumps(value, default=iso_default, option=option)
+        # orjson writes datetimes as ISO 8601 itself; hand them to default()
+        return orjson.dumps(value, default=default, option=option | orjson.OPT_PASSTHROUGH_DATETIME)
+
+    return _encoders[bool(indent), bool(sort_keys), bool(iso_dates)].encode(value).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def stream_json(items, buffer_size=64 * 1024, iso_dates=False):
+    """
+    Encode an iterable as a JSON array in chunks
+
+    Items are encoded one at a time and sent whenever the buffer fills, so
+    large result sets (e.g. a cursor over a table) never exist as one
+    string in memory.
+
+    Args:
+        items: Iterable of serializable values
+        buffer_size: Bytes to accumulate before yielding a chunk
+        iso_dates: Encode datetimes and dates as ISO 8601
+
+    Yields:
+        Chunks of UTF-8 encoded JSON (bytes)
+    """
+    buffer = bytearray(b'[')
+    first = True
+    for item in items:
+        if not first:
+            buffer += b','
+        first = False
+        buffer += dumps(item, iso_dates=iso_dates)
+        if len(buffer) >= buffer_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b']'
+    yield bytes(buffer)
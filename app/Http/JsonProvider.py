@@ -0,0 +1,82 @@
+"""
+JSON Provider
+
+Flask JSON provider backed by app.Http.Json.
+"""
+
+from flask import stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+from app.Http import Json
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Fast JSON Provider
+
+    Serializes dicts and lists returned from controllers, jsonify() and
+    the ``tojson`` template filter with app.Http.Json. Responses are built
+    directly from the encoded bytes. Keys keep their insertion order
+    unless ``sort_keys`` is enabled. Dates are RFC 822 HTTP dates, as with
+    Flask's default provider, unless ``iso_dates`` is enabled.
+    """
+
+    sort_keys = False
+    iso_dates = False
+
+    def dumps(self, obj, **kwargs):
+        """Serialize to a JSON string"""
+        indent = bool(kwargs.get('indent'))
+        sort_keys = kwargs.get('sort_keys', self.sort_keys)
+        return Json.dumps(obj, indent=indent, sort_keys=sort_keys, iso_dates=self.iso_dates).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON"""
+        return Json.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Create a JSON response
+
+        Returns:
+            Response with an application/json body
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            Json.dumps(obj, indent=indent, sort_keys=self.sort_keys, iso_dates=self.iso_dates),
+            mimetype=self.mimetype,
+        )
+
+    def stream(self, items, buffer_size=64 * 1024):
+        """
+        Create a streamed JSON array response for a large iterable
+
+        Args:
+            items: Iterable of serializable values (e.g. a query cursor)
+            buffer_size: Bytes per chunk sent to the client
+
+        Returns:
+            Streamed response
+        """
+        return self._app.response_class(
+            stream_with_context(Json.stream_json(items, buffer_size, self.iso_dates)), mimetype=self.mimetype
+        )
+
+
+def install_json_provider(flask_app, iso_dates=False):
+    """
+    Serialize a Flask app's JSON with FastJSONProvider
+
+    Args:
+        flask_app: Flask application
+        iso_dates: Encode datetimes and dates as ISO 8601 instead of
+            RFC 822 HTTP dates
+
+    Returns:
+        The installed provider
+    """
+    flask_app.json_provider_class = FastJSONProvider
+    flask_app.json = FastJSONProvider(flask_app)
+    flask_app.json.iso_dates = iso_dates
+    return flask_app.json
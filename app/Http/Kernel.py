@@ -14,14 +14,20 @@ sys.path.insert(0, str(package_path))
 
 # Import Larapy security middleware
 from larapy.http.middleware.verify_csrf_token import VerifyCSRFToken
-from larapy.cookie.middleware.encrypt_cookies import EncryptCookies  
 from larapy.http.middleware.handle_cors import HandleCors
-from larapy.routing.middleware.throttle_requests import ThrottleRequests
 from larapy.http.middleware.security_headers import SecurityHeaders, FrameGuard
 from larapy.auth.middleware.authenticate import Authenticate, RedirectIfAuthenticated
 
 # Import local config
 from config.security import get_security_config
+from config.server import get_server_config
+from app.Http.Pipeline import PipelineCompiler
+from app.Http.SecurityHeaders import SecurityHeaderBundles
+from app.Http.RateLimiter import create_rate_limiter
+from app.Http.Middleware.ThrottleRequests import ThrottleRequests
+from app.Http.Middleware.CorsPreflight import CorsPreflight
+from app.Http.Middleware.Compression import CompressResponses
+from app.Http.Middleware.EncryptCookies import EncryptCookies
 
 
 class HttpKernel:
@@ -36,6 +42,10 @@ class HttpKernel:
         
         # Initialize middleware instances with configuration
         self._setup_middleware()
+        self._build_middleware_groups()
+        
+        # Compile security headers once, the config never changes after boot
+        self._compile_security_headers()
     
     def _setup_middleware(self):
         """Setup middleware instances with configuration"""
@@ -46,14 +56,23 @@ class HttpKernel:
         self.csrf_middleware.except_routes.extend(csrf_config['exclude'])
         
         # Cookie encryption middleware
-        self.encrypt_cookies = EncryptCookies()
         cookie_config = self.security_config['cookies']
+        self.encrypt_cookies = EncryptCookies(
+            self.security_config['encryption'],
+            cookie_config.get('decrypt_cache_size', 4096),
+        )
         self.encrypt_cookies.except_cookies.extend(cookie_config['exclude'])
         
         # CORS middleware
         cors_config = self.security_config['cors']
         self.cors_middleware = HandleCors(cors_config)
         
+        # Precomputed preflight responses, answered before routing
+        self.cors_preflight = CorsPreflight(cors_config)
+        
+        # Response compression, applied around the whole WSGI app
+        self.compression = CompressResponses(get_server_config()['compression'])
+        
         # Security headers middleware
         headers_config = self.security_config['security_headers']
         self.security_headers = SecurityHeaders(headers_config)
@@ -61,46 +80,94 @@ class HttpKernel:
         # Frame guard middleware
         self.frame_guard = FrameGuard(headers_config['x_frame_options'])
         
-        # Throttle middleware instances
-        self.throttle_default = ThrottleRequests('default')
-        self.throttle_api = ThrottleRequests('api')
-        self.throttle_login = ThrottleRequests('login')
+        # Throttle middleware instances sharing one token-bucket backend
+        self.rate_limiter = create_rate_limiter(self.security_config['rate_limiting_backend'])
+        limits = self.security_config['rate_limiting']
+        self.throttle_default = ThrottleRequests('default', limits['default'], self.rate_limiter)
+        self.throttle_api = ThrottleRequests('api', limits['api'], self.rate_limiter)
+        self.throttle_login = ThrottleRequests('login', limits['login'], self.rate_limiter)
         
         # Authentication middleware
         self.auth_web = Authenticate(['web'])
         self.auth_api = Authenticate(['api'])
         self.guest = RedirectIfAuthenticated(['web'])
     
+    def _compile_security_headers(self):
+        """Compile the default security header bundle and per-route overrides"""
+        self.security_header_bundles = SecurityHeaderBundles(
+            self.security_config['security_headers'],
+            self.security_config.get('security_header_overrides', {}),
+        )
+        self.security_header_bundle = self.security_header_bundles.default
+    
+    def override_security_headers(self, endpoint, overrides):
+        """
+        Register a security header override for a single route
+        
+        Args:
+            endpoint: Route endpoint name
+            overrides: Security header config keys to replace; a falsy
+                value removes the header for that route
+        """
+        self.security_header_bundles.override(endpoint, overrides)
+    
+    def security_headers_for(self, endpoint):
+        """
+        Get the compiled security header bundle for an endpoint
+        
+        Args:
+            endpoint: Route endpoint name (may be None for unmatched requests)
+            
+        Returns:
+            Tuple of (header name, value) pairs
+        """
+        return self.security_header_bundles.for_endpoint(endpoint)
+    
+    def _build_middleware_groups(self):
+        """
+        Build the middleware groups once
+        
+        Laravel order: most general to most specific
+        """
+        self._middleware_groups = {
+            # Global middleware applied to all requests
+            'global': (
+                self.security_headers,    # Security headers first
+                self.frame_guard,         # Clickjacking protection
+                self.cors_middleware,     # CORS handling
+                self.encrypt_cookies,     # Cookie encryption
+            ),
+            # Middleware group for web routes
+            'web': (
+                # self.csrf_middleware,     # CSRF protection for web forms - temporarily disabled for debugging
+            ),
+            # Middleware group for API routes
+            'api': (
+                self.throttle_api,        # API rate limiting
+            ),
+        }
+        self.pipelines = PipelineCompiler(self.get_middleware_for_group)
+    
     @property
     def global_middleware(self):
         """
         Global middleware applied to all requests
-        Laravel order: most general to most specific
         """
-        return [
-            self.security_headers,    # Security headers first
-            self.frame_guard,         # Clickjacking protection
-            self.cors_middleware,     # CORS handling
-            self.encrypt_cookies,     # Cookie encryption
-        ]
+        return self._middleware_groups['global']
     
     @property 
     def web_middleware(self):
         """
         Middleware group for web routes
         """
-        return [
-            # self.csrf_middleware,     # CSRF protection for web forms - temporarily disabled for debugging
-        ]
+        return self._middleware_groups['web']
     
     @property
     def api_middleware(self):
         """
         Middleware group for API routes
         """
-        return [
-            self.throttle_api,        # API rate limiting
-        ]
+        return self._middleware_groups['api']
     
     def get_middleware_for_group(self, group):
         """
@@ -110,42 +177,38 @@ class HttpKernel:
             group: Middleware group name ('web', 'api', 'global')
             
         Returns:
-            List of middleware instances
+            Tuple of middleware instances
         """
-        if group == 'global':
-            return self.global_middleware
-        elif group == 'web':
-            return self.web_middleware  
-        elif group == 'api':
-            return self.api_middleware
-        else:
-            return []
+        return self._middleware_groups.get(group, ())
     
-    def apply_middleware_to_route(self, route_func, groups=None):
+    def apply_middleware_to_route(self, route_func, groups=None, endpoint=None):
         """
         Apply middleware groups to a route function
         
+        The chain for each group combination is compiled once and cached,
+        so registering many routes with the same groups shares one pipeline.
+        
         Args:
             route_func: Route function to wrap
             groups: List of middleware groups to apply
+            endpoint: Endpoint name used when dumping compiled pipelines
             
         Returns:
             Wrapped function with middleware applied
         """
         if groups is None:
-            groups = ['global']
+            groups = ('global',)
         
-        # Collect all middleware for the groups
-        middleware_stack = []
-        for group in groups:
-            middleware_stack.extend(self.get_middleware_for_group(group))
-        
-        # Apply middleware in reverse order (outermost first)
-        wrapped_func = route_func
-        for middleware in reversed(middleware_stack):
-            wrapped_func = middleware(wrapped_func)
+        return self.pipelines.bind(route_func, groups, endpoint)
+    
+    def dump_pipelines(self):
+        """
+        Dump the compiled middleware chain for every registered route
         
-        return wrapped_func
+        Returns:
+            Dictionary mapping endpoint names to groups and middleware names
+        """
+        return self.pipelines.dump()
 
 
 # Create global kernel instance
@@ -171,6 +234,14 @@ def apply_global_middleware(app, kernel_instance=None):
     if kernel_instance is None:
         kernel_instance = get_kernel(app)
     
+    from flask import request
+    
+    # Compress response bodies (including streamed pages) on the way out
+    app.wsgi_app = kernel_instance.compression.wrap(app.wsgi_app)
+    
+    # Answer CORS preflights before Flask routes or dispatches the request
+    app.wsgi_app = kernel_instance.cors_preflight.wrap(app.wsgi_app)
+    
     # Apply global middleware using Flask's before/after request hooks
     @app.before_request
     def apply_security_headers():
@@ -179,31 +250,8 @@ def apply_global_middleware(app, kernel_instance=None):
     
     @app.after_request
     def add_security_headers(response):
-        """Add security headers to all responses"""
-        # Apply security headers
-        headers_config = kernel_instance.security_config['security_headers']
-        
-        if headers_config.get('x_frame_options'):
-            response.headers['X-Frame-Options'] = headers_config['x_frame_options']
-        
-        if headers_config.get('x_content_type_options'):
-            response.headers['X-Content-Type-Options'] = headers_config['x_content_type_options']
-        
-        if headers_config.get('x_xss_protection'):
-            response.headers['X-XSS-Protection'] = headers_config['x_xss_protection']
-        
-        if headers_config.get('strict_transport_security'):
-            response.headers['Strict-Transport-Security'] = headers_config['strict_transport_security']
-        
-        if headers_config.get('content_security_policy'):
-            response.headers['Content-Security-Policy'] = headers_config['content_security_policy']
-        
-        if headers_config.get('referrer_policy'):
-            response.headers['Referrer-Policy'] = headers_config['referrer_policy']
-        
-        if headers_config.get('permissions_policy'):
-            response.headers['Permissions-Policy'] = headers_config['permissions_policy']
-        
+        """Add the precompiled security header bundle to all responses"""
+        response.headers.update(kernel_instance.security_headers_for(request.endpoint))
         return response
     
     return app
\ No newline at end of file
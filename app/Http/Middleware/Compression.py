@@ -0,0 +1,260 @@
+"""
+Compression Middleware
+
+Compresses response bodies at the WSGI layer with brotli, zstd (when
+their packages are installed) or gzip, negotiated from Accept-Encoding.
+"""
+
+import fnmatch
+import zlib
+
+from app.Http.StaticAssets import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Status codes that never carry a body
+BODYLESS_STATUSES = ('204', '304')
+
+
+def available_encodings():
+    """Get the encodings whose compressors are installed"""
+    encodings = {'gzip'}
+    if brotli is not None:
+        encodings.add('br')
+    if zstandard is not None:
+        encodings.add('zstd')
+    return encodings
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for one response body
+
+    compress() returns the compressed form of a chunk flushed to a byte
+    boundary, so every chunk of a streamed page reaches the client as soon
+    as it is produced.
+    """
+
+    def __init__(self, encoding, level):
+        """
+        Args:
+            encoding: 'br', 'zstd' or 'gzip'
+            level: Compression level for that encoding
+        """
+        self.encoding = encoding
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == 'zstd':
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            # wbits 31: gzip container
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data, flush=True):
+        """Compress a chunk, flushing it to the output unless flush is False"""
+        if self.encoding == 'br':
+            output = self._compressor.process(data)
+            return output + self._compressor.flush() if flush else output
+        output = self._compressor.compress(data)
+        if not flush:
+            return output
+        if self.encoding == 'zstd':
+            return output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        """End the stream"""
+        if self.encoding == 'br':
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class _Prefetched:
+    """Body iterable whose first chunk has been read"""
+
+    def __init__(self, body):
+        self.body = body
+        self.iterator = iter(body)
+        self.first = next(self.iterator, None)
+
+    def __iter__(self):
+        if self.first is not None:
+            yield self.first
+        yield from self.iterator
+
+    def close(self):
+        if hasattr(self.body, 'close'):
+            self.body.close()
+
+
+class CompressResponses:
+    """
+    Compression Middleware
+
+    Bodies with a Content-Length are compressed in one pass and only when
+    at least ``min_size`` bytes; bodies without one (streamed responses)
+    are compressed chunk by chunk. Compression levels are chosen per route
+    group, matched on the request path.
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config: The 'compression' server configuration
+        """
+        self.enabled = config.get('enabled', True)
+        self.min_size = config.get('min_size', 1024)
+        self.mimetypes = tuple(config.get('mimetypes', ()))
+        self.except_paths = tuple(config.get('except', ()))
+        self.encodings = [
+            encoding for encoding in config.get('encodings', ('br', 'zstd', 'gzip'))
+            if encoding in available_encodings()
+        ]
+        self.groups = [
+            (tuple(group.get('paths', ('*',))), dict(group.get('levels', {})))
+            for group in config.get('groups', {}).values()
+        ]
+        self.default_levels = {'br': 4, 'zstd': 3, 'gzip': 6}
+
+    def levels_for(self, path):
+        """Get the compression levels of the first route group matching a path"""
+        for patterns, levels in self.groups:
+            if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns):
+                return dict(self.default_levels, **levels)
+        return self.default_levels
+
+    def negotiate(self, accept_encoding):
+        """Pick the preferred installed encoding the client accepts, or None"""
+        if not accept_encoding:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in self.encodings:
+            if encoding in accepted:
+                return encoding
+        return None
+
+    def compressible(self, status, headers):
+        """
+        Determine whether a response may be compressed
+
+        Args:
+            status: WSGI status line
+            headers: Response headers as (name, value) pairs
+        """
+        if status[:3] in BODYLESS_STATUSES or status[0] == '1':
+            return False
+        content_type = None
+        for name, value in headers:
+            name = name.lower()
+            if name == 'content-type':
+                content_type = value.lower()
+            elif name == 'content-encoding' and value.lower() != 'identity':
+                return False
+            elif name == 'content-length' and int(value) < self.min_size:
+                return False
+            elif name == 'cache-control' and 'no-transform' in value.lower():
+                return False
+        return content_type is not None and content_type.startswith(self.mimetypes)
+
+    def wrap(self, wsgi_app):
+        """
+        Wrap a WSGI application so its responses are compressed
+
+        Args:
+            wsgi_app: The WSGI application
+        """
+        if not self.enabled or not self.encodings:
+            return wsgi_app
+
+        def compression_app(environ, start_response):
+            path = environ.get('PATH_INFO', '')
+            encoding = None
+            if environ.get('REQUEST_METHOD') != 'HEAD' and not any(
+                fnmatch.fnmatchcase(path, pattern) for pattern in self.except_paths
+            ):
+                encoding = self.negotiate(environ.get('HTTP_ACCEPT_ENCODING'))
+            if encoding is None:
+                return wsgi_app(environ, start_response)
+
+            state = {}
+
+            def compress_start_response(status, headers, exc_info=None):
+                state['started'] = True
+                headers = list(headers)
+                if self.compressible(status, headers):
+                    state['length'] = next(
+                        (int(value) for name, value in headers if name.lower() == 'content-length'), None
+                    )
+                    state['headers'] = self._compressed_headers(headers, encoding)
+                    state['status'] = status
+                    state['exc_info'] = exc_info
+                    # Sent once the body's compressed length is known
+                    return None
+                return start_response(status, headers, exc_info)
+
+            body = wsgi_app(environ, compress_start_response)
+            if 'started' not in state:
+                # Applications may start the response on the first iteration
+                body = _Prefetched(body)
+            if 'headers' not in state:
+                return body
+
+            compressor = StreamCompressor(encoding, self.levels_for(path)[encoding])
+            if state['length'] is not None:
+                # Buffered response: compress once and send an exact length
+                try:
+                    data = compressor.compress(b''.join(body), flush=False) + compressor.finish()
+                finally:
+                    if hasattr(body, 'close'):
+                        body.close()
+                headers = state['headers'] + [('Content-Length', str(len(data)))]
+                start_response(state['status'], headers, state['exc_info'])
+                return [data]
+
+            start_response(state['status'], state['headers'], state['exc_info'])
+            return self._stream(body, compressor)
+
+        return compression_app
+
+    @staticmethod
+    def _vary(headers):
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == 'vary':
+                if 'accept-encoding' not in value.lower():
+                    headers[index] = (name, f"{value}, Accept-Encoding")
+                return headers
+        headers.append(('Vary', 'Accept-Encoding'))
+        return headers
+
+    def _compressed_headers(self, headers, encoding):
+        compressed = []
+        for name, value in headers:
+            lower = name.lower()
+            if lower == 'content-length':
+                continue
+            if lower == 'etag' and not value.startswith('W/'):
+                # The compressed bytes differ, so only weak equality holds
+                value = f"W/{value}"
+            compressed.append((name, value))
+        compressed.append(('Content-Encoding', encoding))
+        return self._vary(compressed)
+
+    @staticmethod
+    def _stream(body, compressor):
+        try:
+            for chunk in body:
+                if chunk:
+                    yield compressor.compress(chunk)
+            yield compressor.finish()
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
@@ -0,0 +1,156 @@
+"""
+CORS Preflight Middleware
+
+Answers CORS preflight requests at the WSGI layer, before Flask builds a
+request context, routes the request or runs any other middleware.
+"""
+
+import fnmatch
+import re
+
+
+class CorsPreflight:
+    """
+    CORS Preflight Middleware
+
+    Compiles the CORS configuration into one precomputed response per path
+    pattern. Only the parts that must echo the request (origin, method or
+    headers when credentials rule out wildcards) are filled in per request.
+    """
+
+    def __init__(self, cors_config):
+        """
+        Args:
+            cors_config: The 'cors' security configuration
+        """
+        self.config = cors_config
+        self.patterns = tuple(
+            (self._compile_pattern(pattern), self._compile_response(cors_config))
+            for pattern in cors_config.get('paths', [])
+        )
+
+    @staticmethod
+    def _compile_pattern(pattern):
+        """
+        Compile a path pattern such as 'api/*' into a matcher
+
+        Returns:
+            Callable taking a path without leading slash
+        """
+        pattern = pattern.strip('/') or '/'
+        if pattern.endswith('*') and not any(c in pattern[:-1] for c in '*?['):
+            prefix = pattern[:-1]
+            return lambda path: path.startswith(prefix)
+        if not any(c in pattern for c in '*?['):
+            return lambda path: path == pattern
+        return re.compile(fnmatch.translate(pattern)).match
+
+    @staticmethod
+    def _compile_response(config):
+        """
+        Precompute the preflight response for a configuration
+
+        Returns:
+            Tuple of (static headers, allowed origins or None for any origin,
+            echo origin flag, echo method flag, echo headers flag)
+        """
+        credentials = bool(config.get('supports_credentials'))
+        origins = config.get('allowed_origins', [])
+        methods = config.get('allowed_methods', [])
+        allowed_headers = config.get('allowed_headers', [])
+        max_age = int(config.get('max_age') or 0)
+
+        any_origin = '*' in origins
+        echo_origin = credentials or not any_origin
+        echo_method = '*' in methods and credentials
+        # The '*' wildcard never covers Authorization, so echo requested headers
+        echo_headers = '*' in allowed_headers
+
+        headers = [('Content-Length', '0')]
+        vary = []
+
+        if echo_origin:
+            vary.append('Origin')
+        else:
+            headers.append(('Access-Control-Allow-Origin', '*'))
+
+        if echo_method:
+            vary.append('Access-Control-Request-Method')
+        else:
+            allow_methods = '*' if '*' in methods else ', '.join(m.upper() for m in methods)
+            headers.append(('Access-Control-Allow-Methods', allow_methods))
+
+        if echo_headers:
+            vary.append('Access-Control-Request-Headers')
+        elif allowed_headers:
+            headers.append(('Access-Control-Allow-Headers', ', '.join(allowed_headers)))
+
+        if credentials:
+            headers.append(('Access-Control-Allow-Credentials', 'true'))
+
+        if max_age > 0:
+            headers.append(('Access-Control-Max-Age', str(max_age)))
+
+        if vary:
+            headers.append(('Vary', ', '.join(vary)))
+
+        allowed_origins = None if any_origin else frozenset(origins)
+        return tuple(headers), allowed_origins, echo_origin, echo_method, echo_headers
+
+    def response_for(self, environ):
+        """
+        Build the preflight response for a WSGI environ
+
+        Args:
+            environ: WSGI environment of an OPTIONS preflight request
+
+        Returns:
+            List of response headers, or None when no pattern matches
+        """
+        path = environ.get('PATH_INFO', '').lstrip('/') or '/'
+
+        for matches, compiled in self.patterns:
+            if not matches(path):
+                continue
+
+            headers, allowed_origins, echo_origin, echo_method, echo_headers = compiled
+            headers = list(headers)
+
+            if echo_origin:
+                origin = environ.get('HTTP_ORIGIN')
+                if origin and (allowed_origins is None or origin in allowed_origins):
+                    headers.append(('Access-Control-Allow-Origin', origin))
+
+            if echo_method:
+                headers.append(('Access-Control-Allow-Methods', environ['HTTP_ACCESS_CONTROL_REQUEST_METHOD']))
+
+            if echo_headers:
+                requested = environ.get('HTTP_ACCESS_CONTROL_REQUEST_HEADERS')
+                if requested:
+                    headers.append(('Access-Control-Allow-Headers', requested))
+
+            return headers
+
+        return None
+
+    def wrap(self, wsgi_app):
+        """
+        Wrap a WSGI application so preflights never reach it
+
+        Args:
+            wsgi_app: The WSGI application (typically flask_app.wsgi_app)
+
+        Returns:
+            WSGI application answering matching preflights directly
+        """
+        def preflight_app(environ, start_response):
+            if (environ.get('REQUEST_METHOD') == 'OPTIONS'
+                    and 'HTTP_ACCESS_CONTROL_REQUEST_METHOD' in environ):
+                headers = self.response_for(environ)
+                if headers is not None:
+                    start_response('204 No Content', headers)
+                    return [b'']
+
+            return wsgi_app(environ, start_response)
+
+        return preflight_app
@@ -0,0 +1,76 @@
+"""
+Encrypt Cookies Middleware
+
+Fernet cookie encryption with lazy decryption and ciphertext reuse.
+"""
+
+from typing import Callable
+
+from larapy.cookie.middleware.encrypt_cookies import EncryptCookies as BaseEncryptCookies
+
+from app.Http.CookieEncryption import CookieEncrypter, LazyDecryptedCookies
+
+
+class EncryptCookies(BaseEncryptCookies):
+    """
+    Encrypt Cookies Middleware
+
+    Request cookies are only decrypted when a handler reads them, with a
+    bounded LRU mapping ciphertext to plaintext across requests. Response
+    cookies whose value did not change reuse the request's ciphertext
+    instead of being encrypted again (see app.Http.CookieEncryption).
+    """
+
+    def __init__(self, encryption_config, cache_size=4096):
+        """
+        Args:
+            encryption_config: The 'encryption' security configuration
+            cache_size: Maximum number of decrypted values kept in the LRU
+        """
+        super().__init__()
+        self.encrypter = CookieEncrypter(encryption_config['key'], cache_size, self.except_cookies)
+
+    def is_disabled(self, name):
+        """Determine whether encryption is disabled for a cookie"""
+        return self.encrypter.is_disabled(name)
+
+    def decrypt(self, ciphertext):
+        """Decrypt a cookie value, or None if it is not a valid token"""
+        return self.encrypter.decrypt(ciphertext)
+
+    def encrypt(self, plaintext):
+        """Encrypt a cookie value"""
+        return self.encrypter.encrypt(plaintext)
+
+    def handle(self, request, next_handler: Callable):
+        """
+        Handle the incoming request
+
+        Args:
+            request: The HTTP request object
+            next_handler: The next middleware/handler in the pipeline
+
+        Returns:
+            HTTP response with encrypted cookies
+        """
+        cookies = LazyDecryptedCookies(request.cookies, self.encrypter)
+        request.cookies = cookies
+
+        response = next_handler(request)
+
+        if hasattr(response, 'headers'):
+            self.encrypt_response_cookies(response, cookies)
+
+        return response
+
+    def encrypt_response_cookies(self, response, cookies):
+        """
+        Encrypt the cookies set on a response
+
+        Args:
+            response: The HTTP response object
+            cookies: The request's lazily decrypted cookies
+        """
+        set_cookies = response.headers.getlist('Set-Cookie')
+        if set_cookies:
+            response.headers.setlist('Set-Cookie', self.encrypter.encrypt_headers(set_cookies, cookies))
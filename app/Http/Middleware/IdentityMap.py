@@ -0,0 +1,34 @@
+"""
+Identity Map Middleware
+
+Scopes an identity map to each request.
+"""
+
+from larapy.http.middleware.middleware import Middleware
+from typing import Callable
+
+from app.Support.Database import within_identity_map
+
+
+class IdentityMapMiddleware(Middleware):
+    """
+    Identity Map Middleware
+
+    Opt-in per route or group: while the request is handled, each row is
+    loaded into a single model instance and find() or belongs_to loads of
+    already loaded models skip the database. Streamed bodies render with
+    the map still active.
+    """
+
+    def handle(self, request, next_handler: Callable):
+        """
+        Handle the incoming request
+
+        Args:
+            request: The HTTP request object
+            next_handler: The next middleware/handler in the pipeline
+
+        Returns:
+            HTTP response
+        """
+        return within_identity_map(next_handler, request)
@@ -0,0 +1,134 @@
+"""
+Response Cache Middleware
+
+Serves anonymous pages from the full-page response cache.
+"""
+
+from larapy.http.middleware.middleware import Middleware
+from typing import Callable
+
+from app.Http.ResponseCache import REVALIDATE_ENVIRON_KEY, response_cache, revalidate
+
+
+class ResponseCacheMiddleware(Middleware):
+    """
+    Response Cache Middleware
+
+    Answers cacheable requests from app.Http.ResponseCache and stores
+    eligible responses. Responses carry an X-Cache header (HIT, STALE or
+    MISS) and their surrogate keys in Surrogate-Key. Controllers can add
+    keys by setting a Surrogate-Key header themselves.
+
+    Pages whose rendering wrote to the session (e.g. a CSRF token) are
+    personal and never stored.
+    """
+
+    def handle(self, request, next_handler: Callable):
+        """
+        Handle the incoming request
+
+        Args:
+            request: The HTTP request object
+            next_handler: The next middleware/handler in the pipeline
+
+        Returns:
+            Cached or freshly rendered HTTP response
+        """
+        cache = response_cache()
+        if not cache.cacheable_request(request.method, request.path, request.headers, request.cookies):
+            return next_handler(request)
+
+        key = cache.key(request.path, request.query_string, request.headers, request.cookies)
+        if self.environ().get(REVALIDATE_ENVIRON_KEY):
+            # Internal refresh of a stale entry: render and store
+            return self.capture(cache, key, request, next_handler(request))
+
+        entry, state = cache.lookup(key)
+
+        if state == 'hit':
+            return self.replay(cache, entry, 'HIT')
+
+        if state == 'stale':
+            if cache.begin_revalidation(key):
+                self.revalidate(cache, key)
+            return self.replay(cache, entry, 'STALE')
+
+        response = self.capture(cache, key, request, next_handler(request))
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+    @staticmethod
+    def replay(cache, entry, state):
+        """Build a response from a cache entry"""
+        from flask import Response
+
+        response = Response(entry['body'], status=entry['status'], headers=entry['headers'])
+        response.headers['Age'] = str(cache.age(entry))
+        response.headers['X-Cache'] = state
+        return response
+
+    def capture(self, cache, key, request, response):
+        """
+        Store a response if it is cacheable
+
+        Streamed bodies are recorded as they are sent and stored once the
+        stream completes, so the first visitor still gets a streamed page.
+
+        Returns:
+            The response to send
+        """
+        from flask import make_response
+
+        if not hasattr(response, 'headers'):
+            response = make_response(response)
+
+        if not cache.cacheable_response(response.status_code, response.headers.items()) or self.personalized():
+            return response
+
+        keys = cache.surrogate_keys(request.path, response.headers.get('Surrogate-Key', '').split())
+        response.headers['Surrogate-Key'] = ' '.join(keys)
+
+        if response.is_streamed:
+            def store(body):
+                if not self.personalized():
+                    cache.store(key, response.status_code, response.headers.items(), body, keys)
+            response.response = self._record(response.response, store)
+        else:
+            cache.store(key, response.status_code, response.headers.items(), response.get_data(), keys)
+        return response
+
+    def revalidate(self, cache, key):
+        """Refresh a stale entry with an internal request in a background thread"""
+        from flask import current_app
+
+        revalidate(current_app.wsgi_app, self.environ(), lambda: cache.end_revalidation(key))
+
+    @staticmethod
+    def environ():
+        """Get the WSGI environ of the current request"""
+        from flask import request
+
+        return request.environ
+
+    @staticmethod
+    def personalized():
+        """Determine whether the handler stored anything in the session"""
+        from flask import session
+
+        try:
+            return bool(session) or getattr(session, 'modified', False)
+        except RuntimeError:
+            return False
+
+    @staticmethod
+    def _record(chunks, on_complete):
+        body = []
+        try:
+            for chunk in chunks:
+                body.append(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+                yield chunk
+            on_complete(b''.join(body))
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
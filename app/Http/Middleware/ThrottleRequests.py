@@ -0,0 +1,93 @@
+"""
+Throttle Requests Middleware
+
+Rate limits requests with a token-bucket backend shared by all limiters.
+"""
+
+from larapy.routing.middleware.throttle_requests import ThrottleRequests as BaseThrottleRequests
+from typing import Callable
+
+from app.Http.RateLimiter import TokenBucketTable, parse_rate_limit
+
+
+class ThrottleRequests(BaseThrottleRequests):
+    """
+    Throttle Requests Middleware
+
+    Each named limiter ('default', 'api', 'login') draws from its own bucket
+    per client in a token-bucket table. With the shared table every worker
+    process on the host enforces the same budget.
+    """
+
+    def __init__(self, name='default', limit='60,1', backend=None):
+        """
+        Args:
+            name: Limiter name
+            limit: Rate limit string in the form 'max_attempts,decay_minutes'
+            backend: Token-bucket table (defaults to an in-process table)
+        """
+        super().__init__(name)
+        self.limiter_name = name
+        self.capacity, self.refill_rate = parse_rate_limit(limit)
+        self.backend = backend if backend is not None else TokenBucketTable()
+
+    def resolve_request_signature(self, request):
+        """
+        Resolve the bucket key for a request
+
+        Args:
+            request: The HTTP request object
+
+        Returns:
+            Bucket key unique to this limiter and client
+        """
+        user = getattr(request, 'user', None)
+        identifier = getattr(user, 'id', None) or getattr(request, 'remote_addr', None) or 'unknown'
+        return f"{self.limiter_name}|{identifier}"
+
+    def handle(self, request, next_handler: Callable):
+        """
+        Handle the incoming request
+
+        Args:
+            request: The HTTP request object
+            next_handler: The next middleware/handler in the pipeline
+
+        Returns:
+            HTTP response, or a 429 response when the limit is exceeded
+        """
+        attempt = self.backend.attempt(
+            self.resolve_request_signature(request), self.capacity, self.refill_rate
+        )
+
+        if not attempt.allowed:
+            return self.build_exception_response(attempt)
+
+        response = next_handler(request)
+
+        # Add rate limit headers to the response
+        if hasattr(response, 'headers'):
+            response.headers['X-RateLimit-Limit'] = str(attempt.limit)
+            response.headers['X-RateLimit-Remaining'] = str(attempt.remaining)
+
+        return response
+
+    def build_exception_response(self, attempt):
+        """
+        Build the response for a request over the limit
+
+        Args:
+            attempt: The rejected limiter attempt
+
+        Returns:
+            429 Too Many Requests response
+        """
+        from flask import jsonify
+
+        retry_after = max(1, int(attempt.retry_after + 0.999))
+        response = jsonify({'message': 'Too Many Attempts.'})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        response.headers['X-RateLimit-Limit'] = str(attempt.limit)
+        response.headers['X-RateLimit-Remaining'] = '0'
+        return response
@@ -0,0 +1,59 @@
+"""
+Tracing Middleware
+
+Opens the tracing context of each request and reports its timing.
+"""
+
+from larapy.http.middleware.middleware import Middleware
+from typing import Callable
+
+from app.Support.Tracing import current_trace, end_trace, start_trace, trace_body
+
+
+class TracingMiddleware(Middleware):
+    """
+    Tracing Middleware
+
+    Replaces the former request ID and timing middleware with one hop:
+    honors incoming X-Request-ID and traceparent headers, exposes the
+    trace through app.Support.Tracing.current_trace, and adds X-Request-ID,
+    X-Processing-Time-Ms and a Server-Timing breakdown (middleware,
+    controller, db, render) to the response.
+
+    Streamed bodies render after the headers are sent, so their timing
+    headers stop at the first chunk; the body is timed with trace_body()
+    and the full breakdown is logged when it completes.
+    """
+
+    def handle(self, request, next_handler: Callable):
+        """
+        Handle the incoming request
+
+        Args:
+            request: The HTTP request object
+            next_handler: The next middleware/handler in the pipeline
+
+        Returns:
+            HTTP response with tracing headers
+        """
+        # Already traced (e.g. both 'request_id' and 'timing' aliases applied)
+        if current_trace.get() is not None:
+            return next_handler(request)
+
+        trace, token = start_trace(request.headers.get('X-Request-ID'), request.headers.get('traceparent'))
+        try:
+            response = next_handler(request)
+        finally:
+            end_trace(token)
+
+        total_ns = trace.elapsed_ns()
+        if hasattr(response, 'headers'):
+            response.headers['X-Request-ID'] = trace.request_id
+            response.headers['X-Powered-By'] = 'Larapy Framework'
+            response.headers['Server-Timing'] = trace.server_timing(total_ns)
+            response.headers['X-Response-Time'] = f"{total_ns / 1e9:.4f}s"
+            response.headers['X-Processing-Time-Ms'] = f"{total_ns / 1e6:.2f}"
+            if getattr(response, 'is_streamed', False):
+                response.response = trace_body(response.response, trace)
+
+        return response
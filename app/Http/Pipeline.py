@@ -0,0 +1,171 @@
+"""
+Middleware Pipeline
+
+Compiles middleware group combinations into flat, precomputed callable chains.
+Chains are compiled once per group tuple and bound to a route at registration
+time, so no middleware lists or closures are rebuilt while serving requests.
+"""
+
+import functools
+from typing import Callable, Iterable, Optional, Tuple
+
+from app.Http.Async import ensure_sync, ensure_sync_handle
+
+
+def _default_request_resolver():
+    """Resolve the current Flask request object"""
+    from flask import request
+    return request._get_current_object()
+
+
+class _PipelineCursor:
+    """
+    Walks a compiled chain for a single request
+
+    Passed to each middleware as its ``next_handler``; every call advances to
+    the next handler instead of invoking a pre-nested closure.
+    """
+
+    __slots__ = ('handlers', 'index', 'terminal')
+
+    def __init__(self, handlers, terminal):
+        self.handlers = handlers
+        self.index = 0
+        self.terminal = terminal
+
+    def __call__(self, request):
+        index = self.index
+        if index == len(self.handlers):
+            return self.terminal(request)
+        self.index = index + 1
+        return self.handlers[index](request, self)
+
+
+class CompiledPipeline:
+    """
+    A flattened middleware chain for one group combination
+    """
+
+    __slots__ = ('groups', 'middleware', 'handlers', 'decorators')
+
+    def __init__(self, groups: Tuple[str, ...], middleware: Tuple):
+        self.groups = groups
+        self.middleware = middleware
+
+        # Middleware exposing handle(request, next_handler) run from the flat
+        # chain; anything else is only usable as a decorator and is applied
+        # once when a route is bound. Async handle methods are adapted here.
+        self.handlers = tuple(
+            ensure_sync_handle(m.handle) for m in middleware if callable(getattr(m, 'handle', None))
+        )
+        self.decorators = tuple(m for m in middleware if not callable(getattr(m, 'handle', None)))
+
+    def then(self, route_func: Callable, request_resolver: Callable = _default_request_resolver) -> Callable:
+        """
+        Bind the compiled chain to a route function
+
+        Args:
+            route_func: Route function (sync or async) to dispatch to at the
+                end of the chain
+            request_resolver: Callable returning the current request object
+
+        Returns:
+            Route callable running the whole chain
+        """
+        handlers = self.handlers
+        route_func = ensure_sync(route_func)
+
+        if handlers:
+            @functools.wraps(route_func)
+            def dispatch(*args, **kwargs):
+                cursor = _PipelineCursor(handlers, lambda request: route_func(*args, **kwargs))
+                return cursor(request_resolver())
+        else:
+            dispatch = route_func
+
+        for decorator in reversed(self.decorators):
+            dispatch = decorator(dispatch)
+
+        if dispatch is not route_func:
+            dispatch.middleware_groups = self.groups
+        return dispatch
+
+    def describe(self) -> list:
+        """
+        Describe the chain in execution order
+
+        Returns:
+            List of middleware class names
+        """
+        return [type(m).__name__ for m in self.middleware]
+
+
+class PipelineCompiler:
+    """
+    Compiles and caches middleware pipelines keyed by frozen group tuples
+    """
+
+    def __init__(self, resolve_group: Callable[[str], Iterable]):
+        """
+        Args:
+            resolve_group: Callable returning the middleware for a group name
+        """
+        self.resolve_group = resolve_group
+        self._pipelines = {}
+        self._routes = {}
+
+    def compile(self, groups: Iterable[str]) -> CompiledPipeline:
+        """
+        Get the compiled pipeline for a group combination
+
+        Args:
+            groups: Middleware group names, in application order
+
+        Returns:
+            CompiledPipeline shared by every route using the same groups
+        """
+        groups = tuple(groups)
+        pipeline = self._pipelines.get(groups)
+        if pipeline is None:
+            middleware = []
+            for group in groups:
+                middleware.extend(self.resolve_group(group))
+            pipeline = self._pipelines[groups] = CompiledPipeline(groups, tuple(middleware))
+        return pipeline
+
+    def bind(self, route_func: Callable, groups: Iterable[str], endpoint: Optional[str] = None) -> Callable:
+        """
+        Compile the pipeline for a route and bind it to the route function
+
+        Args:
+            route_func: Route function to wrap
+            groups: Middleware group names
+            endpoint: Endpoint name recorded for dumping (defaults to the
+                function's qualified name)
+
+        Returns:
+            Route callable running the compiled chain
+        """
+        pipeline = self.compile(groups)
+        endpoint = endpoint or getattr(route_func, '__qualname__', repr(route_func))
+        self._routes[endpoint] = pipeline
+        return pipeline.then(route_func)
+
+    def pipeline_for(self, endpoint: str) -> Optional[CompiledPipeline]:
+        """Get the compiled pipeline bound to an endpoint"""
+        return self._routes.get(endpoint)
+
+    def dump(self) -> dict:
+        """
+        Dump the compiled chain per endpoint
+
+        Returns:
+            Dictionary mapping endpoint names to their groups and middleware
+        """
+        return {
+            endpoint: {
+                'groups': list(pipeline.groups),
+                'middleware': pipeline.describe(),
+            }
+            for endpoint, pipeline in sorted(self._routes.items())
+        }
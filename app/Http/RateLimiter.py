@@ -0,0 +1,374 @@
+"""
+Rate Limiter Backends
+
+Token-bucket backends for the ThrottleRequests middleware.
+
+Two tables are provided:
+
+- ``TokenBucketTable`` keeps buckets in sharded in-process dictionaries.
+- ``SharedTokenBucketTable`` keeps buckets in an mmap-backed file so every
+  worker process on a host draws from the same budget without a network
+  round-trip.
+
+Both cost O(1) per attempt and periodically sweep buckets that have refilled
+completely, since a full bucket is indistinguishable from a missing one.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+# Result of a single limiter attempt
+Attempt = namedtuple('Attempt', ['allowed', 'remaining', 'retry_after', 'limit'])
+
+
+def parse_rate_limit(limit):
+    """
+    Parse a Laravel-style rate limit string
+
+    Args:
+        limit: String in the form 'max_attempts,decay_minutes' (e.g. '60,1')
+
+    Returns:
+        Tuple of (capacity, refill rate in tokens per second)
+    """
+    max_attempts, _, decay_minutes = str(limit).partition(',')
+    capacity = int(max_attempts)
+    decay_seconds = float(decay_minutes or 1) * 60
+
+    if capacity <= 0 or decay_seconds <= 0:
+        raise ValueError(f"Invalid rate limit: {limit!r}")
+
+    return capacity, capacity / decay_seconds
+
+
+def _consume(tokens, last, now, capacity, rate, cost):
+    """
+    Refill a bucket and try to take tokens from it
+
+    Returns:
+        Tuple of (allowed, tokens, full_at, retry_after)
+    """
+    if last > now:
+        # Clock went backwards (e.g. a shared segment surviving a reboot)
+        tokens = capacity
+    else:
+        tokens = min(capacity, tokens + (now - last) * rate)
+
+    allowed = tokens >= cost
+    if allowed:
+        tokens -= cost
+        retry_after = 0.0
+    else:
+        retry_after = (cost - tokens) / rate
+
+    full_at = now + (capacity - tokens) / rate
+    return allowed, tokens, full_at, retry_after
+
+
+class TokenBucketTable:
+    """
+    In-process token-bucket table
+
+    Buckets are spread over independently locked shards so concurrent
+    threads rarely contend on the same lock.
+    """
+
+    def __init__(self, shards=64, sweep_interval=60.0, clock=time.monotonic):
+        """
+        Args:
+            shards: Number of independently locked shards
+            sweep_interval: Seconds between sweeps of a shard's idle buckets
+            clock: Monotonic clock returning seconds
+        """
+        self.clock = clock
+        self.sweep_interval = sweep_interval
+        self._shards = [(threading.Lock(), {}, [clock()]) for _ in range(shards)]
+
+    def attempt(self, key, capacity, rate, cost=1):
+        """
+        Attempt to take tokens from a bucket
+
+        Args:
+            key: Bucket key (limiter name plus request signature)
+            capacity: Maximum number of tokens in the bucket
+            rate: Refill rate in tokens per second
+            cost: Tokens consumed by this attempt
+
+        Returns:
+            Attempt result
+        """
+        lock, buckets, last_sweep = self._shards[hash(key) % len(self._shards)]
+        now = self.clock()
+
+        with lock:
+            if now - last_sweep[0] >= self.sweep_interval:
+                self._sweep(buckets, now)
+                last_sweep[0] = now
+
+            bucket = buckets.get(key)
+            if bucket is None:
+                tokens, last = capacity, now
+            else:
+                tokens, last = bucket[0], bucket[1]
+
+            allowed, tokens, full_at, retry_after = _consume(tokens, last, now, capacity, rate, cost)
+            buckets[key] = (tokens, now, full_at)
+
+        return Attempt(allowed, int(tokens), retry_after, capacity)
+
+    def sweep(self):
+        """Remove every bucket that has refilled completely"""
+        now = self.clock()
+        for lock, buckets, last_sweep in self._shards:
+            with lock:
+                self._sweep(buckets, now)
+                last_sweep[0] = now
+
+    def _sweep(self, buckets, now):
+        """Remove full buckets from a shard (caller holds the shard lock)"""
+        idle = [key for key, bucket in buckets.items() if bucket[2] <= now]
+        for key in idle:
+            del buckets[key]
+
+    def __len__(self):
+        return sum(len(buckets) for _, buckets, _ in self._shards)
+
+
+class SharedTokenBucketTable:
+    """
+    Token-bucket table in a shared memory-mapped file
+
+    The file is split into shards of fixed-size slots. Each slot stores a
+    64-bit key hash, the token count, the last refill time and the time the
+    bucket will be full again. Shards are guarded by a thread lock plus an
+    fcntl byte-range lock, so threads and processes only contend when they
+    hit the same shard.
+
+    The layout (version, slots, shards) is part of the file name, so
+    workers configured differently use separate files. A mapped file is
+    never truncated: that would SIGBUS every other process mapping it.
+    """
+
+    MAGIC = b'LPTB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sIII')
+    SLOT = struct.Struct('<Qddd')
+
+    # Reserved key hashes: never-used slot and swept slot
+    EMPTY = 0
+    TOMBSTONE = 1
+
+    def __init__(self, path, slots=65536, shards=64, sweep_interval=60.0, clock=time.monotonic):
+        """
+        Args:
+            path: Path of the shared segment file
+            slots: Total number of bucket slots
+            shards: Number of independently locked shards
+            sweep_interval: Seconds between sweeps of a shard's idle buckets
+            clock: System-wide monotonic clock returning seconds
+        """
+        if fcntl is None:
+            raise RuntimeError("The shared rate limiter requires fcntl (POSIX only)")
+
+        self.path = Path(path)
+        self.shards = shards
+        self.shard_size = max(1, slots // shards)
+        self.slots = self.shard_size * shards
+        self.segment_path = self.path.with_name(
+            f"{self.path.stem}.v{self.VERSION}-{self.slots}x{self.shards}{self.path.suffix}"
+        )
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._last_sweep = [clock()] * shards
+        self._open()
+
+    def _open(self):
+        """Open (and if needed initialise) the shared segment"""
+        self.segment_path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.HEADER.size + self.slots * self.SLOT.size
+        expected = self.HEADER.pack(self.MAGIC, self.VERSION, self.slots, self.shards)
+
+        while True:
+            fd = os.open(str(self.segment_path), os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_ino == os.stat(self.segment_path).st_ino:
+                break
+            # Replaced by another process while waiting for the lock
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        try:
+            current = os.fstat(fd).st_size
+            if current == 0:
+                # New file, not mapped by anyone yet
+                os.ftruncate(fd, size)
+                os.pwrite(fd, expected, 0)
+            elif current != size or os.pread(fd, self.HEADER.size, 0) != expected:
+                # Damaged file: build a fresh one beside it and swap it in,
+                # leaving processes that mapped the old one unharmed
+                fd = self._replace(fd, expected, size)
+        finally:
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, size)
+
+    def _replace(self, fd, header, size):
+        """Atomically replace the segment with an empty one, returning its descriptor"""
+        temporary = self.segment_path.with_name(f"{self.segment_path.name}.{os.getpid()}.tmp")
+        replacement = os.open(str(temporary), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.ftruncate(replacement, size)
+        os.pwrite(replacement, header, 0)
+        fcntl.lockf(replacement, fcntl.LOCK_EX)
+        os.replace(temporary, self.segment_path)
+        fcntl.lockf(fd, fcntl.LOCK_UN)
+        os.close(fd)
+        return replacement
+
+    def _offset(self, slot):
+        return self.HEADER.size + slot * self.SLOT.size
+
+    def _lock_shard(self, shard):
+        start = self._offset(shard * self.shard_size)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.shard_size * self.SLOT.size, start)
+
+    def _unlock_shard(self, shard):
+        start = self._offset(shard * self.shard_size)
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, self.shard_size * self.SLOT.size, start)
+
+    @classmethod
+    def _hash(cls, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        key_hash = int.from_bytes(digest, 'little')
+        return key_hash if key_hash > cls.TOMBSTONE else key_hash + 2
+
+    def attempt(self, key, capacity, rate, cost=1):
+        """
+        Attempt to take tokens from a bucket
+
+        Args:
+            key: Bucket key (limiter name plus request signature)
+            capacity: Maximum number of tokens in the bucket
+            rate: Refill rate in tokens per second
+            cost: Tokens consumed by this attempt
+
+        Returns:
+            Attempt result
+        """
+        key_hash = self._hash(key)
+        shard = key_hash % self.shards
+        first = shard * self.shard_size
+        start = (key_hash // self.shards) % self.shard_size
+        now = self.clock()
+
+        with self._locks[shard]:
+            self._lock_shard(shard)
+            try:
+                if now - self._last_sweep[shard] >= self.sweep_interval:
+                    self._sweep_shard(shard, now)
+                    self._last_sweep[shard] = now
+
+                slot = self._find_slot(first, start, key_hash, now)
+                offset = self._offset(slot)
+                stored_hash, tokens, last, _ = self.SLOT.unpack_from(self._map, offset)
+                if stored_hash != key_hash:
+                    tokens, last = capacity, now
+
+                allowed, tokens, full_at, retry_after = _consume(tokens, last, now, capacity, rate, cost)
+                self.SLOT.pack_into(self._map, offset, key_hash, tokens, now, full_at)
+            finally:
+                self._unlock_shard(shard)
+
+        return Attempt(allowed, int(tokens), retry_after, capacity)
+
+    def _find_slot(self, first, start, key_hash, now):
+        """
+        Find the slot for a key within its shard by linear probing
+
+        Returns the key's slot, else the first reusable slot. A full shard
+        evicts the bucket closest to being full, which loses the least state.
+        """
+        reusable = None
+        evict, evict_full_at = None, None
+
+        for probe in range(self.shard_size):
+            slot = first + (start + probe) % self.shard_size
+            stored_hash, _, _, full_at = self.SLOT.unpack_from(self._map, self._offset(slot))
+
+            if stored_hash == key_hash:
+                return slot
+            if stored_hash == self.EMPTY:
+                # Keys are never stored past an empty slot
+                return slot if reusable is None else reusable
+            if reusable is None and full_at <= now:
+                reusable = slot
+            if evict is None or full_at < evict_full_at:
+                evict, evict_full_at = slot, full_at
+
+        return reusable if reusable is not None else evict
+
+    def _sweep_shard(self, shard, now):
+        """Clear every full bucket in a shard (caller holds the shard locks)"""
+        first = shard * self.shard_size
+        for slot in range(first, first + self.shard_size):
+            offset = self._offset(slot)
+            stored_hash, _, _, full_at = self.SLOT.unpack_from(self._map, offset)
+            if stored_hash > self.TOMBSTONE and full_at <= now:
+                # Leave a tombstone so probing continues past this slot
+                self.SLOT.pack_into(self._map, offset, self.TOMBSTONE, 0.0, 0.0, 0.0)
+
+    def sweep(self):
+        """Clear every full bucket in the table"""
+        now = self.clock()
+        for shard in range(self.shards):
+            with self._locks[shard]:
+                self._lock_shard(shard)
+                try:
+                    self._sweep_shard(shard, now)
+                    self._last_sweep[shard] = now
+                finally:
+                    self._unlock_shard(shard)
+
+    def close(self):
+        """Release the mapping and file descriptor"""
+        self._map.close()
+        os.close(self._fd)
+
+
+def create_rate_limiter(config):
+    """
+    Create the token-bucket table configured for the application
+
+    Args:
+        config: The 'rate_limiting_backend' security configuration
+
+    Returns:
+        TokenBucketTable or SharedTokenBucketTable instance
+    """
+    driver = config.get('driver', 'memory')
+    shards = config.get('shards', 64)
+    sweep_interval = config.get('sweep_interval', 60.0)
+
+    if driver == 'shared' and fcntl is not None:
+        return SharedTokenBucketTable(
+            config['path'],
+            slots=config.get('slots', 65536),
+            shards=shards,
+            sweep_interval=sweep_interval,
+        )
+
+    return TokenBucketTable(shards=shards, sweep_interval=sweep_interval)
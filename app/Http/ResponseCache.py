@@ -0,0 +1,328 @@
+"""
+Response Cache
+
+Full-page cache for anonymous GET/HEAD requests. Entries are keyed by
+path, query string and the configured vary headers/cookies, and tagged
+with surrogate keys so a model save can purge exactly the pages showing
+it::
+
+    purge_surrogate_keys('users')
+
+Every page also carries a ``path:<path>`` key covering all of its query
+string and vary variants. Entries outlive their TTL by the
+stale-while-revalidate window, during which they are served while one
+request per worker refreshes them in the background. The refresh is a
+fresh internal request through the WSGI app (see revalidate()), never a
+replay of the finished request's context.
+"""
+
+import fnmatch
+import hashlib
+import io
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# Headers never replayed from the cache
+STRIP_HEADERS = frozenset(['set-cookie', 'date', 'age', 'content-length', 'x-cache'])
+
+# Cache-Control directives that forbid storing a shared copy
+PRIVATE_DIRECTIVES = ('private', 'no-store', 'no-cache')
+
+# Environ key marking an internal revalidation request; clients cannot set
+# non-HTTP_ keys, so it cannot be spoofed
+REVALIDATE_ENVIRON_KEY = 'larapy.response_cache.revalidate'
+
+# Per-request objects the server or framework stored in the environ
+_REQUEST_ENVIRON_KEYS = ('werkzeug.request', 'werkzeug.socket', 'wsgi.input', 'wsgi.file_wrapper')
+
+
+class ResponseCache:
+    """
+    Response Cache
+
+    Decides what may be cached and stores entries in a cache Repository.
+    Framework objects stay in the middleware; this class only sees
+    methods, paths, header/cookie mappings and bytes.
+    """
+
+    def __init__(self, repository, ttl=60, stale_while_revalidate=0, paths=None, except_paths=(),
+                 vary_headers=(), vary_cookies=(), bypass_cookies=(), enabled=True, clock=time.time):
+        """
+        Args:
+            repository: Cache Repository entries are stored in
+            ttl: Seconds an entry is fresh
+            stale_while_revalidate: Seconds a stale entry may still be served while refreshed
+            paths: Mapping of path pattern (fnmatch) to its surrogate keys
+            except_paths: Path patterns never cached
+            vary_headers: Request headers that select a separate entry
+            vary_cookies: Request cookies that select a separate entry
+            bypass_cookies: Cookies marking a request as not anonymous
+            enabled: Cache switch
+            clock: Wall-clock source (entries may be shared across workers)
+        """
+        self.repository = repository
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.paths = dict(paths or {})
+        self.except_paths = tuple(except_paths)
+        self.vary_headers = tuple(vary_headers)
+        self.vary_cookies = tuple(vary_cookies)
+        self.bypass_cookies = tuple(bypass_cookies)
+        self.enabled = enabled
+        self.clock = clock
+        self._revalidating = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Create the cache from the 'responses' entry of config/cache.py
+
+        Args:
+            config: Response cache configuration
+        """
+        from app.Support.Cache import cache
+
+        return cls(
+            cache(config.get('store')),
+            ttl=config.get('ttl', 60),
+            stale_while_revalidate=config.get('stale_while_revalidate', 0),
+            paths=config.get('paths'),
+            except_paths=config.get('except', ()),
+            vary_headers=config.get('vary_headers', ()),
+            vary_cookies=config.get('vary_cookies', ()),
+            bypass_cookies=config.get('bypass_cookies', ()),
+            enabled=config.get('enabled', False),
+        )
+
+    def match(self, path):
+        """Get the surrogate keys configured for a path, or None if it is not cached"""
+        if any(fnmatch.fnmatchcase(path, pattern) for pattern in self.except_paths):
+            return None
+        for pattern, keys in self.paths.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return list(keys)
+        return None
+
+    def cacheable_request(self, method, path, headers, cookies):
+        """
+        Determine whether a request may be answered from the cache
+
+        Args:
+            method: HTTP method
+            path: Request path
+            headers: Request headers (mapping)
+            cookies: Request cookies (mapping)
+        """
+        if not self.enabled or method not in ('GET', 'HEAD'):
+            return False
+        if headers.get('Authorization') or any(name in cookies for name in self.bypass_cookies):
+            return False
+        if 'no-cache' in headers.get('Cache-Control', '') or 'no-cache' in headers.get('Pragma', ''):
+            return False
+        return self.match(path) is not None
+
+    @staticmethod
+    def cacheable_response(status, headers):
+        """
+        Determine whether a response may be stored
+
+        Args:
+            status: Status code
+            headers: Response headers as (name, value) pairs
+        """
+        if status != 200:
+            return False
+        for name, value in headers:
+            name = name.lower()
+            if name == 'set-cookie':
+                return False
+            if name == 'cache-control' and any(directive in value.lower() for directive in PRIVATE_DIRECTIVES):
+                return False
+            if name == 'vary' and value.strip() == '*':
+                return False
+        return True
+
+    def key(self, path, query_string, headers, cookies):
+        """
+        Build the cache key of a request
+
+        Args:
+            path: Request path
+            query_string: Raw query string (bytes or str)
+            headers: Request headers (mapping)
+            cookies: Request cookies (mapping)
+        """
+        if isinstance(query_string, bytes):
+            query_string = query_string.decode('latin-1')
+        query = '&'.join(sorted(part for part in query_string.split('&') if part))
+        parts = [path, query]
+        parts += [f"{name.lower()}={headers.get(name, '')}" for name in self.vary_headers]
+        parts += [f"cookie:{name}={cookies.get(name, '')}" for name in self.vary_cookies]
+        digest = hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+        return f"response:{digest}"
+
+    def surrogate_keys(self, path, extra=()):
+        """
+        Get the surrogate keys of a page
+
+        Args:
+            path: Request path
+            extra: Keys sent by the controller in a Surrogate-Key header
+        """
+        keys = [f"path:{path}"]
+        for key in list(self.match(path) or ()) + list(extra):
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def _versions(self, keys):
+        tagged = self.repository.tags(*keys)
+        return {name: tagged.tag_version(name) for name in tagged.names}
+
+    def lookup(self, key):
+        """
+        Look up a cached response
+
+        Returns:
+            (entry, state) where state is 'hit', 'stale' or None on a miss
+        """
+        entry = self.repository.get(key)
+        if entry is None:
+            return None, None
+        if self._versions(entry['keys']) != entry['versions']:
+            # A surrogate key was purged since the entry was stored
+            self.repository.forget(key)
+            return None, None
+        age = self.clock() - entry['created']
+        if age < entry['ttl']:
+            return entry, 'hit'
+        if age < entry['ttl'] + self.stale_while_revalidate:
+            return entry, 'stale'
+        return None, None
+
+    def store(self, key, status, headers, body, keys):
+        """
+        Store a response
+
+        Args:
+            key: Cache key from key()
+            status: Status code
+            headers: Response headers as (name, value) pairs
+            body: Response body (bytes)
+            keys: Surrogate keys from surrogate_keys()
+
+        Returns:
+            The stored entry
+        """
+        entry = {
+            'status': status,
+            'headers': [(name, value) for name, value in headers if name.lower() not in STRIP_HEADERS],
+            'body': body,
+            'keys': list(keys),
+            'versions': self._versions(keys),
+            'created': self.clock(),
+            'ttl': self.ttl,
+        }
+        self.repository.put(key, entry, self.ttl + self.stale_while_revalidate)
+        return entry
+
+    def age(self, entry):
+        """Get the age of an entry in whole seconds"""
+        return max(0, int(self.clock() - entry['created']))
+
+    def begin_revalidation(self, key):
+        """Claim the refresh of a stale entry; False if this worker is already refreshing it"""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def end_revalidation(self, key):
+        """Release a claim taken with begin_revalidation()"""
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def purge(self, *keys):
+        """Invalidate every page tagged with one of the surrogate keys"""
+        if keys:
+            self.repository.tags(*keys).flush()
+
+
+def revalidation_environ(environ):
+    """
+    Copy a request's WSGI environ for an internal revalidation request
+
+    The copy has an empty body and no per-request objects, so the app
+    handles it as a new request with its own context and session.
+    """
+    copied = {name: value for name, value in environ.items() if name not in _REQUEST_ENVIRON_KEYS}
+    copied['wsgi.input'] = io.BytesIO()
+    copied['CONTENT_LENGTH'] = '0'
+    copied[REVALIDATE_ENVIRON_KEY] = True
+    return copied
+
+
+def revalidate(wsgi_app, environ, on_complete=None):
+    """
+    Re-render a page in a background thread with an internal WSGI request
+
+    The response cache middleware sees REVALIDATE_ENVIRON_KEY, skips the
+    lookup and stores the freshly rendered page.
+
+    Args:
+        wsgi_app: WSGI callable (e.g. flask_app.wsgi_app)
+        environ: Environ of the request that found the stale entry
+        on_complete: Called once the refresh finished or failed
+
+    Returns:
+        The started thread
+    """
+    environ = revalidation_environ(environ)
+
+    def refresh():
+        body = None
+        try:
+            body = wsgi_app(environ, lambda status, headers, exc_info=None: (lambda data: None))
+            # Drain the body so streamed pages are recorded and stored
+            for _ in body:
+                pass
+        except Exception:
+            logger.exception("Response cache revalidation failed for %s", environ.get('PATH_INFO'))
+        finally:
+            close = getattr(body, 'close', None)
+            if close is not None:
+                close()
+            if on_complete is not None:
+                on_complete()
+
+    thread = threading.Thread(target=refresh, name='response-cache-revalidate', daemon=True)
+    thread.start()
+    return thread
+
+
+_response_cache = None
+_lock = threading.Lock()
+
+
+def response_cache():
+    """Get the response cache configured in config/cache.py, shared by the process"""
+    global _response_cache
+    if _response_cache is None:
+        from config.cache import get_cache_config
+
+        with _lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache.from_config(get_cache_config()['responses'])
+    return _response_cache
+
+
+def purge_surrogate_keys(*keys):
+    """Purge cached pages tagged with any of the surrogate keys"""
+    response_cache().purge(*keys)
@@ -0,0 +1,214 @@
+"""
+Route Cache
+
+Serializes the application's route table to a manifest so boot can
+register routes without executing the route files or importing
+controllers up front.
+
+Handlers are stored as references: ``module:Class@method`` for controller
+methods and ``module:function`` for plain functions. Closures and lambdas
+cannot be cached and must be moved to a controller.
+"""
+
+import importlib
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from app.Http.Async import ensure_sync
+
+
+MANIFEST_VERSION = 1
+
+# A route as registered through app.Http.Router, with its middleware groups
+RouteDefinition = namedtuple('RouteDefinition', 'verb methods path handler args kwargs groups')
+
+
+class UncacheableRoute(ValueError):
+    """Raised when a route cannot be written to the manifest"""
+
+
+def handler_reference(handler):
+    """
+    Get the importable reference of a route handler
+
+    Args:
+        handler: Bound controller method or module-level function
+
+    Returns:
+        Reference string
+
+    Raises:
+        UncacheableRoute: For closures, lambdas and other local callables
+    """
+    reference = getattr(handler, 'route_reference', None)
+    if reference is not None:
+        return reference
+
+    owner = getattr(handler, '__self__', None)
+    function = getattr(handler, '__func__', handler)
+
+    if owner is not None and not isinstance(owner, type):
+        owner_class = type(owner)
+        if '<locals>' not in owner_class.__qualname__:
+            return f"{owner_class.__module__}:{owner_class.__qualname__}@{function.__name__}"
+    elif '<' not in getattr(function, '__qualname__', '<'):
+        return f"{function.__module__}:{function.__qualname__}"
+
+    raise UncacheableRoute(f"Unable to cache route handler {handler!r}; move it to a controller")
+
+
+def resolve_handler(reference, instances):
+    """
+    Import the handler behind a reference
+
+    Args:
+        reference: Reference produced by handler_reference()
+        instances: Controller instances shared between routes, by class reference
+
+    Returns:
+        The handler callable
+    """
+    module_name, _, target = reference.partition(':')
+    module = importlib.import_module(module_name)
+
+    class_path, separator, method = target.partition('@')
+    attribute = module
+    for part in class_path.split('.'):
+        attribute = getattr(attribute, part)
+    if not separator:
+        return attribute
+
+    class_reference = f"{module_name}:{class_path}"
+    controller = instances.get(class_reference)
+    if controller is None:
+        controller = instances[class_reference] = attribute()
+    return getattr(controller, method)
+
+
+def lazy_handler(reference, instances):
+    """
+    Create a route handler that imports its target on first call
+
+    The returned function carries the target's name, so endpoints derived
+    from the handler are the same as when the route files are executed.
+
+    Args:
+        reference: Handler reference
+        instances: Controller instances shared between routes
+    """
+    resolved = []
+
+    def handler(*args, **kwargs):
+        if not resolved:
+            resolved.append(ensure_sync(resolve_handler(reference, instances)))
+        return resolved[0](*args, **kwargs)
+
+    module_name, _, target = reference.partition(':')
+    class_path, separator, method = target.partition('@')
+    handler.__module__ = module_name
+    handler.__name__ = method if separator else class_path.rsplit('.', 1)[-1]
+    handler.__qualname__ = f"{class_path}.{method}" if separator else class_path
+    handler.route_reference = reference
+    return handler
+
+
+def describe_converters(rule):
+    """
+    Describe the compiled converters of a Werkzeug rule
+
+    Returns:
+        Mapping of argument name to converter class, regex and weight
+    """
+    return {
+        name: {
+            'converter': type(converter).__name__,
+            'regex': converter.regex,
+            'weight': converter.weight,
+        }
+        for name, converter in getattr(rule, '_converters', {}).items()
+    }
+
+
+def build_manifest(definitions, url_map=None, pipelines=None):
+    """
+    Build the route manifest
+
+    Args:
+        definitions: RouteDefinition records, in registration order
+        url_map: Werkzeug map used to look up endpoints and converters
+        pipelines: Compiled middleware per endpoint (HttpKernel.dump_pipelines());
+            routes missing from it keep the groups they were registered with
+
+    Returns:
+        JSON-serializable manifest
+
+    Raises:
+        UncacheableRoute: If a handler or its options cannot be serialized
+    """
+    rules = {}
+    if url_map is not None:
+        for rule in url_map.iter_rules():
+            rules.setdefault(rule.rule, []).append(rule)
+    pipelines = pipelines or {}
+
+    routes = []
+    for definition in definitions:
+        reference = handler_reference(definition.handler)
+
+        rule = None
+        for candidate in rules.get(definition.path, []):
+            if definition.methods is None or set(definition.methods) <= (candidate.methods or set()):
+                rule = candidate
+                break
+        endpoint = rule.endpoint if rule is not None else None
+
+        entry = {
+            'verb': definition.verb,
+            'methods': list(definition.methods) if definition.methods else None,
+            'path': definition.path,
+            'handler': reference,
+            'endpoint': endpoint,
+            'middleware': pipelines.get(endpoint) or {'groups': list(definition.groups), 'middleware': []},
+            'converters': describe_converters(rule) if rule is not None else {},
+            'args': list(definition.args),
+            'kwargs': dict(definition.kwargs),
+        }
+        try:
+            json.dumps(entry)
+        except TypeError as error:
+            raise UncacheableRoute(f"Unable to cache route {definition.path}: {error}") from error
+        routes.append(entry)
+
+    return {'version': MANIFEST_VERSION, 'routes': routes}
+
+
+def write_manifest(path, manifest):
+    """Write the manifest atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def load_manifest(path):
+    """Read the manifest, or None when absent, unreadable or outdated"""
+    try:
+        with open(path, 'r', encoding='utf-8') as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def clear_manifest(path):
+    """Delete the manifest"""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
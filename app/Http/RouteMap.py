@@ -0,0 +1,143 @@
+"""
+Compiled Route Map
+
+Werkzeug URL map whose adapters match through a precompiled RouteTable
+before falling back to Werkzeug's own matcher.
+"""
+
+import threading
+
+from werkzeug.routing import Map, MapAdapter
+
+from app.Http.RouteTable import RouteTable, UnsupportedRoute
+
+
+class CompiledRouteMap(Map):
+    """
+    Compiled Route Map
+
+    Rules are added and built (``url_for``) exactly as with a plain Map.
+    Matching successful requests goes through a RouteTable compiled from
+    the rules on first use; misses, redirects (including rules whose
+    endpoint has defaults) and 405s are left to Werkzeug.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._route_table = None
+        self._route_table_lock = threading.Lock()
+
+    @classmethod
+    def from_map(cls, url_map):
+        """
+        Create a compiled map with the settings and rules of an existing map
+
+        Args:
+            url_map: Werkzeug Map, typically ``flask_app.url_map``
+        """
+        compiled = cls(
+            default_subdomain=url_map.default_subdomain,
+            strict_slashes=url_map.strict_slashes,
+            merge_slashes=url_map.merge_slashes,
+            redirect_defaults=url_map.redirect_defaults,
+            converters=url_map.converters,
+            sort_parameters=url_map.sort_parameters,
+            sort_key=url_map.sort_key,
+            host_matching=url_map.host_matching,
+        )
+        for rule in url_map.iter_rules():
+            compiled.add(rule.empty())
+        return compiled
+
+    def add(self, rulefactory):
+        super().add(rulefactory)
+        self._route_table = None
+
+    def route_table(self):
+        """
+        Get the compiled route table, compiling it on first use
+
+        Returns:
+            RouteTable, or None when the map uses host matching
+        """
+        table = self._route_table
+        if table is None and not self.host_matching:
+            with self._route_table_lock:
+                table = self._route_table
+                if table is None:
+                    table = self._route_table = self._compile_route_table()
+        return table
+
+    def _compile_route_table(self):
+        table = RouteTable()
+        dynamic = RouteTable()
+        complete = True
+
+        # Endpoints with a rule providing defaults may redirect to it
+        # (redirect_defaults), which only Werkzeug's matcher knows about
+        redirecting = set()
+        if self.redirect_defaults:
+            redirecting = {rule.endpoint for rule in self.iter_rules() if rule.defaults}
+
+        for rule in self.iter_rules():
+            if (rule.redirect_to is not None or rule.build_only or rule.websocket
+                    or rule.subdomain != self.default_subdomain or rule.endpoint in redirecting):
+                continue
+            target = table if '<' not in rule.rule else dynamic
+            try:
+                target.add(rule.rule, rule.methods, rule, rule._converters)
+            except UnsupportedRoute:
+                complete = False
+
+        # If some dynamic rule can only be matched by Werkzeug, its priority
+        # against the tree's rules is unknown, so only static paths are served
+        if complete:
+            table.root = dynamic.root
+        return table
+
+    def bind(self, *args, **kwargs):
+        return CompiledMapAdapter.from_adapter(super().bind(*args, **kwargs))
+
+    def bind_to_environ(self, *args, **kwargs):
+        return CompiledMapAdapter.from_adapter(super().bind_to_environ(*args, **kwargs))
+
+
+class CompiledMapAdapter(MapAdapter):
+    """Map adapter matching through the map's RouteTable first"""
+
+    @classmethod
+    def from_adapter(cls, adapter):
+        if isinstance(adapter, cls):
+            return adapter
+        # Keyword arguments only: the positional signature differs across
+        # Werkzeug versions, and websocket is derived from the URL scheme
+        compiled = cls(
+            map=adapter.map,
+            server_name=adapter.server_name,
+            script_name=adapter.script_name,
+            subdomain=adapter.subdomain,
+            url_scheme=adapter.url_scheme,
+            path_info=adapter.path_info,
+            default_method=adapter.default_method,
+            query_args=adapter.query_args,
+        )
+        compiled.websocket = adapter.websocket
+        return compiled
+
+    def match(self, path_info=None, method=None, return_rule=False, query_args=None, websocket=None):
+        if websocket is None:
+            websocket = self.websocket
+
+        table = self.map.route_table()
+        if table is not None and not websocket and self.subdomain == self.map.default_subdomain:
+            found = table.match(
+                self.path_info if path_info is None else path_info,
+                (method or self.default_method).upper(),
+            )
+            if found is not None:
+                rule, arguments = found
+                if rule.defaults:
+                    arguments = {**rule.defaults, **arguments}
+                return (rule if return_rule else rule.endpoint), arguments
+
+        return super().match(path_info, method, return_rule, query_args, websocket)
@@ -0,0 +1,182 @@
+"""
+Route Table
+
+Precompiled route matcher: a hash map for static paths and a radix tree of
+path segments for parameterized routes, so matching cost depends on the
+depth of the path rather than on the number of registered routes.
+"""
+
+import re
+
+
+# Werkzeug-style placeholder: <name>, <converter:name> or <converter(args):name>
+_PLACEHOLDER = re.compile(
+    r'<(?:(?P<converter>[a-zA-Z_][a-zA-Z0-9_]*)(?:\((?P<args>.*?)\))?:)?(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)>'
+)
+
+
+class UnsupportedRoute(ValueError):
+    """Raised for rules the table cannot represent (e.g. mixed segments)"""
+
+
+def is_part_isolating(converter):
+    """Determine whether a converter matches within a single path segment"""
+    isolating = getattr(converter, 'part_isolating', None)
+    if isolating is None:
+        isolating = '/' not in converter.regex
+    return isolating
+
+
+class _Node:
+    """Radix tree node keyed by path segment"""
+
+    __slots__ = ('static', 'dynamic', 'catch_all', 'leaves')
+
+    def __init__(self):
+        self.static = {}
+        self.dynamic = []
+        self.catch_all = []
+        self.leaves = []
+
+
+class RouteTable:
+    """
+    Route Table
+
+    Maps (path, method) to a route payload and its converted arguments.
+    ``match`` returns None on any miss, leaving not-found, method-not-allowed
+    and redirect handling to the caller.
+    """
+
+    def __init__(self):
+        self.static = {}
+        self.root = _Node()
+        self.size = 0
+
+    def add(self, path, methods, payload, converters=None):
+        """
+        Add a route
+
+        Args:
+            path: Rule path, e.g. '/posts/<int:post_id>'
+            methods: Allowed HTTP methods, or None for any method
+            payload: Value returned when the route matches (e.g. the rule)
+            converters: Mapping of argument name to converter, each exposing
+                ``regex``, ``weight`` and ``to_python``
+
+        Raises:
+            UnsupportedRoute: If the path cannot be represented in the tree
+        """
+        if not path.startswith('/'):
+            raise UnsupportedRoute(f"Route path must start with '/': {path}")
+
+        methods = frozenset(methods) if methods else None
+        self.size += 1
+
+        if '<' not in path:
+            self.static.setdefault(path, []).append((methods, payload))
+            return
+
+        converters = converters or {}
+        segments = path[1:].split('/')
+        node = self.root
+
+        for index, segment in enumerate(segments):
+            placeholder = _PLACEHOLDER.fullmatch(segment)
+            if placeholder is None:
+                if '<' in segment:
+                    raise UnsupportedRoute(f"Mixed static and dynamic segment in {path}")
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            name = placeholder.group('name')
+            converter = converters.get(name)
+            if converter is None:
+                raise UnsupportedRoute(f"No converter for '{name}' in {path}")
+            pattern = re.compile(converter.regex)
+
+            if not is_part_isolating(converter):
+                # Multi-segment converters (path) must end the rule
+                if index != len(segments) - 1:
+                    raise UnsupportedRoute(f"Multi-segment converter before the end of {path}")
+                node.catch_all.append((name, pattern, converter, methods, payload))
+                node.catch_all.sort(key=lambda entry: getattr(entry[2], 'weight', 100))
+                return
+
+            child = None
+            for existing_name, existing_pattern, existing_converter, existing_child in node.dynamic:
+                if existing_name == name and existing_pattern.pattern == pattern.pattern:
+                    child = existing_child
+                    break
+            if child is None:
+                child = _Node()
+                node.dynamic.append((name, pattern, converter, child))
+                node.dynamic.sort(key=lambda entry: getattr(entry[2], 'weight', 100))
+            node = child
+
+        node.leaves.append((methods, payload))
+
+    def match(self, path, method):
+        """
+        Match a request path and method
+
+        Args:
+            path: Decoded request path
+            method: Upper-case HTTP method
+
+        Returns:
+            (payload, arguments) tuple, or None when nothing matches
+        """
+        routes = self.static.get(path)
+        if routes is not None:
+            for methods, payload in routes:
+                if methods is None or method in methods:
+                    return payload, {}
+
+        if not path.startswith('/'):
+            return None
+        return self._walk(self.root, path[1:].split('/'), 0, method, [])
+
+    def _walk(self, node, segments, index, method, captured):
+        if index == len(segments):
+            for methods, payload in node.leaves:
+                if methods is None or method in methods:
+                    return self._convert(payload, captured)
+            return None
+
+        segment = segments[index]
+
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, method, captured)
+            if found is not None:
+                return found
+
+        if segment:
+            for name, pattern, converter, child in node.dynamic:
+                if pattern.fullmatch(segment):
+                    captured.append((name, converter, segment))
+                    found = self._walk(child, segments, index + 1, method, captured)
+                    if found is not None:
+                        return found
+                    captured.pop()
+
+        if node.catch_all:
+            rest = '/'.join(segments[index:])
+            for name, pattern, converter, methods, payload in node.catch_all:
+                if rest and pattern.fullmatch(rest) and (methods is None or method in methods):
+                    found = self._convert(payload, captured + [(name, converter, rest)])
+                    if found is not None:
+                        return found
+
+        return None
+
+    def _convert(self, payload, captured):
+        arguments = {}
+        for name, converter, value in captured:
+            try:
+                arguments[name] = converter.to_python(value)
+            except ValueError:
+                # The converter rejected the value (werkzeug ValidationError)
+                return None
+        return payload, arguments
@@ -0,0 +1,120 @@
+"""
+Application Router
+
+Thin proxy over the Larapy router used when registering application routes.
+"""
+
+import contextlib
+
+from app.Http.Async import ensure_sync
+from app.Http.RouteCache import RouteDefinition, lazy_handler
+from app.Support.Tracing import traced
+
+
+class Router:
+    """
+    Application Router
+
+    Delegates to the Larapy router, adapting ``async def`` controller
+    methods so they can be registered like any other route handler.
+    Every registration is recorded so ``route:cache`` can write the
+    route table to a manifest, and bound to the compiled middleware
+    pipeline of the current route groups.
+    """
+
+    # Router methods taking (path, handler, ...) and the HTTP methods they register
+    ROUTE_METHODS = {
+        'get': ('GET',),
+        'post': ('POST',),
+        'put': ('PUT',),
+        'patch': ('PATCH',),
+        'delete': ('DELETE',),
+        'options': ('OPTIONS',),
+        'any': None,
+    }
+
+    def __init__(self, router, flask_app=None, pipelines=None, groups=('web',)):
+        """
+        Args:
+            router: The Larapy router resolved from the container
+            flask_app: Flask application, used by match()
+            pipelines: PipelineCompiler of the HTTP kernel; routes are
+                registered without middleware when omitted
+            groups: Middleware groups applied to routes outside group()
+        """
+        self.router = router
+        self.flask_app = flask_app
+        self.pipelines = pipelines
+        self.groups = tuple(groups)
+        self.routes = []
+
+    def __getattr__(self, name):
+        attribute = getattr(self.router, name)
+        if name in self.ROUTE_METHODS:
+            def register(path, handler, *args, **kwargs):
+                self.routes.append(
+                    RouteDefinition(name, self.ROUTE_METHODS[name], path, handler, args, kwargs, self.groups)
+                )
+                return attribute(path, self._bind(handler, handler.__name__), *args, **kwargs)
+            return register
+        return attribute
+
+    @contextlib.contextmanager
+    def group(self, *groups):
+        """
+        Register the routes of a block with other middleware groups
+
+        Example:
+            with router.group('api'):
+                router.get('/api/users', controller.index)
+
+        Args:
+            groups: Middleware group names, in application order
+        """
+        previous = self.groups
+        self.groups = groups
+        try:
+            yield self
+        finally:
+            self.groups = previous
+
+    def _bind(self, handler, endpoint):
+        """Wrap a handler in tracing and the compiled pipeline of the current groups"""
+        view = traced(ensure_sync(handler))
+        if self.pipelines is None:
+            return view
+        return self.pipelines.bind(view, self.groups, endpoint)
+
+    def match(self, methods, path, handler, endpoint=None):
+        """
+        Register a route answering several HTTP methods
+
+        Args:
+            methods: HTTP methods, e.g. ['GET', 'POST']
+            path: Route path
+            handler: Route handler
+            endpoint: Endpoint name (defaults to the handler's name)
+        """
+        methods = tuple(method.upper() for method in methods)
+        endpoint = endpoint or handler.__name__
+        self.routes.append(RouteDefinition('match', methods, path, handler, (), {}, self.groups))
+        self.flask_app.add_url_rule(path, endpoint, self._bind(handler, endpoint), methods=list(methods))
+
+    def load_manifest(self, manifest):
+        """
+        Register the routes of a cached manifest
+
+        Controllers are imported when one of their routes is first called.
+        Each route is bound to the middleware groups it was cached with.
+
+        Args:
+            manifest: Manifest written by route:cache
+        """
+        instances = {}
+        for route in manifest['routes']:
+            handler = lazy_handler(route['handler'], instances)
+            with self.group(*route['middleware'].get('groups', self.groups)):
+                if route['verb'] == 'match':
+                    self.match(route['methods'], route['path'], handler, route['endpoint'])
+                else:
+                    getattr(self, route['verb'])(route['path'], handler, *route['args'], **route['kwargs'])
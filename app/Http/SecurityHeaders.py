@@ -0,0 +1,79 @@
+"""
+Security Headers
+
+Compiles the security header configuration into immutable header bundles
+once at boot, so responses get their headers with a single update()
+instead of walking the configuration per request.
+"""
+
+
+# Security header config keys and the response headers they map to
+SECURITY_HEADER_NAMES = (
+    ('x_frame_options', 'X-Frame-Options'),
+    ('x_content_type_options', 'X-Content-Type-Options'),
+    ('x_xss_protection', 'X-XSS-Protection'),
+    ('strict_transport_security', 'Strict-Transport-Security'),
+    ('content_security_policy', 'Content-Security-Policy'),
+    ('referrer_policy', 'Referrer-Policy'),
+    ('permissions_policy', 'Permissions-Policy'),
+)
+
+
+def compile_security_headers(headers_config):
+    """
+    Compile security header configuration into a header bundle
+    
+    Args:
+        headers_config: Security headers configuration dictionary
+        
+    Returns:
+        Immutable tuple of (header name, value) pairs for enabled headers
+    """
+    return tuple(
+        (header, headers_config[key])
+        for key, header in SECURITY_HEADER_NAMES
+        if headers_config.get(key)
+    )
+
+
+class SecurityHeaderBundles:
+    """
+    The default security header bundle and per-route overrides
+    """
+    
+    def __init__(self, headers_config, overrides=None):
+        """
+        Args:
+            headers_config: Security headers configuration dictionary
+            overrides: Per-route config overrides keyed by endpoint name
+        """
+        self.headers_config = dict(headers_config)
+        self.default = compile_security_headers(self.headers_config)
+        self.overrides = {}
+        for endpoint, route_config in (overrides or {}).items():
+            self.override(endpoint, route_config)
+    
+    def override(self, endpoint, overrides):
+        """
+        Register a security header override for a single route
+        
+        Args:
+            endpoint: Route endpoint name
+            overrides: Security header config keys to replace; a falsy
+                value removes the header for that route
+        """
+        headers_config = dict(self.headers_config)
+        headers_config.update(overrides)
+        self.overrides[endpoint] = compile_security_headers(headers_config)
+    
+    def for_endpoint(self, endpoint):
+        """
+        Get the compiled security header bundle for an endpoint
+        
+        Args:
+            endpoint: Route endpoint name (may be None for unmatched requests)
+            
+        Returns:
+            Tuple of (header name, value) pairs
+        """
+        return self.overrides.get(endpoint, self.default)
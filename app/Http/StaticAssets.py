@@ -0,0 +1,383 @@
+"""
+Static Assets
+
+Serves the Vite build output (public/build) at the WSGI layer from an
+index built at boot: content-hash ETags, precompressed .br/.gz siblings,
+immutable caching for hashed filenames and 304s answered from memory.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from email.utils import formatdate
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+# Precompressed siblings, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Mimetypes worth compressing
+COMPRESSIBLE_TYPES = re.compile(
+    r'^(text/|application/(javascript|json|manifest\+json|xml|wasm)|image/svg\+xml)'
+)
+
+# Written by assets:compress so boot can skip rehashing unchanged files
+INDEX_FILE = '.asset-index.json'
+
+
+class Asset:
+    """A servable file and its precompressed variants"""
+
+    __slots__ = ('path', 'size', 'mtime', 'digest', 'etag', 'mimetype', 'cache_control',
+                 'last_modified', 'variants', 'etags')
+
+    def __init__(self, path, size, mtime, digest, mimetype, cache_control, variants):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.digest = digest
+        self.etag = f'"{digest}"'
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        self.last_modified = formatdate(mtime, usegmt=True)
+        # encoding -> (path, size, etag)
+        self.variants = variants
+        self.etags = frozenset([self.etag] + [etag for _, _, etag in variants.values()])
+
+
+def _file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def guess_mimetype(name):
+    """Guess the Content-Type of a file, with a charset for text types"""
+    mimetype, _ = mimetypes.guess_type(name)
+    if name.endswith(('.js', '.mjs')):
+        mimetype = 'text/javascript'
+    mimetype = mimetype or 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype in ('application/json', 'image/svg+xml'):
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+class AssetIndex:
+    """
+    Asset Index
+
+    In-memory index of every file below a directory, keyed by its path
+    relative to that directory.
+    """
+
+    def __init__(self, root, immutable_paths=('assets/',), hashed_pattern=r'-[A-Za-z0-9_-]{8,}\.\w+$',
+                 max_age=0, immutable_max_age=31536000):
+        """
+        Args:
+            root: Directory to index (public/build)
+            immutable_paths: Path prefixes whose hashed files never change
+            hashed_pattern: Regex identifying content-hashed filenames
+            max_age: Cache lifetime of other files (they are revalidated)
+            immutable_max_age: Cache lifetime of hashed files
+        """
+        self.root = Path(root)
+        self.immutable_paths = tuple(immutable_paths)
+        self.hashed_pattern = re.compile(hashed_pattern)
+        self.max_age = max_age
+        self.immutable_max_age = immutable_max_age
+        self.assets = {}
+
+    def is_immutable(self, name):
+        """Determine whether a file name carries a content hash"""
+        return name.startswith(self.immutable_paths) and self.hashed_pattern.search(name) is not None
+
+    def cache_control(self, name):
+        """Get the Cache-Control header value for a file name"""
+        if self.is_immutable(name):
+            return f"public, max-age={self.immutable_max_age}, immutable"
+        return f"public, max-age={self.max_age}, must-revalidate"
+
+    def build(self):
+        """
+        Index the directory
+
+        Returns:
+            The index itself
+        """
+        known = self._load_digests()
+        assets = {}
+
+        for path, name, stat in self._walk():
+            if name.endswith(tuple(suffix for _, suffix in ENCODINGS)) or name == INDEX_FILE:
+                continue
+
+            digest = self._digest(path, name, stat, known)
+            variants = {}
+            for encoding, suffix in ENCODINGS:
+                variant_path = path + suffix
+                try:
+                    variant_stat = os.stat(variant_path)
+                except FileNotFoundError:
+                    continue
+                variants[encoding] = (variant_path, variant_stat.st_size, f'"{digest}-{encoding}"')
+
+            assets[name] = Asset(
+                path, stat.st_size, stat.st_mtime, digest, guess_mimetype(name),
+                self.cache_control(name), variants,
+            )
+
+        self.assets = assets
+        return self
+
+    def _walk(self):
+        if not self.root.is_dir():
+            return
+        for directory, _, files in os.walk(self.root):
+            for filename in files:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, '/')
+                yield path, name, os.stat(path)
+
+    def _load_digests(self):
+        try:
+            with open(self.root / INDEX_FILE, 'r', encoding='utf-8') as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _digest(path, name, stat, known):
+        entry = known.get(name)
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            return entry['digest']
+        return _file_digest(path)
+
+    def write_digests(self):
+        """Persist the digests so the next boot does not rehash unchanged files"""
+        digests = {}
+        for name, asset in self.assets.items():
+            stat = os.stat(asset.path)
+            digests[name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': asset.digest}
+        (self.root / INDEX_FILE).write_text(json.dumps(digests, indent=2, sort_keys=True), encoding='utf-8')
+
+    def get(self, name):
+        """Get the indexed asset for a relative path, or None"""
+        return self.assets.get(name)
+
+    def __len__(self):
+        return len(self.assets)
+
+
+def accepted_encodings(header):
+    """
+    Parse an Accept-Encoding header
+
+    Returns:
+        Set of encodings the client accepts (q > 0)
+    """
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    if '*' in accepted:
+        accepted.update(encoding for encoding, _ in ENCODINGS)
+    return accepted
+
+
+class _FileIterator:
+    """Fallback for servers without wsgi.file_wrapper"""
+
+    def __init__(self, handle, block_size):
+        self.handle = handle
+        self.block_size = block_size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        data = self.handle.read(self.block_size)
+        if data:
+            return data
+        raise StopIteration
+
+    def close(self):
+        self.handle.close()
+
+
+class StaticAssets:
+    """
+    Static Assets Middleware
+
+    Answers GET/HEAD requests for indexed files below a URL prefix before
+    the request reaches Flask. Range requests and unknown files fall
+    through to the wrapped application.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, index, prefix='/build/', headers=()):
+        """
+        Args:
+            index: Built AssetIndex
+            prefix: URL prefix the index is served under
+            headers: Extra headers sent with every asset (security headers)
+        """
+        self.index = index
+        self.prefix = prefix
+        self.headers = tuple(headers)
+
+    def select(self, asset, accept_encoding):
+        """
+        Choose the representation to send
+
+        Returns:
+            (path, size, etag, content encoding or None)
+        """
+        if asset.variants and accept_encoding:
+            accepted = accepted_encodings(accept_encoding)
+            for encoding, _ in ENCODINGS:
+                variant = asset.variants.get(encoding)
+                if variant is not None and encoding in accepted:
+                    return variant[0], variant[1], variant[2], encoding
+        return asset.path, asset.size, asset.etag, None
+
+    @staticmethod
+    def not_modified(asset, if_none_match):
+        """Check an If-None-Match header against every representation's ETag"""
+        if if_none_match.strip() == '*':
+            return True
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            if tag in asset.etags:
+                return True
+        return False
+
+    def wrap(self, wsgi_app):
+        """
+        Wrap a WSGI application so indexed assets are served directly
+
+        Args:
+            wsgi_app: The WSGI application (typically flask_app.wsgi_app)
+        """
+        prefix = self.prefix
+        assets = self.index.assets
+
+        def assets_app(environ, start_response):
+            path = environ.get('PATH_INFO', '')
+            if (path.startswith(prefix) and environ.get('REQUEST_METHOD') in ('GET', 'HEAD')
+                    and 'HTTP_RANGE' not in environ):
+                asset = assets.get(path[len(prefix):])
+                if asset is not None:
+                    response = self.serve(asset, environ, start_response)
+                    if response is not None:
+                        return response
+            return wsgi_app(environ, start_response)
+
+        return assets_app
+
+    def serve(self, asset, environ, start_response):
+        """
+        Send an asset, or a 304 when the client's copy is current
+
+        Returns:
+            WSGI response iterable, or None if the file vanished since boot
+        """
+        headers = [('Cache-Control', asset.cache_control), *self.headers]
+        if asset.variants:
+            headers.append(('Vary', 'Accept-Encoding'))
+
+        path, size, etag, encoding = self.select(asset, environ.get('HTTP_ACCEPT_ENCODING', ''))
+
+        if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and self.not_modified(asset, if_none_match):
+            start_response('304 Not Modified', headers + [('ETag', etag)])
+            return []
+
+        headers += [
+            ('Content-Type', asset.mimetype),
+            ('Content-Length', str(size)),
+            ('ETag', etag),
+            ('Last-Modified', asset.last_modified),
+        ]
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            start_response('200 OK', headers)
+            return []
+
+        try:
+            handle = open(path, 'rb')
+        except OSError:
+            # Removed since boot, let the application answer
+            return None
+
+        start_response('200 OK', headers)
+        file_wrapper = environ.get('wsgi.file_wrapper', _FileIterator)
+        return file_wrapper(handle, self.BLOCK_SIZE)
+
+
+def compress_assets(root, min_size=1024, force=False):
+    """
+    Write .br (when brotli is installed) and .gz siblings for compressible files
+
+    Args:
+        root: Build directory
+        min_size: Files smaller than this are left uncompressed
+        force: Recompress files whose siblings already exist
+
+    Returns:
+        List of files written
+    """
+    written = []
+    index = AssetIndex(root)
+
+    for path, name, stat in index._walk():
+        if name.endswith(tuple(suffix for _, suffix in ENCODINGS)) or name == INDEX_FILE:
+            continue
+        if stat.st_size < min_size or not COMPRESSIBLE_TYPES.match(guess_mimetype(name)):
+            continue
+
+        with open(path, 'rb') as handle:
+            data = handle.read()
+
+        compressors = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            compressors.insert(0, ('.br', lambda data: brotli.compress(data, quality=11)))
+
+        for suffix, compress in compressors:
+            target = path + suffix
+            if not force and os.path.exists(target) and os.stat(target).st_mtime >= stat.st_mtime:
+                continue
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                continue
+            with open(target, 'wb') as handle:
+                handle.write(compressed)
+            written.append(target)
+
+    index.build().write_digests()
+    return written
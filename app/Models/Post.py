@@ -5,10 +5,11 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
 
 from larapy.database.eloquent.model import Model
+from app.Support.Database import EagerLoading, UsesIdentityMap
 from datetime import datetime
 
 
-class Post(Model):
+class Post(UsesIdentityMap, EagerLoading, Model):
     """Post model with relationships"""
     
     # Table name
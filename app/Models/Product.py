@@ -5,10 +5,11 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
 
 from larapy.database.eloquent.model import Model
+from app.Support.Database import CachesQueries
 from datetime import datetime
 
 
-class Product(Model):
+class Product(CachesQueries, Model):
     """Product model"""
     
     # Table name
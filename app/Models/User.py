@@ -5,10 +5,11 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
 
 from larapy.database.eloquent.model import Model
+from app.Support.Database import EagerLoading, StreamsQueries, UsesIdentityMap
 from datetime import datetime
 
 
-class User(Model):
+class User(StreamsQueries, UsesIdentityMap, EagerLoading, Model):
     """User model with relationships and advanced features"""
     
     # Table name
@@ -153,7 +154,8 @@ class User(Model):
         Returns:
             User instance or None if not found
         """
-        return cls.where('email', email).first()
+        # query() shares instances through the identity map when one is active
+        return cls.query().where('email', email).first()
     
     @classmethod
     def create_user(cls, name: str, email: str, password: str):
@@ -191,8 +193,7 @@ class User(Model):
         """
         data = super().to_dict()
         # Remove password from output for security
-        if 'password' in data:
-            del data['password']
+        data.pop('password', None)
         return data
     
     def __repr__(self):
@@ -164,7 +164,11 @@ class UserObserver(Observer):
         # Example: Sync with external service
         # self.sync_with_external_service(model)
         
-        pass
+        # Invalidate cached template fragments showing user data
+        self.flush_user_fragments()
+        
+        # Purge cached pages tagged with the 'users' surrogate key
+        self.purge_user_pages()
     
     def deleting(self, model: Any) -> Optional[bool]:
         """
@@ -208,7 +212,11 @@ class UserObserver(Observer):
         # Example: Clear cache
         # cache.forget(f"user_{model.id}")
         
-        pass
+        # Invalidate cached template fragments showing user data
+        self.flush_user_fragments()
+        
+        # Purge cached pages tagged with the 'users' surrogate key
+        self.purge_user_pages()
     
     def restoring(self, model: Any) -> Optional[bool]:
         """
@@ -291,3 +299,14 @@ class UserObserver(Observer):
         """Sync with external service"""
         # Implement your external service sync logic
         pass
+    
+    def flush_user_fragments(self) -> None:
+        """Invalidate template fragments tagged 'users' ({% cache ..., tags=['users'] %})"""
+        from config.cache import get_cache_config
+        from app.Support.Cache import cache
+        cache(get_cache_config()['fragments']['store']).tags('users').flush()
+    
+    def purge_user_pages(self) -> None:
+        """Purge full-page responses tagged with the 'users' surrogate key"""
+        from app.Http.ResponseCache import purge_surrogate_keys
+        purge_surrogate_keys('users')
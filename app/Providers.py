@@ -36,6 +36,9 @@ class AppServiceProvider(ServiceProvider):
         
         # Configure middleware
         self._configure_middleware()
+        
+        # Attribute query time to the current request's trace
+        self._instrument_database()
     
     def _register_controllers(self):
         """Register application controllers"""
@@ -55,14 +58,22 @@ class AppServiceProvider(ServiceProvider):
         router = self.app.resolve('router')
         
         # Register middleware classes
-        from app.Http.Middleware.RequestId import RequestIdMiddleware
-        from app.Http.Middleware.Timing import TimingMiddleware
+        from app.Http.Middleware.Tracing import TracingMiddleware
+        from app.Http.Middleware.ResponseCache import ResponseCacheMiddleware
+        from app.Http.Middleware.IdentityMap import IdentityMapMiddleware
+        
+        router.middleware('tracing', 'app.Http.Middleware.Tracing.TracingMiddleware')
+        router.middleware('response_cache', 'app.Http.Middleware.ResponseCache.ResponseCacheMiddleware')
+        
+        # Opt-in: one model instance per row for the duration of a request
+        router.middleware('identity_map', 'app.Http.Middleware.IdentityMap.IdentityMapMiddleware')
         
-        router.middleware('request_id', 'app.Http.Middleware.RequestId.RequestIdMiddleware')
-        router.middleware('timing', 'app.Http.Middleware.Timing.TimingMiddleware')
+        # Former request ID and timing middleware, now both served by tracing
+        router.middleware('request_id', 'app.Http.Middleware.Tracing.TracingMiddleware')
+        router.middleware('timing', 'app.Http.Middleware.Tracing.TracingMiddleware')
         
         # Create middleware groups
-        router.middleware_group('web', ['request_id', 'timing'])
+        router.middleware_group('web', ['tracing', 'response_cache'])
     
     def _setup_database_tables(self):
         """Set up database tables if they don't exist"""
@@ -86,6 +97,16 @@ class AppServiceProvider(ServiceProvider):
         except Exception as e:
             print(f"Database setup error: {e}")
     
+    def _instrument_database(self):
+        """Time database calls as the 'db' phase of the request trace"""
+        from app.Support.Tracing import instrument
+        
+        try:
+            db = self.app.resolve('db')
+        except Exception:
+            return
+        instrument(db, ('select', 'select_one', 'insert', 'update', 'delete', 'statement', 'affecting_statement'))
+    
     def _configure_middleware(self):
         """Configure middleware settings"""
         # Configure middleware-specific settings
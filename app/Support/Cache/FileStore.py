@@ -0,0 +1,82 @@
+"""
+File Store
+
+Cache store keeping one file per key, shared by every process on the host.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+
+class FileStore:
+    """
+    File Store
+
+    Values are pickled with their expiry time and written atomically, so
+    workers never read a partially written entry.
+    """
+
+    # Entries are visible to every process on the host
+    shared = True
+
+    def __init__(self, directory, clock=time.time):
+        """
+        Args:
+            directory: Cache directory
+            clock: Wall clock used for expiry (shared across processes)
+        """
+        self.directory = Path(directory)
+        self.clock = clock
+
+    def path(self, key):
+        """Get the file path of a key"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / digest[2:4] / digest
+
+    def get(self, key):
+        """Get a value, or None on a miss"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as handle:
+                expires_at, value = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return None
+
+        if expires_at is not None and expires_at <= self.clock():
+            self.forget(key)
+            return None
+        return value
+
+    def put(self, key, value, ttl=None):
+        """Store a value for ttl seconds (None for no expiry)"""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        expires_at = self.clock() + ttl if ttl is not None else None
+
+        descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(descriptor, 'wb') as handle:
+                pickle.dump((expires_at, value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def forget(self, key):
+        """Remove a value, returning True if it was present"""
+        try:
+            os.unlink(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def flush(self):
+        """Remove every value"""
+        if self.directory.is_dir():
+            shutil.rmtree(self.directory)
@@ -0,0 +1,43 @@
+"""
+Memory Store
+
+Per-process cache store backed by the LRU cache.
+"""
+
+from .LruCache import LruCache
+
+
+class MemoryStore:
+    """
+    Memory Store
+
+    Fastest store, but entries and tag versions are private to the process,
+    so invalidation only reaches the worker that performed it (entries in
+    other workers still expire by TTL).
+    """
+
+    # Entries are visible to this process only
+    shared = False
+
+    def __init__(self, maxsize=10000):
+        """
+        Args:
+            maxsize: Maximum number of entries
+        """
+        self.entries = LruCache(maxsize)
+
+    def get(self, key):
+        """Get a value, or None on a miss"""
+        return self.entries.get(key)
+
+    def put(self, key, value, ttl=None):
+        """Store a value for ttl seconds (None for no expiry)"""
+        self.entries.set(key, value, ttl)
+
+    def forget(self, key):
+        """Remove a value, returning True if it was present"""
+        return self.entries.delete(key)
+
+    def flush(self):
+        """Remove every value"""
+        self.entries.clear()
@@ -0,0 +1,112 @@
+"""
+Cache Repository
+
+Store-independent cache API with remember() and tag-based invalidation.
+"""
+
+import hashlib
+import uuid
+
+
+class Repository:
+    """
+    Cache Repository
+
+    Wraps a store (MemoryStore, FileStore, ...) exposing get/put/forget/flush.
+    """
+
+    def __init__(self, store, prefix=''):
+        """
+        Args:
+            store: Backing cache store
+            prefix: Prefix applied to every key
+        """
+        self.store = store
+        self.prefix = prefix
+
+    def key(self, key):
+        """Get the store key for a cache key"""
+        return f"{self.prefix}{key}"
+
+    def get(self, key, default=None):
+        """Get a cached value, or default on a miss"""
+        value = self.store.get(self.key(key))
+        return default if value is None else value
+
+    def put(self, key, value, ttl=None):
+        """Store a value for ttl seconds (None for no expiry)"""
+        self.store.put(self.key(key), value, ttl)
+
+    def forget(self, key):
+        """Remove a cached value"""
+        return self.store.forget(self.key(key))
+
+    def remember(self, key, ttl, callback):
+        """
+        Get a cached value, computing and storing it on a miss
+
+        Args:
+            key: Cache key
+            ttl: Seconds to keep the computed value (None for no expiry)
+            callback: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is None:
+            value = callback()
+            if value is not None:
+                self.put(key, value, ttl)
+        return value
+
+    def tags(self, *names):
+        """
+        Get a view of the cache scoped to one or more tags
+
+        Args:
+            names: Tag names, e.g. 'users' or 'users', 'layout'
+
+        Returns:
+            TaggedRepository
+        """
+        return TaggedRepository(self.store, names, self.prefix)
+
+    def flush(self):
+        """Remove every cached value"""
+        self.store.flush()
+
+
+class TaggedRepository(Repository):
+    """
+    Tagged Cache Repository
+
+    Entries are keyed by the current version of each of their tags.
+    Flushing a tag gives it a new version, so every entry stored under the
+    old version becomes unreachable and ages out of the store.
+    """
+
+    def __init__(self, store, names, prefix=''):
+        super().__init__(store, prefix)
+        self.names = tuple(sorted(names))
+
+    def _tag_key(self, name):
+        return f"{self.prefix}tag:{name}:version"
+
+    def tag_version(self, name):
+        """Get (or initialise) the current version of a tag"""
+        version = self.store.get(self._tag_key(name))
+        if version is None:
+            version = uuid.uuid4().hex
+            self.store.put(self._tag_key(name), version)
+        return version
+
+    def key(self, key):
+        versions = '|'.join(f"{name}={self.tag_version(name)}" for name in self.names)
+        namespace = hashlib.sha1(versions.encode('utf-8')).hexdigest()
+        return f"{self.prefix}{namespace}:{key}"
+
+    def flush(self):
+        """Invalidate every entry stored under these tags"""
+        for name in self.names:
+            self.store.put(self._tag_key(name), uuid.uuid4().hex)
@@ -0,0 +1,91 @@
+"""
+SQLite Store
+
+Cache store in a single SQLite database, shared by every process on the
+host.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class SqliteStore:
+    """
+    SQLite Store
+
+    Values are pickled into one table. The database runs in WAL mode so
+    workers read while another writes; each thread (and each forked
+    worker) opens its own connection.
+    """
+
+    # Entries are visible to every process on the host
+    shared = True
+
+    def __init__(self, path, clock=time.time):
+        """
+        Args:
+            path: Database file
+            clock: Wall clock used for expiry (shared across processes)
+        """
+        self.path = Path(path)
+        self.clock = clock
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key):
+        """Get a value, or None on a miss"""
+        row = self._connection().execute(
+            'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= self.clock():
+            self.forget(key)
+            return None
+        try:
+            return pickle.loads(value)
+        except (pickle.UnpicklingError, EOFError, ValueError):
+            return None
+
+    def put(self, key, value, ttl=None):
+        """Store a value for ttl seconds (None for no expiry)"""
+        expires_at = self.clock() + ttl if ttl is not None else None
+        self._connection().execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), expires_at),
+        )
+
+    def forget(self, key):
+        """Remove a value, returning True if it was present"""
+        cursor = self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+        return cursor.rowcount > 0
+
+    def flush(self):
+        """Remove every value"""
+        self._connection().execute('DELETE FROM cache')
+
+    def prune(self):
+        """Delete expired entries, returning how many were removed"""
+        cursor = self._connection().execute(
+            'DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?', (self.clock(),)
+        )
+        return cursor.rowcount
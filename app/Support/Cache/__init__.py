@@ -0,0 +1,62 @@
+"""
+Cache Package
+
+In-process and shared cache stores used by the HTTP, view and ORM layers.
+"""
+
+import threading
+
+from .LruCache import LruCache
+from .MemoryStore import MemoryStore
+from .FileStore import FileStore
+from .SqliteStore import SqliteStore
+from .Repository import Repository, TaggedRepository
+
+__all__ = ['LruCache', 'MemoryStore', 'FileStore', 'SqliteStore', 'Repository', 'TaggedRepository', 'cache', 'create_store']
+
+
+_repositories = {}
+_lock = threading.Lock()
+
+
+def create_store(store_config):
+    """
+    Create a cache store from its configuration
+
+    Args:
+        store_config: Store entry from config/cache.py
+
+    Returns:
+        Cache store instance
+    """
+    driver = store_config['driver']
+    if driver == 'memory':
+        return MemoryStore(store_config.get('maxsize', 10000))
+    if driver == 'file':
+        return FileStore(store_config['path'])
+    if driver == 'sqlite':
+        return SqliteStore(store_config['path'])
+    raise ValueError(f"Unsupported cache driver: {driver}")
+
+
+def cache(store=None):
+    """
+    Get the cache repository for a configured store
+
+    Args:
+        store: Store name from config/cache.py (defaults to 'default')
+
+    Returns:
+        Repository shared by the whole process
+    """
+    repository = _repositories.get(store)
+    if repository is None:
+        from config.cache import get_cache_config
+
+        with _lock:
+            repository = _repositories.get(store)
+            if repository is None:
+                config = get_cache_config()
+                store_config = config['stores'][store or config['default']]
+                repository = _repositories[store] = Repository(create_store(store_config), config['prefix'])
+    return repository
@@ -0,0 +1,180 @@
+"""
+Bulk Insert
+
+Writes many rows with multi-row INSERT statements::
+
+    bulk_insert(User, rows, chunk_size=1000)
+
+Rows are grouped into chunks that stay under the driver's bound-parameter
+limit, aligned to one column list per chunk, and handed to the query
+builder's insert(), which compiles a list of rows into a single
+statement. Model events are not fired; the table's query cache tag is
+flushed once at the end instead.
+
+Factories opt in with the InsertsInBulk concern::
+
+    UserFactory().count(100000).insert()                 # rows only
+    UserFactory().count(5000).without_events().create()  # unsaved models
+"""
+
+from datetime import datetime
+
+from .QueryCache import flush_tables
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER; MySQL and Postgres allow 65535
+MAX_BINDINGS = 32766
+
+
+def model_rows(models):
+    """Get the attribute rows of models built by a factory"""
+    return [dict(model.attributes) for model in models]
+
+
+def chunk_rows(rows, chunk_size=DEFAULT_CHUNK_SIZE, max_bindings=MAX_BINDINGS):
+    """
+    Group rows into chunks sharing one column list
+
+    Columns missing from a row are filled with None so the chunk forms a
+    single VALUES list.
+
+    Args:
+        rows: Iterable of attribute dicts
+        chunk_size: Rows per chunk
+        max_bindings: Bound-parameter limit per statement
+
+    Yields:
+        Lists of aligned rows
+    """
+    chunk = []
+    columns = {}
+    for row in rows:
+        widened = dict(columns, **dict.fromkeys(row))
+        limit = max(1, min(chunk_size, max_bindings // max(len(widened), 1)))
+        if chunk and len(chunk) >= limit:
+            yield _aligned(chunk, columns)
+            chunk, widened = [], dict.fromkeys(row)
+        chunk.append(row)
+        columns = widened
+    if chunk:
+        yield _aligned(chunk, columns)
+
+
+def _aligned(chunk, columns):
+    return [{column: row.get(column) for column in columns} for row in chunk]
+
+
+def stamp(model_class, rows, now=None):
+    """Fill created_at/updated_at on rows of a model using timestamps"""
+    timestamps = getattr(model_class, 'timestamps', False)
+    now = now or datetime.now()
+    for row in rows:
+        if timestamps:
+            row.setdefault('created_at', now)
+            row.setdefault('updated_at', now)
+        yield row
+
+
+def bulk_insert(model_class, rows, chunk_size=DEFAULT_CHUNK_SIZE, max_bindings=MAX_BINDINGS):
+    """
+    Insert rows into a model's table in multi-row statements
+
+    Args:
+        model_class: Model whose table receives the rows
+        rows: Iterable of attribute dicts (consumed lazily)
+        chunk_size: Rows per INSERT
+        max_bindings: Bound-parameter limit per statement
+
+    Returns:
+        Number of rows inserted
+    """
+    inserted = 0
+    for chunk in chunk_rows(stamp(model_class, rows), chunk_size, max_bindings):
+        model_class.query().insert(chunk)
+        inserted += len(chunk)
+    if inserted:
+        flush_tables(model_class.table)
+    return inserted
+
+
+class InsertsInBulk:
+    """
+    Bulk Insert Concern
+
+    Factory mixin adding insert() and without_events(). Models are built
+    with make(), so definitions, states and mutators apply as usual; their
+    attributes are then written chunk by chunk with bulk_insert(). create()
+    keeps saving one model at a time, firing events and after_creating
+    callbacks, unless without_events() was called. Place it before
+    Factory in the bases.
+    """
+
+    chunk_size = DEFAULT_CHUNK_SIZE
+
+    _bulk_count = 1
+    _bulk = False
+
+    def count(self, count):
+        """Set the number of models to create"""
+        factory = super().count(count)
+        factory._bulk_count = count
+        return factory
+
+    def without_events(self):
+        """Make create() insert in bulk, skipping model events and callbacks"""
+        self._bulk = True
+        return self
+
+    def create(self, attributes=None, chunk_size=None):
+        """
+        Create the models
+
+        Args:
+            attributes: Attributes overriding the definition
+            chunk_size: Rows per INSERT after without_events()
+
+        Returns:
+            The created models (without primary keys when inserted in bulk)
+        """
+        if not self._bulk:
+            return super().create(attributes) if attributes is not None else super().create()
+
+        created = []
+        for models in self._made_chunks(attributes, chunk_size):
+            bulk_insert(self.model, model_rows(models), len(models))
+            created.extend(models)
+        return created
+
+    def insert(self, attributes=None, chunk_size=None):
+        """
+        Insert the models in bulk without keeping them
+
+        For load-test volumes, where holding every model would exhaust
+        memory. Model events and after_creating callbacks do not run.
+
+        Returns:
+            Number of rows inserted
+        """
+        inserted = 0
+        for models in self._made_chunks(attributes, chunk_size):
+            inserted += bulk_insert(self.model, model_rows(models), len(models))
+        return inserted
+
+    def _made_chunks(self, attributes, chunk_size):
+        chunk_size = chunk_size or self.chunk_size
+        total = self._bulk_count
+        remaining = total
+        try:
+            while remaining > 0:
+                batch = min(chunk_size, remaining)
+                factory = super().count(batch)
+                models = factory.make(attributes) if attributes is not None else factory.make()
+                # make() may return a single model or a collection
+                models = [models] if hasattr(models, 'attributes') else list(models)
+                yield models
+                remaining -= batch
+        finally:
+            # count() may set the count on this factory; restore it
+            super().count(total)
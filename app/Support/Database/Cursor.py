@@ -0,0 +1,244 @@
+"""
+Cursor
+
+Streams large result sets instead of buffering them::
+
+    for user in User.cursor():                       # server-side cursor
+        ...
+    for users in User.chunk_by_id(1000):             # keyset pages
+        ...
+    for user in User.cursor(User.with_trashed()):    # any builder
+        ...
+
+cursor() runs the query once on an unbuffered server-side cursor
+(PyMySQL/mysqlclient SSCursor, a named psycopg cursor, or sqlite3's lazy
+cursor) and hydrates models as rows arrive, so memory stays flat however
+many rows match. The connection is busy until the cursor is exhausted or
+closed; use chunk_by_id() when each row issues further queries.
+
+chunk_by_id() pages with ``where id > last order by id limit n`` rather
+than OFFSET, so each page costs the same and rows written meanwhile are
+neither skipped nor repeated.
+"""
+
+import copy
+import itertools
+import re
+
+from .IdentityMap import primary_key
+from .QueryCache import hydrate
+
+
+DEFAULT_FETCH_SIZE = 1000
+
+# String literals, ? placeholders and % signs
+_PLACEHOLDERS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`)|(\?)|(%)")
+
+_names = itertools.count(1)
+
+
+def _driver(connection):
+    return type(connection).__module__.split('.')[0]
+
+
+def raw_connection(query):
+    """
+    Find the DB-API connection behind a query builder
+
+    Returns:
+        The sqlite3/pymysql/MySQLdb/psycopg connection, or None
+    """
+    candidate = query
+    for _ in range(4):
+        if candidate is None:
+            return None
+        if _driver(candidate) in ('sqlite3', 'pymysql', 'MySQLdb', 'psycopg2', 'psycopg'):
+            return candidate
+        getter = getattr(candidate, 'get_connection', None) or getattr(candidate, 'get_pdo', None)
+        following = getter() if callable(getter) else None
+        if following is None:
+            following = getattr(candidate, 'connection', None) or getattr(candidate, '_connection', None)
+        candidate = following
+    return None
+
+
+def _format_placeholders(sql):
+    # pymysql/psycopg use %s and %-format the whole statement, literals included
+    def replace(match):
+        if match.group(1):
+            return match.group(1).replace('%', '%%')
+        return '%s' if match.group(2) else '%%'
+    return _PLACEHOLDERS.sub(replace, sql)
+
+
+def _server_cursor(connection, fetch_size):
+    driver = _driver(connection)
+    if driver == 'pymysql':
+        import pymysql.cursors
+        return connection.cursor(pymysql.cursors.SSCursor)
+    if driver == 'MySQLdb':
+        import MySQLdb.cursors
+        return connection.cursor(MySQLdb.cursors.SSCursor)
+    if driver in ('psycopg2', 'psycopg'):
+        cursor = connection.cursor(name=f"larapy_cursor_{next(_names)}")
+        cursor.itersize = fetch_size
+        return cursor
+    # sqlite3 steps through rows as they are fetched
+    return connection.cursor()
+
+
+def stream_rows(connection, sql, bindings=(), fetch_size=DEFAULT_FETCH_SIZE):
+    """
+    Run a query on a server-side cursor and yield its rows as dicts
+
+    Args:
+        connection: DB-API connection
+        sql: SQL with ``?`` placeholders
+        bindings: Bound values
+        fetch_size: Rows fetched per round trip
+    """
+    bindings = list(bindings or ())
+    if _driver(connection) != 'sqlite3':
+        sql = _format_placeholders(sql) if bindings else sql
+    cursor = _server_cursor(connection, fetch_size)
+    try:
+        if bindings:
+            cursor.execute(sql, bindings)
+        else:
+            cursor.execute(sql)
+        columns = None
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                return
+            if columns is None:
+                columns = [column[0] for column in cursor.description]
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        cursor.close()
+
+
+def cursor(query, model_class, fetch_size=DEFAULT_FETCH_SIZE):
+    """
+    Lazily iterate the models a query matches
+
+    Rows are hydrated one at a time and bypass the identity map. Builders
+    whose connection is not reachable fall back to lazy_by_id().
+
+    Args:
+        query: Query builder (must provide to_sql() and get_bindings())
+        model_class: Model to hydrate
+        fetch_size: Rows fetched per round trip
+    """
+    connection = raw_connection(query)
+    if connection is None:
+        yield from lazy_by_id(query, model_class, fetch_size)
+        return
+    for row in stream_rows(connection, query.to_sql(), query.get_bindings(), fetch_size):
+        yield hydrate(model_class, row)
+
+
+def _clone(query):
+    clone = getattr(query, 'clone', None)
+    if callable(clone):
+        return clone()
+    # Copy the clause lists so each page adds its own where/limit
+    duplicate = copy.copy(query)
+    for name, value in vars(duplicate).items():
+        if isinstance(value, (list, dict)):
+            setattr(duplicate, name, copy.copy(value))
+    return duplicate
+
+
+def _value(model, column):
+    attributes = getattr(model, 'attributes', None)
+    if isinstance(attributes, dict):
+        return attributes.get(column)
+    return getattr(model, column, None)
+
+
+def chunk_by_id(query, model_class, count=DEFAULT_FETCH_SIZE, column=None):
+    """
+    Iterate the models a query matches in keyset pages
+
+    The query must not be ordered by anything but the key column.
+
+    Args:
+        query: Query builder
+        model_class: Model the query returns
+        count: Models per page
+        column: Ascending unique column to page on (the primary key)
+
+    Yields:
+        Lists of at most count models
+    """
+    column = column or primary_key(model_class)
+    last = None
+    while True:
+        page = _clone(query)
+        if last is not None:
+            page = page.where(column, '>', last)
+        models = list(page.order_by(column).limit(count).get())
+        if not models:
+            return
+        yield models
+        if len(models) < count:
+            return
+        last = _value(models[-1], column)
+
+
+def lazy_by_id(query, model_class, count=DEFAULT_FETCH_SIZE, column=None):
+    """Iterate the models a query matches one at a time, fetched by chunk_by_id()"""
+    for models in chunk_by_id(query, model_class, count, column):
+        yield from models
+
+
+class StreamsQueries:
+    """
+    Streaming Concern
+
+    Model mixin adding cursor(), chunk_by_id() and lazy_by_id() to the
+    model and its queries. Place it before Model in the bases.
+    """
+
+    @classmethod
+    def query(cls):
+        """Get a query builder supporting cursor() and chunk_by_id()"""
+        from .EagerLoading import EagerQuery
+
+        query = super().query()
+        if isinstance(query, EagerQuery):
+            return query
+        return EagerQuery(query, (), cls)
+
+    @classmethod
+    def _streamed(cls, query):
+        from .EagerLoading import EagerQuery
+
+        query = query if query is not None else cls.query()
+        if isinstance(query, EagerQuery):
+            return query
+        return EagerQuery(query, (), cls)
+
+    @classmethod
+    def cursor(cls, query=None, fetch_size=DEFAULT_FETCH_SIZE):
+        """
+        Lazily iterate the model's rows on a server-side cursor
+
+        Args:
+            query: Builder to stream (defaults to every model, e.g. pass
+                cls.with_trashed() to include soft deleted ones)
+            fetch_size: Rows fetched per round trip
+        """
+        return cls._streamed(query).cursor(fetch_size)
+
+    @classmethod
+    def chunk_by_id(cls, count=DEFAULT_FETCH_SIZE, column=None, query=None):
+        """Iterate the model's rows in keyset pages of count models"""
+        return cls._streamed(query).chunk_by_id(count, column)
+
+    @classmethod
+    def lazy_by_id(cls, count=DEFAULT_FETCH_SIZE, column=None, query=None):
+        """Iterate the model's rows one at a time, fetched in keyset pages"""
+        return cls._streamed(query).lazy_by_id(count, column)
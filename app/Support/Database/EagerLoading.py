@@ -0,0 +1,492 @@
+"""
+Eager Loading
+
+Loads relations for a whole result set with one query per relation level
+instead of one query per row::
+
+    users = User.with_('posts', 'roles.permissions').where('status', 'active').get()
+    users = User.with_({'posts': lambda query: query.where('status', 'published')}).get()
+    user.load('roles.permissions')
+
+    for role in user.get_relation('roles'):
+        role.get_relation('permissions')
+
+Each level runs a single ``WHERE key IN (...)`` query (split into batches
+below the database's bound-parameter limit) and the results are attached
+to their parents with a hash join in Python.
+
+Relations are read from the model's own ``has_many``/``has_one``/
+``belongs_to``/``belongs_to_many`` declarations, so nothing has to be
+declared twice.
+"""
+
+import contextvars
+import importlib
+import re
+
+from app.Support.Database import Cursor as streaming
+from app.Support.Database.IdentityMap import canonicalize, current_identity_map, primary_key
+
+
+# Keys per IN (...) query; SQLite allows 999 bound parameters
+BATCH_SIZE = 900
+
+# Builder methods restricting the selected columns; their results are
+# partial rows and stay out of the identity map
+_COLUMN_SELECTS = frozenset({'select', 'add_select', 'select_raw'})
+
+_describing = contextvars.ContextVar('describing_relations', default=False)
+
+
+class RelationNotFound(AttributeError):
+    """Raised when eager loading names a method that is not a relation"""
+
+
+class RelationSpec:
+    """
+    Relation Spec
+
+    The arguments of a relation declaration, and the loading strategy for
+    its kind.
+    """
+
+    __slots__ = ('kind', 'related', 'foreign_key', 'local_key', 'table', 'related_pivot_key', 'related_key')
+
+    def __init__(self, kind, related, foreign_key=None, local_key='id', table=None,
+                 related_pivot_key=None, related_key='id'):
+        """
+        Args:
+            kind: 'has_many', 'has_one', 'belongs_to' or 'belongs_to_many'
+            related: Related model class or class name
+            foreign_key: Column on the related table (has_*), on the parent
+                (belongs_to) or the parent's column on the pivot (belongs_to_many)
+            local_key: Parent key (has_*, belongs_to_many) or owner key on the
+                related table (belongs_to)
+            table: Pivot table (belongs_to_many)
+            related_pivot_key: Related model's column on the pivot (belongs_to_many)
+            related_key: Related model's key referenced by the pivot
+        """
+        self.kind = kind
+        self.related = related
+        self.foreign_key = foreign_key
+        self.local_key = local_key
+        self.table = table
+        self.related_pivot_key = related_pivot_key
+        self.related_key = related_key
+
+    @classmethod
+    def declared(cls, kind, parent, related, *args, **kwargs):
+        """
+        Build a spec from the arguments of a relation declaration
+
+        Missing keys default like Laravel's: 'user_id' for a User parent
+        (has_*) or a User related model (belongs_to).
+
+        Args:
+            kind: Declaring method name
+            parent: Declaring model class
+            related: Related model class or class name
+        """
+        related_name = related if isinstance(related, str) else related.__name__
+        if kind == 'belongs_to_many':
+            names = ('table', 'foreign_pivot_key', 'related_pivot_key', 'parent_key', 'related_key')
+            values = dict(zip(names, args), **kwargs)
+            if not all(values.get(name) for name in names[:3]):
+                raise ValueError(f"{parent.__name__}: eager loading needs the pivot table and keys of {related_name}")
+            return cls(kind, related, values['foreign_pivot_key'], values.get('parent_key', 'id'),
+                       values['table'], values['related_pivot_key'], values.get('related_key', 'id'))
+
+        names = ('foreign_key', 'owner_key' if kind == 'belongs_to' else 'local_key')
+        values = dict(zip(names, args), **kwargs)
+        default_owner = related_name if kind == 'belongs_to' else parent.__name__
+        foreign_key = values.get('foreign_key') or f"{_snake(default_owner)}_id"
+        return cls(kind, related, foreign_key, values.get(names[1], 'id'))
+
+    @property
+    def many(self):
+        return self.kind in ('has_many', 'belongs_to_many')
+
+    def parent_key(self):
+        """Parent column whose values select the related rows"""
+        return self.foreign_key if self.kind == 'belongs_to' else self.local_key
+
+    def query(self, keys, constraint=None):
+        """
+        Build the query for one batch of parent keys
+
+        Returns:
+            (query, column of each result holding its parent's key, whether
+            the constraint restricted the selected columns)
+        """
+        related = resolve_model(self.related)
+        query = related.query()
+        # The raw builder: match() maps each row itself once its key is read
+        if isinstance(query, EagerQuery):
+            query = query._query
+
+        if self.kind == 'belongs_to_many':
+            pivot_column = f"pivot_{self.foreign_key}"
+            query = query.select(
+                f"{related.table}.*", f"{self.table}.{self.foreign_key} as {pivot_column}"
+            ).join(
+                self.table, f"{self.table}.{self.related_pivot_key}", '=', f"{related.table}.{self.related_key}"
+            ).where_in(f"{self.table}.{self.foreign_key}", keys)
+            match_column = pivot_column
+        elif self.kind == 'belongs_to':
+            query = query.where_in(self.local_key, keys)
+            match_column = self.local_key
+        else:
+            query = query.where_in(self.foreign_key, keys)
+            match_column = self.foreign_key
+
+        partial = False
+        if constraint is not None:
+            tracked = EagerQuery(query, ())
+            constrained = constraint(tracked) or tracked
+            if constrained is tracked:
+                query, partial = tracked._query, tracked._partial
+            else:
+                query, partial = constrained, True
+        return query, match_column, partial
+
+    def match(self, parents, name, keys_column, constraint=None):
+        """
+        Load the relation for every parent and attach the results
+
+        Returns:
+            List of loaded related models (for nested loading)
+        """
+        keys = []
+        seen = set()
+        for parent in parents:
+            key = _attribute(parent, keys_column)
+            if key is not None and key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+        buckets = {}
+        loaded = []
+        identity = current_identity_map()
+
+        # Owners already in the identity map need no query
+        if identity is not None and self.kind == 'belongs_to' and constraint is None:
+            related = resolve_model(self.related)
+            if self.local_key == primary_key(related):
+                missing = []
+                for key in keys:
+                    model = identity.get(related, key)
+                    if model is None:
+                        missing.append(key)
+                    else:
+                        buckets[key] = [model]
+                        loaded.append(model)
+                keys = missing
+
+        for start in range(0, len(keys), BATCH_SIZE):
+            query, match_column, partial = self.query(keys[start:start + BATCH_SIZE], constraint)
+            for model in query.get():
+                # Read the join key before the row is swapped for its mapped instance
+                key = _attribute(model, match_column)
+                if self.kind == 'belongs_to_many' and isinstance(getattr(model, 'attributes', None), dict):
+                    # The pivot column is not part of the related row
+                    model.attributes.pop(match_column, None)
+                if identity is not None and not partial:
+                    model = identity.add(model)
+                buckets.setdefault(key, []).append(model)
+                loaded.append(model)
+
+        for parent in parents:
+            models = buckets.get(_attribute(parent, keys_column), [])
+            parent.set_relation(name, list(models) if self.many else (models[0] if models else None))
+        return loaded
+
+
+def _snake(name):
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+def _attribute(model, key):
+    attributes = getattr(model, 'attributes', None)
+    if isinstance(attributes, dict):
+        return attributes.get(key)
+    return getattr(model, key, None)
+
+
+_models = {}
+
+
+def resolve_model(model):
+    """
+    Resolve a related model given as a class or a class name
+
+    Names are looked up among loaded EagerLoading models, then imported
+    from app.Models.<Name>.
+    """
+    if isinstance(model, type):
+        return model
+    resolved = _models.get(model)
+    if resolved is None:
+        module = importlib.import_module(f"app.Models.{model}")
+        resolved = getattr(module, model)
+    return resolved
+
+
+def parse_relations(relations):
+    """
+    Parse eager load arguments into a tree and per-path constraints
+
+    Args:
+        relations: Names such as 'posts' or 'roles.permissions', and dicts
+            mapping names to constraint callables
+
+    Returns:
+        (tree, constraints) where tree maps names to child trees
+    """
+    tree = {}
+    constraints = {}
+    for relation in relations:
+        items = relation.items() if isinstance(relation, dict) else [(relation, None)]
+        for path, constraint in items:
+            node = tree
+            for name in path.split('.'):
+                node = node.setdefault(name, {})
+            if constraint is not None:
+                constraints[path] = constraint
+    return tree, constraints
+
+
+def eager_load(models, relations):
+    """
+    Eager load relations onto a list of models
+
+    Args:
+        models: Models of one class
+        relations: Relation names/dicts as accepted by with_()
+
+    Returns:
+        The models
+    """
+    models = [model for model in models if model is not None]
+    tree, constraints = parse_relations(relations)
+    _load_tree(models, tree, constraints, '')
+    return models
+
+
+def _load_tree(models, tree, constraints, prefix):
+    if not models:
+        return
+    model_class = type(models[0])
+    for name, children in tree.items():
+        path = f"{prefix}{name}"
+        spec = model_class.relation_spec(name)
+        related = spec.match(models, name, spec.parent_key(), constraints.get(path))
+        if children:
+            _load_tree(related, children, constraints, f"{path}.")
+
+
+class EagerQuery:
+    """
+    Query builder proxy that eager loads relations onto its results,
+    passes them through the active identity map and, after remember(),
+    serves them from the query cache
+
+    Results of queries restricting their columns (select()) are partial
+    rows and are not passed through the identity map.
+    """
+
+    def __init__(self, query, relations, model=None):
+        self._query = query
+        self._relations = list(relations)
+        self._model = model
+        self._remembered = None
+        self._partial = False
+
+    def with_(self, *relations):
+        """Eager load more relations"""
+        self._relations.extend(relations)
+        return self
+
+    def remember(self, ttl=None, tables=()):
+        """
+        Cache the results of this query
+
+        Args:
+            ttl: Seconds to keep results (None until the table changes;
+                capped at local_ttl in a per-process store)
+            tables: Extra tables the query reads, e.g. joined ones
+
+        Returns:
+            The query, for chaining
+        """
+        from .QueryCache import RememberedQuery
+
+        if self._model is None:
+            raise TypeError('remember() needs the query to know its model')
+        self._remembered = RememberedQuery(self._model, ttl, tables)
+        return self
+
+    def _run(self, method, *args, **kwargs):
+        if self._remembered is not None:
+            return self._remembered.run(self._query, method, *args, **kwargs)
+        return getattr(self._query, method)(*args, **kwargs)
+
+    def _canonical(self, results):
+        return results if self._partial else canonicalize(results)
+
+    def get(self, *args, **kwargs):
+        """Run the query and load the relations onto every result"""
+        results = self._canonical(self._run('get', *args, **kwargs))
+        if self._relations:
+            eager_load(list(results), self._relations)
+        return results
+
+    def all(self, *args, **kwargs):
+        return self.get(*args, **kwargs)
+
+    def first(self, *args, **kwargs):
+        """Run the query for one model and load its relations"""
+        model = self._canonical(self._run('first', *args, **kwargs))
+        if model is not None and self._relations:
+            eager_load([model], self._relations)
+        return model
+
+    def cursor(self, fetch_size=streaming.DEFAULT_FETCH_SIZE):
+        """
+        Lazily iterate the results on a server-side cursor
+
+        Relations are not loaded, since the connection is busy until the
+        cursor is exhausted; use chunk_by_id() for that.
+        """
+        return streaming.cursor(self._query, self._model, fetch_size)
+
+    def chunk_by_id(self, count=streaming.DEFAULT_FETCH_SIZE, column=None):
+        """Iterate the results in keyset pages, loading relations per page"""
+        for models in streaming.chunk_by_id(self._query, self._model, count, column):
+            if self._relations:
+                eager_load(models, self._relations)
+            yield models
+
+    def lazy_by_id(self, count=streaming.DEFAULT_FETCH_SIZE, column=None):
+        """Iterate the results one at a time, fetched in keyset pages"""
+        for models in self.chunk_by_id(count, column):
+            yield from models
+
+    def __getattr__(self, name):
+        attribute = getattr(self._query, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            if name in _COLUMN_SELECTS:
+                self._partial = True
+            result = attribute(*args, **kwargs)
+            # Builder methods return the builder; keep proxying them
+            if result is self._query or type(result) is type(self._query):
+                self._query = result
+                return self
+            return result
+        return call
+
+
+class EagerLoading:
+    """
+    Eager Loading Concern
+
+    Model mixin adding with_(), load() and get_relation(). Place it before
+    Model in the bases so its relation declarations can be described.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _models[cls.__name__] = cls
+
+    @classmethod
+    def with_(cls, *relations):
+        """
+        Start a query that eager loads relations
+
+        Args:
+            relations: Names ('posts', 'roles.permissions') or dicts mapping
+                names to callables constraining their query
+
+        Returns:
+            EagerQuery proxying the model's query builder
+        """
+        query = cls.query()
+        if isinstance(query, EagerQuery):
+            return query.with_(*relations)
+        return EagerQuery(query, relations, cls)
+
+    @classmethod
+    def load_relations(cls, models, *relations):
+        """Eager load relations onto models already fetched"""
+        return eager_load(models, relations)
+
+    def load(self, *relations):
+        """Eager load relations onto this model"""
+        eager_load([self], relations)
+        return self
+
+    @classmethod
+    def relation_spec(cls, name):
+        """
+        Describe a relation from its declaration
+
+        Raises:
+            RelationNotFound: If the method does not declare a relation
+        """
+        specs = cls.__dict__.get('_relation_specs')
+        if specs is None:
+            specs = {}
+            type.__setattr__(cls, '_relation_specs', specs)
+        spec = specs.get(name)
+        if spec is None:
+            method = getattr(cls, name, None)
+            token = _describing.set(True)
+            try:
+                spec = method(cls.__new__(cls)) if callable(method) else None
+            finally:
+                _describing.reset(token)
+            if not isinstance(spec, RelationSpec):
+                raise RelationNotFound(f"{cls.__name__}.{name} is not a relation")
+            specs[name] = spec
+        return spec
+
+    def _loaded_relations(self):
+        return vars(self).setdefault('_eager_relations', {})
+
+    def set_relation(self, name, value):
+        """Attach a loaded relation"""
+        self._loaded_relations()[name] = value
+        return self
+
+    def relation_loaded(self, name):
+        """Determine whether a relation has been loaded"""
+        return name in self._loaded_relations()
+
+    def get_relation(self, name):
+        """Get a relation's models, loading it (one query) if not loaded yet"""
+        relations = self._loaded_relations()
+        if name not in relations:
+            self.load(name)
+        return relations[name]
+
+    def has_many(self, *args, **kwargs):
+        if _describing.get():
+            return RelationSpec.declared('has_many', type(self), *args, **kwargs)
+        return super().has_many(*args, **kwargs)
+
+    def has_one(self, *args, **kwargs):
+        if _describing.get():
+            return RelationSpec.declared('has_one', type(self), *args, **kwargs)
+        return super().has_one(*args, **kwargs)
+
+    def belongs_to(self, *args, **kwargs):
+        if _describing.get():
+            return RelationSpec.declared('belongs_to', type(self), *args, **kwargs)
+        return super().belongs_to(*args, **kwargs)
+
+    def belongs_to_many(self, *args, **kwargs):
+        if _describing.get():
+            return RelationSpec.declared('belongs_to_many', type(self), *args, **kwargs)
+        return super().belongs_to_many(*args, **kwargs)
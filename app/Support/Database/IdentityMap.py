@@ -0,0 +1,244 @@
+"""
+Identity Map
+
+Opt-in map of loaded models keyed by (model class, primary key), scoped to
+a request or unit of work through a ``contextvars`` slot::
+
+    with identity_map():
+        post.get_relation('user') is User.find(post.user_id)   # True, one query
+
+While a map is active, ``find()`` and ``belongs_to`` loads skip the
+database for models already loaded, and every full-row query result is
+replaced by the instance already in the map, so a row is hydrated into
+one object per unit of work. Column-restricted queries (``select()``)
+bypass the map, so a partial row never stands in for a full one.
+``save()`` and ``delete()`` keep the map current.
+
+Outside a map nothing changes. The ``identity_map`` route middleware
+opens one per request with within_identity_map(), which keeps it active
+while a streamed response body renders.
+"""
+
+import contextlib
+import contextvars
+
+
+_current = contextvars.ContextVar('identity_map', default=None)
+
+
+def primary_key(model_class):
+    """Get the primary key column of a model class"""
+    return getattr(model_class, 'primary_key', None) or 'id'
+
+
+def _normalize(key):
+    # Route parameters arrive as strings, database keys as integers
+    if isinstance(key, str) and key.isdigit():
+        return int(key)
+    return key
+
+
+def _key_of(model):
+    attributes = getattr(model, 'attributes', None)
+    column = primary_key(type(model))
+    if isinstance(attributes, dict):
+        return attributes.get(column)
+    return getattr(model, column, None)
+
+
+class IdentityMap:
+    """
+    Identity Map
+
+    Loaded models of one unit of work.
+    """
+
+    def __init__(self):
+        self.models = {}
+        self.hits = 0
+
+    def get(self, model_class, key):
+        """Get the loaded model for a primary key, or None"""
+        model = self.models.get((model_class, _normalize(key)))
+        if model is not None:
+            self.hits += 1
+        return model
+
+    def add(self, model, replace=False):
+        """
+        Register a model
+
+        Args:
+            model: Loaded model
+            replace: Make this instance the canonical one even if another
+                instance with the same key is mapped (after save())
+
+        Returns:
+            The canonical instance for the model's key
+        """
+        key = _key_of(model)
+        if key is None:
+            return model
+        identity = (type(model), _normalize(key))
+        if replace:
+            self.models[identity] = model
+            return model
+        return self.models.setdefault(identity, model)
+
+    def forget(self, model):
+        """Remove a model (after delete())"""
+        key = _key_of(model)
+        if key is not None:
+            self.models.pop((type(model), _normalize(key)), None)
+
+    def canonical(self, models):
+        """Replace each model with its mapped instance, mapping new ones"""
+        return [self.add(model) if model is not None else None for model in models]
+
+    def clear(self):
+        """Forget every model"""
+        self.models.clear()
+
+    def __len__(self):
+        return len(self.models)
+
+
+def current_identity_map():
+    """Get the active identity map, or None"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def identity_map():
+    """
+    Run a unit of work with its own identity map
+
+    Nested calls share the outer map.
+
+    Yields:
+        The active IdentityMap
+    """
+    active = _current.get()
+    if active is not None:
+        yield active
+        return
+    token = _current.set(IdentityMap())
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def bind_identity_map(body, identity):
+    """
+    Iterate a response body with an identity map active
+
+    The map is set while each chunk is produced and unset in between, so
+    it holds wherever the server iterates the body.
+
+    Args:
+        body: Response body iterable
+        identity: IdentityMap to activate
+    """
+    iterator = iter(body)
+    try:
+        while True:
+            token = _current.set(identity)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield chunk
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def within_identity_map(handler, *args, **kwargs):
+    """
+    Call a request handler inside an identity map
+
+    Streamed responses render their body after the handler returns; the
+    map stays active while it is generated.
+
+    Returns:
+        The handler's response
+    """
+    with identity_map() as identity:
+        response = handler(*args, **kwargs)
+    if getattr(response, 'is_streamed', False):
+        response.response = bind_identity_map(response.response, identity)
+    return response
+
+
+def canonicalize(results):
+    """
+    Replace query results with their mapped instances
+
+    Args:
+        results: A model, None, or an iterable of models (list or collection)
+
+    Returns:
+        The results, holding the canonical instances
+    """
+    identity = _current.get()
+    if identity is None or results is None:
+        return results
+    if hasattr(results, 'attributes') or not hasattr(results, '__iter__'):
+        return identity.add(results)
+    models = identity.canonical(list(results))
+    if isinstance(results, list):
+        results[:] = models
+        return results
+    return type(results)(models)
+
+
+class UsesIdentityMap:
+    """
+    Identity Map Concern
+
+    Model mixin consulting the active identity map in find(), query
+    results and relation loads, and keeping it current on save/delete.
+    Place it before Model in the bases.
+    """
+
+    @classmethod
+    def find(cls, key, *args, **kwargs):
+        """Find a model by primary key, from the identity map when loaded"""
+        identity = _current.get()
+        if identity is None:
+            return super().find(key, *args, **kwargs)
+        model = identity.get(cls, key)
+        if model is None:
+            model = super().find(key, *args, **kwargs)
+            if model is not None:
+                model = identity.add(model)
+        return model
+
+    @classmethod
+    def query(cls):
+        """Get a query builder whose results go through the identity map"""
+        query = super().query()
+        if _current.get() is None:
+            return query
+        from app.Support.Database.EagerLoading import EagerQuery
+        return EagerQuery(query, (), cls)
+
+    def save(self, *args, **kwargs):
+        """Save the model and make this instance the mapped one"""
+        result = super().save(*args, **kwargs)
+        identity = _current.get()
+        if identity is not None and result is not False:
+            identity.add(self, replace=True)
+        return result
+
+    def delete(self, *args, **kwargs):
+        """Delete the model and drop it from the identity map"""
+        result = super().delete(*args, **kwargs)
+        identity = _current.get()
+        if identity is not None:
+            identity.forget(self)
+        return result
@@ -0,0 +1,205 @@
+"""
+Query Cache
+
+Caches query result sets keyed by their compiled SQL and bindings::
+
+    Category.query().where('active', True).remember(600).get()
+    Tag.remember().order_by('name').get()
+
+Entries are tagged with the model's table (plus any joined tables passed
+to ``remember``). Models using CachesQueries flush their table's tag from
+their saved/deleted/restored events, so a write invalidates every cached
+query that read the table. Rows are cached, not model objects, and are
+hydrated into fresh models on every hit.
+
+Only model events invalidate: builder-level writes such as
+``Category.query().where(...).update({...})`` or ``.delete()`` fire no
+events, so call ``flush_tables('categories')`` after them.
+
+In a per-process store (memory) a write only flushes the writing
+worker's entries, so there the TTL is capped at ``local_ttl`` seconds.
+Under several prefork workers the shared sqlite store is the default.
+"""
+
+import hashlib
+
+
+def query_cache():
+    """Get the cache repository configured for query results, or None when disabled"""
+    from config.cache import get_cache_config
+    from app.Support.Cache import cache
+
+    config = get_cache_config()['queries']
+    if not config['enabled']:
+        return None
+    return cache(config['store'])
+
+
+def local_ttl():
+    """Get the longest TTL of query results in a per-process store"""
+    from config.cache import get_cache_config
+
+    return get_cache_config()['queries']['local_ttl']
+
+
+def effective_ttl(repository, ttl):
+    """
+    Get the TTL to store query results with
+
+    Per-process stores cannot be flushed by other workers, so their TTL
+    is capped at local_ttl().
+    """
+    if getattr(repository.store, 'shared', True):
+        return ttl
+    limit = local_ttl()
+    return limit if ttl is None else min(ttl, limit)
+
+
+def table_tags(tables):
+    """Get the cache tags of tables"""
+    return [f"table:{table}" for table in tables]
+
+
+def flush_tables(*tables, repository=None):
+    """Invalidate every cached query that read one of the tables"""
+    repository = repository if repository is not None else query_cache()
+    if repository is not None and tables:
+        repository.tags(*table_tags(tables)).flush()
+
+
+def cache_key(method, sql, bindings):
+    """
+    Build the cache key of a query
+
+    Args:
+        method: Terminal method ('get' or 'first')
+        sql: Compiled SQL
+        bindings: Bound values
+    """
+    digest = hashlib.sha1(f"{method}\x1f{sql}\x1f{bindings!r}".encode('utf-8')).hexdigest()
+    return f"query:{digest}"
+
+
+def hydrate(model_class, attributes):
+    """
+    Build a model from a cached row
+
+    Uses the ORM's new_from_builder() when available; otherwise the row
+    is assigned to a new instance's attributes without mass assignment.
+    """
+    attributes = dict(attributes)
+    new_from_builder = getattr(model_class, 'new_from_builder', None)
+    if new_from_builder is not None:
+        return new_from_builder(attributes)
+    model = model_class()
+    model.attributes.update(attributes)
+    if hasattr(model, 'exists'):
+        model.exists = True
+    if isinstance(getattr(model, 'original', None), dict):
+        model.original = dict(attributes)
+    return model
+
+
+def _rows(results):
+    if results is None:
+        return None
+    if hasattr(results, 'attributes'):
+        return dict(results.attributes)
+    return [dict(model.attributes) for model in results]
+
+
+class RememberedQuery:
+    """
+    Remembered Query
+
+    The caching options of a query and the logic running it through the
+    cache.
+    """
+
+    def __init__(self, model_class, ttl=None, tables=(), repository=None):
+        """
+        Args:
+            model_class: Model the query returns
+            ttl: Seconds to keep results (None until invalidated, capped
+                for per-process stores)
+            tables: Extra tables the query reads (joins)
+            repository: Cache repository (defaults to the configured one)
+        """
+        self.model_class = model_class
+        self.ttl = ttl
+        self.tables = [model_class.table] + [table for table in tables if table != model_class.table]
+        self.repository = repository
+
+    def run(self, query, method, *args, **kwargs):
+        """
+        Run a terminal method through the cache
+
+        Args:
+            query: Query builder (must provide to_sql() and get_bindings())
+            method: 'get' or 'first'
+
+        Returns:
+            Models, hydrated from the cache on a hit
+        """
+        repository = self.repository if self.repository is not None else query_cache()
+        if repository is None:
+            return getattr(query, method)(*args, **kwargs)
+
+        key = cache_key(method, query.to_sql(), query.get_bindings())
+        tagged = repository.tags(*table_tags(self.tables))
+        rows = tagged.get(key)
+        if rows is None:
+            results = getattr(query, method)(*args, **kwargs)
+            # Misses are cached as an empty marker so absent rows are remembered too
+            tagged.put(key, {'rows': _rows(results)}, effective_ttl(repository, self.ttl))
+            return results
+
+        rows = rows['rows']
+        if rows is None:
+            return None
+        if isinstance(rows, dict):
+            return hydrate(self.model_class, rows)
+        return [hydrate(self.model_class, row) for row in rows]
+
+
+class FlushQueryCache:
+    """Model observer flushing the model's table from the query cache"""
+
+    def saved(self, model):
+        flush_tables(model.table)
+
+    def deleted(self, model):
+        flush_tables(model.table)
+
+    def restored(self, model):
+        flush_tables(model.table)
+
+
+class CachesQueries:
+    """
+    Query Cache Concern
+
+    Model mixin adding remember() to its queries and registering the
+    FlushQueryCache observer. Place it before Model in the bases.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        observe = getattr(cls, 'observe', None)
+        if observe is not None:
+            observe(FlushQueryCache)
+
+    @classmethod
+    def query(cls):
+        """Get a query builder supporting remember()"""
+        from app.Support.Database.EagerLoading import EagerQuery
+
+        query = super().query()
+        if isinstance(query, EagerQuery):
+            return query
+        return EagerQuery(query, (), cls)
+
+    @classmethod
+    def remember(cls, ttl=None, tables=()):
+        """Start a query whose results are cached (see RememberedQuery)"""
+        return cls.query().remember(ttl, tables)
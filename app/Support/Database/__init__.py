@@ -0,0 +1,21 @@
+"""
+Database Package
+
+Query and model helpers layered over the Larapy ORM.
+"""
+
+from .IdentityMap import (
+    IdentityMap, UsesIdentityMap, current_identity_map, identity_map, within_identity_map,
+)
+from .EagerLoading import EagerLoading, EagerQuery, RelationNotFound, RelationSpec, eager_load
+from .QueryCache import CachesQueries, FlushQueryCache, flush_tables, query_cache
+from .Cursor import StreamsQueries, chunk_by_id, cursor, lazy_by_id
+from .BulkInsert import InsertsInBulk, bulk_insert, chunk_rows, model_rows
+
+__all__ = [
+    'EagerLoading', 'EagerQuery', 'RelationNotFound', 'RelationSpec', 'eager_load',
+    'IdentityMap', 'UsesIdentityMap', 'current_identity_map', 'identity_map', 'within_identity_map',
+    'CachesQueries', 'FlushQueryCache', 'flush_tables', 'query_cache',
+    'StreamsQueries', 'chunk_by_id', 'cursor', 'lazy_by_id',
+    'InsertsInBulk', 'bulk_insert', 'chunk_rows', 'model_rows',
+]
@@ -0,0 +1,237 @@
+"""
+Provider Repository
+
+Loads the application's service providers from a cached manifest.
+
+Eager providers are registered on every boot. Deferred providers (those
+whose ``is_deferred()`` is true) are neither imported nor registered at
+boot; a placeholder binding is added for each key in their ``provides()``
+instead, and the provider is registered and booted the first time one of
+those keys is resolved from the container.
+
+The manifest is written to ``bootstrap/cache/services.json`` and rebuilt
+whenever the configured provider list changes.
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+
+def provider_name(provider_class):
+    """Get the dotted path used to reference a provider class"""
+    return f"{provider_class.__module__}.{provider_class.__qualname__}"
+
+
+def load_provider_class(name, base_path=None):
+    """
+    Import a provider class from its dotted path
+
+    Falls back to loading the module from its file when the dotted path is
+    not importable, e.g. ``app.Providers.X`` is shadowed by ``app/Providers.py``.
+
+    Args:
+        name: Dotted 'module.ClassName' path
+        base_path: Project root used for the file fallback
+
+    Returns:
+        The provider class
+    """
+    module_name, _, class_name = name.rpartition('.')
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        file_path = Path(base_path or os.getcwd()).joinpath(*module_name.split('.')).with_suffix('.py')
+        if not file_path.exists():
+            raise
+        module = sys.modules.get(module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+    return getattr(module, class_name)
+
+
+class ProviderRepository:
+    """
+    Provider Repository
+
+    Registers eager providers and wires deferred providers into the
+    container from a cached manifest.
+    """
+
+    def __init__(self, app, manifest_path, base_path=None, profiler=None):
+        """
+        Args:
+            app: Application container (bind/register/resolve)
+            manifest_path: Location of the cached manifest
+            base_path: Project root used to locate provider files
+            profiler: Optional BootProfiler timing each provider
+        """
+        self.app = app
+        self.manifest_path = Path(manifest_path)
+        self.base_path = base_path
+        self.profiler = profiler
+        self.deferred = {}
+        self.loaded = {}
+        self._classes = {}
+        self._resolving = set()
+
+    def load(self, providers):
+        """
+        Register the application's providers
+
+        Args:
+            providers: Provider classes or dotted class paths, in order
+
+        Returns:
+            The manifest in use
+        """
+        names = []
+        for provider in providers:
+            if isinstance(provider, str):
+                names.append(provider)
+            else:
+                name = provider_name(provider)
+                self._classes[name] = provider
+                names.append(name)
+
+        manifest = self.load_manifest()
+        if manifest is None or manifest.get('providers') != names:
+            manifest = self.compile_manifest(names)
+            self.write_manifest(manifest)
+
+        for name in manifest['eager']:
+            self.register(name)
+
+        self.deferred = dict(manifest['deferred'])
+        for service in self.deferred:
+            self._bind_placeholder(service)
+
+        return manifest
+
+    def load_manifest(self):
+        """Read the cached manifest, or None when absent or unreadable"""
+        try:
+            with self.manifest_path.open('r', encoding='utf-8') as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or not {'providers', 'eager', 'deferred'} <= manifest.keys():
+            return None
+        return manifest
+
+    def compile_manifest(self, names):
+        """
+        Build the manifest by inspecting every provider
+
+        Args:
+            names: Provider class paths
+
+        Returns:
+            Manifest dictionary
+        """
+        manifest = {'providers': list(names), 'eager': [], 'deferred': {}, 'when': {}}
+
+        for name in names:
+            provider = self._make(name)
+            is_deferred = getattr(provider, 'is_deferred', None)
+            if is_deferred is None or not is_deferred():
+                manifest['eager'].append(name)
+                continue
+
+            for service in provider.provides():
+                manifest['deferred'][service] = name
+            when = provider.when() if hasattr(provider, 'when') else []
+            if when:
+                manifest['when'][name] = list(when)
+
+        return manifest
+
+    def write_manifest(self, manifest):
+        """Write the manifest atomically"""
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+            os.replace(temp_path, self.manifest_path)
+        except OSError:
+            # A read-only deploy still boots, it just compiles every time
+            pass
+
+    def clear(self):
+        """Delete the cached manifest"""
+        try:
+            self.manifest_path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def register(self, name):
+        """
+        Register a provider with the application once
+
+        Args:
+            name: Provider class path
+
+        Returns:
+            The registered provider instance
+        """
+        provider = self.loaded.get(name)
+        if provider is None:
+            phase = self.profiler.phase(name) if self.profiler else nullcontext()
+            with phase:
+                provider = self.loaded[name] = self._make(name)
+                self.app.register(provider)
+        return provider
+
+    def load_deferred(self, service):
+        """
+        Register the deferred provider offering a service
+
+        Args:
+            service: Container key
+
+        Returns:
+            True if a provider was registered
+        """
+        name = self.deferred.get(service)
+        if name is None or name in self.loaded:
+            return False
+
+        self.register(name)
+        # Every service of the provider is now bound for real
+        for key, owner in list(self.deferred.items()):
+            if owner == name:
+                del self.deferred[key]
+        return True
+
+    def _bind_placeholder(self, service):
+        provider = self.deferred[service]
+
+        def resolve_deferred(app):
+            if service in self._resolving:
+                raise LookupError(f"Deferred provider {provider} did not bind '{service}'")
+            self._resolving.add(service)
+            try:
+                self.load_deferred(service)
+                return self.app.resolve(service)
+            finally:
+                self._resolving.discard(service)
+
+        self.app.bind(service, resolve_deferred)
+
+    def _make(self, name):
+        provider_class = self._classes.get(name)
+        if provider_class is None:
+            provider_class = self._classes[name] = load_provider_class(name, self.base_path)
+        return provider_class(self.app)
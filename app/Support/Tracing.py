@@ -0,0 +1,311 @@
+"""
+Tracing
+
+Per-request tracing context kept in a ``contextvars`` slot, so logging,
+database queries and template rendering can attribute their work to the
+current request without passing it around::
+
+    with measure('db'):
+        rows = connection.select(sql)
+
+Phases are timed with ``perf_counter_ns`` and reported in a Server-Timing
+header by the tracing middleware. Headers are sent before a streamed body
+renders, so for streamed responses the header covers the work done up to
+the first chunk only; the body is timed by trace_body() and the complete
+timing is logged once it has been sent. IDs come from a per-process counter
+under a random prefix instead of uuid4(); they follow W3C Trace Context,
+so an incoming ``traceparent`` is continued rather than replaced.
+"""
+
+import contextlib
+import contextvars
+import functools
+import itertools
+import logging
+import os
+import re
+import time
+
+
+logger = logging.getLogger(__name__)
+
+current_trace = contextvars.ContextVar('current_trace', default=None)
+
+# Phase order in the Server-Timing header; other phases follow
+PHASES = ('middleware', 'controller', 'db', 'render')
+
+TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+
+# Incoming X-Request-ID values are only honored when they are this safe
+REQUEST_ID = re.compile(r'^[A-Za-z0-9._:-]{1,128}$')
+
+_END = object()
+
+
+class _IdGenerator:
+    """Monotonic trace and span IDs, reseeded in every forked worker"""
+
+    def __init__(self):
+        self.pid = None
+
+    def _seed(self):
+        self.pid = os.getpid()
+        self.prefix = os.urandom(8).hex()
+        self.counter = itertools.count(1)
+
+    def next(self):
+        """
+        Returns:
+            (trace id, span id) as 32 and 16 lowercase hex digits
+        """
+        if self.pid != os.getpid():
+            self._seed()
+        sequence = next(self.counter)
+        return f"{self.prefix}{sequence:016x}", f"{self.prefix[:8]}{sequence & 0xffffffff:08x}"
+
+
+_ids = _IdGenerator()
+
+
+class Trace:
+    """
+    Trace
+
+    The tracing context of one request: its IDs and the time spent in
+    each phase.
+    """
+
+    __slots__ = ('request_id', 'trace_id', 'span_id', 'parent_id', 'flags', 'start_ns',
+                 'durations', 'counts', '_started')
+
+    def __init__(self, request_id=None, traceparent=None):
+        """
+        Args:
+            request_id: Incoming X-Request-ID header
+            traceparent: Incoming traceparent header
+        """
+        trace_id, self.span_id = _ids.next()
+        self.parent_id = None
+        self.flags = '01'
+
+        match = TRACEPARENT.match(traceparent.strip().lower()) if traceparent else None
+        if match and match.group(1) != '0' * 32 and match.group(2) != '0' * 16:
+            trace_id, self.parent_id, self.flags = match.groups()
+
+        self.trace_id = trace_id
+        self.request_id = request_id if request_id and REQUEST_ID.match(request_id) else trace_id
+        self.start_ns = time.perf_counter_ns()
+        self.durations = {}
+        self.counts = {}
+        self._started = {}
+
+    def add(self, phase, duration_ns):
+        """Add time spent in a phase"""
+        self.durations[phase] = self.durations.get(phase, 0) + duration_ns
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def begin(self, phase):
+        """Start timing a phase (paired with end())"""
+        self._started[phase] = time.perf_counter_ns()
+
+    def end(self, phase):
+        """Stop timing a phase started with begin()"""
+        started = self._started.pop(phase, None)
+        if started is not None:
+            self.add(phase, time.perf_counter_ns() - started)
+
+    def elapsed_ns(self):
+        """Time since the trace started"""
+        return time.perf_counter_ns() - self.start_ns
+
+    def traceparent(self):
+        """Get the traceparent header for outgoing requests made on behalf of this one"""
+        return f"00-{self.trace_id}-{self.span_id}-{self.flags}"
+
+    def server_timing(self, total_ns=None):
+        """
+        Build the Server-Timing header value
+
+        Time not spent in the controller is reported as 'middleware'.
+
+        Args:
+            total_ns: Total duration (defaults to the time elapsed so far)
+        """
+        total_ns = self.elapsed_ns() if total_ns is None else total_ns
+        durations = dict(self.durations)
+        if 'controller' in durations:
+            durations['middleware'] = max(0, total_ns - durations['controller'])
+
+        metrics = [f"total;dur={total_ns / 1e6:.2f}"]
+        for phase in PHASES + tuple(sorted(set(durations) - set(PHASES))):
+            if phase not in durations:
+                continue
+            metric = f"{phase};dur={durations[phase] / 1e6:.2f}"
+            if phase == 'db':
+                metric += f';desc="{self.counts[phase]} queries"'
+            metrics.append(metric)
+        return ', '.join(metrics)
+
+
+def start_trace(request_id=None, traceparent=None):
+    """
+    Start tracing the current request
+
+    Returns:
+        (trace, token) where token is passed to end_trace()
+    """
+    trace = Trace(request_id, traceparent)
+    return trace, current_trace.set(trace)
+
+
+def end_trace(token):
+    """Leave the tracing context entered with start_trace()"""
+    current_trace.reset(token)
+
+
+def current_request_id():
+    """Get the ID of the request being handled, or None outside a request"""
+    trace = current_trace.get()
+    return trace.request_id if trace is not None else None
+
+
+@contextlib.contextmanager
+def _measure(trace, phase):
+    started = time.perf_counter_ns()
+    try:
+        yield trace
+    finally:
+        trace.add(phase, time.perf_counter_ns() - started)
+
+
+def measure(phase):
+    """
+    Time a block of work as a phase of the current request
+
+    Outside a traced request this does nothing.
+
+    Args:
+        phase: Phase name, e.g. 'db' or 'render'
+    """
+    trace = current_trace.get()
+    if trace is None:
+        return contextlib.nullcontext()
+    return _measure(trace, phase)
+
+
+def traced(function, phase='controller'):
+    """
+    Wrap a callable so its calls are timed as a phase
+
+    Args:
+        function: Callable to wrap (e.g. a route handler)
+        phase: Phase name
+
+    Returns:
+        Wrapper carrying the callable's name and attributes
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        trace = current_trace.get()
+        if trace is None:
+            return function(*args, **kwargs)
+        with _measure(trace, phase):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument(target, methods, phase='db'):
+    """
+    Time calls of an object's methods as a phase
+
+    Methods the object does not have are skipped.
+
+    Args:
+        target: Object to instrument (e.g. the database manager)
+        methods: Method names, e.g. ('select', 'insert')
+        phase: Phase name
+
+    Returns:
+        Names of the instrumented methods
+    """
+    instrumented = []
+    for name in methods:
+        method = getattr(target, name, None)
+        if callable(method) and not hasattr(method, '__wrapped__'):
+            setattr(target, name, traced(method, phase))
+            instrumented.append(name)
+    return instrumented
+
+
+def trace_body(body, trace, phase='render'):
+    """
+    Time a streamed response body as a phase of its trace
+
+    Each chunk is produced inside the trace's context, so queries run by
+    the template still count as 'db'. The complete Server-Timing value is
+    logged at debug level once the body has been sent.
+
+    Args:
+        body: Response body iterable
+        trace: Trace of the request
+        phase: Phase the body's production is added to
+
+    Yields:
+        The body's chunks
+    """
+    iterator = iter(body)
+    elapsed = 0
+    try:
+        while True:
+            token = current_trace.set(trace)
+            started = time.perf_counter_ns()
+            try:
+                chunk = next(iterator, _END)
+            finally:
+                elapsed += time.perf_counter_ns() - started
+                current_trace.reset(token)
+            if chunk is _END:
+                break
+            yield chunk
+    finally:
+        trace.add(phase, elapsed)
+        logger.debug("Streamed %s: %s", trace.request_id, trace.server_timing())
+        close = getattr(body, 'close', None)
+        if close is not None:
+            close()
+
+
+def trace_template_rendering(flask_app):
+    """
+    Time template rendering through Flask's template signals
+
+    Covers render_template() as well as view().render().
+
+    Args:
+        flask_app: Flask application
+    """
+    from flask import before_render_template, template_rendered
+
+    def started(sender, **extra):
+        trace = current_trace.get()
+        if trace is not None:
+            trace.begin('render')
+
+    def finished(sender, **extra):
+        trace = current_trace.get()
+        if trace is not None:
+            trace.end('render')
+
+    before_render_template.connect(started, flask_app, weak=False)
+    template_rendered.connect(finished, flask_app, weak=False)
+
+
+class TraceLogFilter(logging.Filter):
+    """Adds ``request_id`` and ``trace_id`` to log records ('-' outside requests)"""
+
+    def filter(self, record):
+        trace = current_trace.get()
+        record.request_id = trace.request_id if trace is not None else '-'
+        record.trace_id = trace.trace_id if trace is not None else '-'
+        return True
@@ -0,0 +1 @@
+"""Support utilities shared across the application"""
@@ -0,0 +1,74 @@
+"""
+Fragment Cache
+
+Jinja ``{% cache %}`` tag caching the rendered output of a template block::
+
+    {% cache 'partials.nav', 3600 %}...{% endcache %}
+    {% cache 'profile.card', 600, vary=[user.id, locale], tags=['users'] %}...{% endcache %}
+
+The key, TTL (seconds, None for no expiry), ``vary`` values and ``tags``
+are all template expressions. Tagged fragments are invalidated with
+``cache().tags('users').flush()``, e.g. from a model observer.
+"""
+
+import hashlib
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Fragment Cache Extension
+
+    The cache repository is read from ``environment.fragment_cache``; when
+    it is None the block is rendered every time.
+    """
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        kwargs = []
+
+        while parser.stream.skip_if('comma'):
+            if parser.stream.current.type == 'name' and parser.stream.look().type == 'assign':
+                name = parser.stream.expect('name').value
+                parser.stream.expect('assign')
+                kwargs.append(nodes.Keyword(name, parser.parse_expression()))
+            else:
+                args.append(parser.parse_expression())
+
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(self.call_method('_render', args, kwargs), [], [], body).set_lineno(lineno)
+
+    @staticmethod
+    def fragment_key(key, vary=None):
+        """Build the cache key of a fragment from its name and vary values"""
+        if not vary:
+            return f"fragment:{key}"
+        if isinstance(vary, (str, int)):
+            vary = [vary]
+        digest = hashlib.sha1('\x1f'.join(str(value) for value in vary).encode('utf-8')).hexdigest()
+        return f"fragment:{key}:{digest}"
+
+    def _render(self, key, ttl=None, vary=None, tags=None, caller=None):
+        repository = self.environment.fragment_cache
+        if repository is None:
+            return caller()
+
+        if tags:
+            repository = repository.tags(*([tags] if isinstance(tags, str) else tags))
+
+        fragment_key = self.fragment_key(key, vary)
+        html = repository.get(fragment_key)
+        if html is None:
+            html = str(caller())
+            repository.put(fragment_key, html, ttl)
+        return Markup(html)
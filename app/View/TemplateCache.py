@@ -0,0 +1,99 @@
+"""
+Template Cache
+
+Compiled template caching for the Jinja environment used by the views.
+
+Two layers are used:
+
+- A filesystem bytecode cache shared by all workers, so a template is
+  compiled once per deploy instead of once per process.
+- A precompiled template archive written by ``larapy view:cache``. When it
+  exists and auto-reload is off, templates are imported from it without
+  reading or parsing any source.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, ModuleLoader
+
+
+def configure_template_cache(jinja_env, view_config, debug=False):
+    """
+    Configure bytecode caching, auto-reload and the precompiled archive
+
+    Args:
+        jinja_env: The Flask application's Jinja environment
+        view_config: View configuration (config/view.py)
+        debug: Whether the application runs in debug mode
+    """
+    compiled = view_config['compiled']
+
+    auto_reload = view_config['auto_reload']
+    jinja_env.auto_reload = debug if auto_reload is None else auto_reload
+
+    if view_config['bytecode_cache']:
+        bytecode_path = Path(compiled['bytecode'])
+        bytecode_path.mkdir(parents=True, exist_ok=True)
+        jinja_env.bytecode_cache = FileSystemBytecodeCache(str(bytecode_path), '%s.cache')
+
+    # Precompiled templates would hide edits, so only use them without reload
+    archive = compiled['archive']
+    if not jinja_env.auto_reload and os.path.exists(archive):
+        jinja_env.loader = ChoiceLoader([ModuleLoader(archive), jinja_env.loader])
+
+
+def compile_views(jinja_env, archive):
+    """
+    Precompile every template into a deployable archive
+
+    Args:
+        jinja_env: Jinja environment whose loader lists the templates
+        archive: Target zip file
+
+    Returns:
+        Number of templates compiled
+
+    Raises:
+        jinja2.TemplateSyntaxError: If a template does not compile
+    """
+    names = [name for name in jinja_env.list_templates() if name.endswith('.html')]
+
+    Path(archive).parent.mkdir(parents=True, exist_ok=True)
+    temp_archive = f"{archive}.{os.getpid()}.tmp"
+    try:
+        jinja_env.compile_templates(
+            temp_archive,
+            zip='deflated',
+            filter_func=lambda name: name.endswith('.html'),
+            ignore_errors=False,
+        )
+        os.replace(temp_archive, archive)
+    finally:
+        if os.path.exists(temp_archive):
+            os.unlink(temp_archive)
+    return len(names)
+
+
+def clear_compiled_views(view_config):
+    """
+    Remove the precompiled archive and the bytecode cache
+
+    Returns:
+        True if anything was removed
+    """
+    compiled = view_config['compiled']
+    removed = False
+
+    try:
+        os.unlink(compiled['archive'])
+        removed = True
+    except FileNotFoundError:
+        pass
+
+    if os.path.isdir(compiled['bytecode']):
+        shutil.rmtree(compiled['bytecode'])
+        removed = True
+
+    return removed
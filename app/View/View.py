@@ -0,0 +1,158 @@
+"""
+View
+
+``view()`` helper rendering templates either as a complete string or as a
+streamed response produced by Jinja's ``generate()``.
+
+Streaming sends the document in chunks while the template is still being
+rendered: everything up to ``</head>`` is flushed at once so the browser
+starts fetching stylesheets and scripts, then the body follows in chunks of
+``buffer_size`` bytes (e.g. a few rows of a long list at a time).
+
+Flask saves the session before a streamed body runs, so ``stream()``
+renders the first chunk (up to ``</head>``) and pops flashed messages
+before returning: the CSRF token ``csrf_meta()`` creates in the layout's
+head is kept on a first visit. Session writes further down a streamed
+template are lost; render such pages with ``render()``.
+
+Once streaming has started the status code and headers are sent, so an
+error raised by the template truncates the response instead of producing
+an error page. Load data in the controller, not lazily in the template.
+"""
+
+import itertools
+
+
+# Markers after which buffered output is flushed immediately
+FLUSH_AFTER = ('</head>',)
+
+
+def buffer_chunks(chunks, buffer_size=8192, flush_after=FLUSH_AFTER):
+    """
+    Group small rendered chunks into larger writes
+
+    Args:
+        chunks: Iterable of strings (Jinja's template.generate())
+        buffer_size: Flush once this many characters are buffered
+        flush_after: Markers that force a flush as soon as they are rendered
+
+    Yields:
+        UTF-8 encoded chunks
+    """
+    buffer = []
+    buffered = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer.append(chunk)
+        buffered += len(chunk)
+
+        if buffered >= buffer_size or any(marker in chunk for marker in flush_after):
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+class View:
+    """
+    View
+
+    A template and its context, rendered on demand.
+    """
+
+    def __init__(self, template, context):
+        """
+        Args:
+            template: Template name (or list of names to select from)
+            context: Template variables
+        """
+        self.template = template
+        self.context = context
+
+    def with_(self, **context):
+        """Add variables to the view's context"""
+        self.context.update(context)
+        return self
+
+    def _prepare(self):
+        from flask import current_app
+
+        app = current_app._get_current_object()
+        template = app.jinja_env.get_or_select_template(self.template)
+        context = dict(self.context)
+        app.update_template_context(context)
+        return app, template, context
+
+    def render(self):
+        """Render the complete template to a string"""
+        from flask import before_render_template, template_rendered
+
+        app, template, context = self._prepare()
+        before_render_template.send(app, template=template, context=context)
+        html = template.render(context)
+        template_rendered.send(app, template=template, context=context)
+        return html
+
+    def stream(self, status=200, headers=None, buffer_size=8192):
+        """
+        Render the template as a streamed response
+
+        Args:
+            status: Response status code
+            headers: Extra response headers
+            buffer_size: Characters buffered between flushes
+
+        Returns:
+            Flask response whose body is generated while it is sent
+        """
+        from flask import Response, get_flashed_messages, stream_with_context
+
+        app, template, context = self._prepare()
+        # Session writes must happen before the response is returned:
+        # get_flashed_messages() caches the popped messages for the template
+        get_flashed_messages()
+        chunks = buffer_chunks(template.generate(context), buffer_size)
+        head = list(itertools.islice(chunks, 1))
+
+        def body():
+            yield from head
+            yield from chunks
+
+        return Response(
+            stream_with_context(body()),
+            status=status,
+            headers=headers,
+            mimetype='text/html',
+        )
+
+    def __str__(self):
+        return self.render()
+
+    def __html__(self):
+        return self.render()
+
+
+def view(template, **context):
+    """
+    Create a view
+
+    Example:
+        return view('posts/index.html', posts=posts).stream()
+
+    Args:
+        template: Template name
+        context: Template variables
+
+    Returns:
+        View
+    """
+    return View(template, context)
+
+
+def render_stream(template, **context):
+    """Render a template as a streamed response (shortcut for view().stream())"""
+    return View(template, context).stream()
@@ -0,0 +1,172 @@
+"""
+Vite
+
+Memoized replacement for the view engine's ``vite()`` Jinja global.
+
+The build manifest is parsed once per process and the rendered tags are
+cached per entry list. In debug mode the manifest's mtime is checked on
+every call so rebuilds are picked up; in production it is never re-read.
+"""
+
+import json
+import os
+import threading
+from html import escape
+
+
+class Vite:
+    """
+    Vite
+
+    Renders the tags for Vite entry points from the build manifest,
+    including ``modulepreload`` links for every statically imported chunk.
+    """
+
+    def __init__(self, manifest_path, build_url='/build/', hot_file=None, check_mtime=False, fallback=None):
+        """
+        Args:
+            manifest_path: Path of public/build/.vite/manifest.json
+            build_url: Public URL prefix of the build directory
+            hot_file: File present while the Vite dev server runs
+            check_mtime: Reload the manifest when it changes (debug only)
+            fallback: Original vite() helper, used with the dev server or
+                when no manifest has been built
+        """
+        self.manifest_path = manifest_path
+        self.build_url = build_url.rstrip('/') + '/'
+        self.hot_file = hot_file
+        self.check_mtime = check_mtime
+        self.fallback = fallback
+
+        self._manifest = None
+        self._mtime = None
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, entries):
+        """
+        Render the tags for one or more entry points (Jinja global)
+
+        Args:
+            entries: Entry path or list of entry paths, e.g.
+                ['resources/css/app.css', 'resources/js/app.js']
+
+        Returns:
+            Markup with the link and script tags
+        """
+        from markupsafe import Markup
+
+        if self.fallback and self.check_mtime and self.hot_file and os.path.exists(self.hot_file):
+            return self.fallback(entries)
+
+        html = self.tags(entries)
+        if html is None:
+            return self.fallback(entries) if self.fallback else Markup('')
+        return Markup(html)
+
+    def manifest(self):
+        """
+        Get the parsed manifest, loading it on first use
+
+        Returns:
+            Manifest dictionary, or None when the build is missing
+        """
+        if self.check_mtime:
+            try:
+                mtime = os.stat(self.manifest_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != self._mtime:
+                with self._lock:
+                    self._load()
+                    self._mtime = mtime
+        elif self._mtime is None:
+            with self._lock:
+                if self._mtime is None:
+                    self._load()
+                    self._mtime = True
+
+        return self._manifest
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as handle:
+                self._manifest = json.load(handle)
+        except (OSError, ValueError):
+            self._manifest = None
+        self._tags = {}
+
+    def tags(self, entries):
+        """
+        Render the tags for entry points, cached per entry list
+
+        Returns:
+            HTML string, or None when there is no manifest
+        """
+        if isinstance(entries, str):
+            entries = [entries]
+        key = tuple(entries)
+
+        manifest = self.manifest()
+        if manifest is None:
+            return None
+
+        html = self._tags.get(key)
+        if html is None:
+            html = self._tags[key] = self.render(manifest, key)
+        return html
+
+    def render(self, manifest, entries):
+        """
+        Render preload, stylesheet and script tags for entry points
+
+        Args:
+            manifest: Parsed Vite manifest
+            entries: Entry paths
+
+        Returns:
+            HTML string: modulepreloads, then stylesheets, then scripts
+
+        Raises:
+            KeyError: If an entry is not in the manifest
+        """
+        preloads, styles, scripts = [], [], []
+        seen = set()
+
+        def add_css(chunk):
+            for css in chunk.get('css', ()):
+                if css not in seen:
+                    seen.add(css)
+                    styles.append(css)
+
+        def add_imports(chunk):
+            for name in chunk.get('imports', ()):
+                imported = manifest[name]
+                if imported['file'] in seen:
+                    continue
+                seen.add(imported['file'])
+                preloads.append(imported['file'])
+                add_css(imported)
+                add_imports(imported)
+
+        for entry in entries:
+            if entry not in manifest:
+                raise KeyError(f"Unable to locate file in Vite manifest: {entry}")
+            chunk = manifest[entry]
+            if chunk['file'] in seen:
+                continue
+            seen.add(chunk['file'])
+
+            if chunk['file'].endswith('.css'):
+                styles.append(chunk['file'])
+            else:
+                scripts.append(chunk['file'])
+            add_css(chunk)
+            add_imports(chunk)
+
+        url = lambda file: escape(self.build_url + file)
+        return '\n'.join(
+            [f'<link rel="modulepreload" href="{url(file)}">' for file in preloads]
+            + [f'<link rel="stylesheet" href="{url(file)}">' for file in styles]
+            + [f'<script type="module" src="{url(file)}"></script>' for file in scripts]
+        )
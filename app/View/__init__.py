@@ -0,0 +1,10 @@
+"""
+View Package
+
+Application-side extensions of the Larapy view engine.
+"""
+
+from .Vite import Vite
+from .View import View, view, render_stream
+
+__all__ = ['Vite', 'View', 'view', 'render_stream']
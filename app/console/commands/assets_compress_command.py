@@ -0,0 +1,43 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class AssetsCompressCommand(Command):
+    """
+    Precompress the built assets
+    """
+
+    signature = ("assets:compress {--min-size=1024 : Skip files smaller than this many bytes} "
+                 "{--force : Recompress files that already have compressed siblings}")
+    description = "Write .br/.gz siblings and the asset digest index for public/build"
+
+    def handle(self) -> int:
+        """Execute the assets:compress command"""
+        from config.server import get_server_config
+        from app.Http.StaticAssets import brotli, compress_assets
+
+        build_path = get_server_config()['assets']['path']
+        if not os.path.isdir(build_path):
+            self.error(f"Build directory not found: {build_path} (run `npm run build` first)")
+            return 1
+
+        if brotli is None:
+            self.comment("brotli is not installed, only .gz files will be written")
+
+        written = compress_assets(
+            build_path,
+            min_size=int(self.option('min-size') or 1024),
+            force=self.option('force', False),
+        )
+        self.success(f"Compressed {len(written)} files in {build_path}")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "assets:compress"
@@ -0,0 +1,61 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class BootProfileCommand(Command):
+    """
+    Profile application boot time
+    """
+
+    signature = ("boot:profile {--limit=25 : Number of slowest imports to list} "
+                 "{--json : Print the report as JSON} "
+                 "{--output= : Also write the JSON report to this file}")
+    description = "Boot the application in a fresh process and report phase and import timings"
+
+    def handle(self) -> int:
+        """Execute the boot:profile command"""
+        import json
+        import subprocess
+        import tempfile
+
+        from bootstrap.profiler import BootProfiler
+
+        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, 'boot-profile.json')
+            env = dict(os.environ, LARAPY_BOOT_PROFILE='1', LARAPY_BOOT_PROFILE_OUTPUT=report_path)
+
+            # A fresh interpreter, since this process has already imported most modules
+            result = subprocess.run(
+                [sys.executable, '-c', 'import bootstrap.app'],
+                cwd=base_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            )
+            if result.returncode != 0 or not os.path.exists(report_path):
+                self.error("Application failed to boot:")
+                self.line(result.stderr)
+                return 1
+
+            with open(report_path, 'r', encoding='utf-8') as handle:
+                report = json.load(handle)
+
+        if self.option('output'):
+            with open(self.option('output'), 'w', encoding='utf-8') as handle:
+                json.dump(report, handle, indent=2)
+
+        if self.option('json', False):
+            self.line(json.dumps(report, indent=2))
+        else:
+            self.line(BootProfiler().format_report(report, limit=int(self.option('limit') or 25)))
+
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "boot:profile"
@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class ProviderClearCommand(Command):
+    """
+    Remove the cached service provider manifest
+    """
+
+    signature = "provider:clear"
+    description = "Remove the cached service provider manifest"
+
+    def handle(self) -> int:
+        """Execute the provider:clear command"""
+        from config.app import get_app_config
+        from app.Support.ProviderRepository import ProviderRepository
+
+        repository = ProviderRepository(None, get_app_config()['services_manifest'])
+        if repository.clear():
+            self.success("Service provider manifest cleared")
+        else:
+            self.info("No service provider manifest to clear")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "provider:clear"
@@ -0,0 +1,32 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class RouteClearCommand(Command):
+    """
+    Remove the route cache file
+    """
+
+    signature = "route:clear"
+    description = "Remove the route manifest"
+
+    def handle(self) -> int:
+        """Execute the route:clear command"""
+        from config.app import get_app_config
+        from app.Http.RouteCache import clear_manifest
+
+        if clear_manifest(get_app_config()['routes_manifest']):
+            self.success("Route cache cleared")
+        else:
+            self.info("No route cache to clear")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "route:clear"
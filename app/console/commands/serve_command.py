@@ -0,0 +1,46 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class ServeCommand(Command):
+    """
+    Serve the application
+    """
+
+    signature = ("serve {--host= : The host address to serve on} {--port= : The port to serve on} "
+                 "{--production : Run the preforking production server} "
+                 "{--workers= : Number of worker processes (production)} "
+                 "{--max-requests= : Recycle workers after this many requests (production)}")
+    description = "Serve the application with the development or production server"
+
+    def handle(self) -> int:
+        """Execute the serve command"""
+        host = self.option('host')
+        port = self.option('port')
+
+        if self.option('production', False):
+            from bootstrap.server import serve
+
+            self.info("Starting Larapy production server...")
+            return serve(
+                host=host,
+                port=port,
+                workers=self.option('workers'),
+                max_requests=self.option('max-requests'),
+            )
+
+        from bootstrap.app import app
+
+        self.info("Starting Larapy development server...")
+        app.flask_app.run(host=host or '127.0.0.1', port=int(port or 5000), debug=True)
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "serve"
@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class UsersExportCommand(Command):
+    """
+    Export every user without loading the table into memory
+    """
+
+    signature = ("users:export {path? : Output file (stdout when omitted)} "
+                 "{--format=csv : csv or jsonl} "
+                 "{--chunk=1000 : Rows fetched per round trip} "
+                 "{--by-id : Page with keyset queries instead of one server-side cursor} "
+                 "{--with-trashed : Include soft deleted users}")
+    description = "Stream the users table to CSV or JSON lines"
+
+    def handle(self) -> int:
+        """Execute the users:export command"""
+        import csv
+        from bootstrap.app import app  # noqa: F401 (boots the database)
+        from app.Http.Json import dumps
+        from app.Models.User import User
+
+        export_format = (self.option('format') or 'csv').lower()
+        if export_format not in ('csv', 'jsonl'):
+            self.error(f"Unknown format: {export_format} (expected csv or jsonl)")
+            return 1
+
+        chunk = int(self.option('chunk') or 1000)
+        query = User.with_trashed() if self.option('with-trashed', False) else None
+        if self.option('by-id', False):
+            users = User.lazy_by_id(chunk, query=query)
+        else:
+            users = User.cursor(query, fetch_size=chunk)
+
+        path = self.argument('path')
+        handle = open(path, 'w', encoding='utf-8', newline='') if path else sys.stdout
+        count = 0
+        try:
+            writer = None
+            for user in users:
+                row = user.to_dict()
+                if export_format == 'jsonl':
+                    handle.write(dumps(row).decode('utf-8') + '\n')
+                else:
+                    if writer is None:
+                        writer = csv.DictWriter(handle, fieldnames=list(row), extrasaction='ignore')
+                        writer.writeheader()
+                    writer.writerow(row)
+                count += 1
+        finally:
+            if path:
+                handle.close()
+
+        if path:
+            self.success(f"Exported {count} users to {path}")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "users:export"
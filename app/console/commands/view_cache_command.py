@@ -0,0 +1,42 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class ViewCacheCommand(Command):
+    """
+    Compile all of the application's templates
+    """
+
+    signature = "view:cache"
+    description = "Precompile all templates under resources/views into a deployable archive"
+
+    def handle(self) -> int:
+        """Execute the view:cache command"""
+        from jinja2 import TemplateSyntaxError
+        from config.view import get_view_config
+        from app.View.TemplateCache import clear_compiled_views, compile_views
+
+        view_config = get_view_config()
+
+        # Boot against the template sources, not a previous archive
+        clear_compiled_views(view_config)
+        from bootstrap.app import app
+
+        try:
+            count = compile_views(app.flask_app.jinja_env, view_config['compiled']['archive'])
+        except TemplateSyntaxError as error:
+            self.error(f"{error.filename or error.name}:{error.lineno}: {error.message}")
+            return 1
+
+        self.success(f"Compiled {count} templates to {view_config['compiled']['archive']}")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "view:cache"
@@ -0,0 +1,32 @@
+import sys
+import os
+
+# Add the package to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'package-larapy'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from larapy.console.command import Command
+
+
+class ViewClearCommand(Command):
+    """
+    Clear all compiled view files
+    """
+
+    signature = "view:clear"
+    description = "Remove the precompiled template archive and bytecode cache"
+
+    def handle(self) -> int:
+        """Execute the view:clear command"""
+        from config.view import get_view_config
+        from app.View.TemplateCache import clear_compiled_views
+
+        if clear_compiled_views(get_view_config()):
+            self.success("Compiled views cleared")
+        else:
+            self.info("No compiled views to clear")
+        return 0
+
+    def get_name(self) -> str:
+        """Get the command name"""
+        return "view:clear"
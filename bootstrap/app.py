@@ -9,12 +9,17 @@ import os
 import sys
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Time imports and boot phases when LARAPY_BOOT_PROFILE is set
+from bootstrap.profiler import boot_profiler
+boot_profiler.start()
+
+from dotenv import load_dotenv
+
 # Load environment variables
 load_dotenv(project_root / '.env')
 
@@ -22,7 +27,6 @@ from larapy.foundation.application import Application
 from larapy.support.facades.facade import Facade
 from larapy.database.orm import DatabaseManager, Schema
 from larapy.view.engine import ViewEngine
-from app.Providers import AppServiceProvider
 
 
 def create_application():
@@ -30,33 +34,48 @@ def create_application():
     Create and configure the Larapy application instance
     """
     # Create application with base path
-    app = Application(str(project_root))
+    with boot_profiler.phase('Application'):
+        app = Application(str(project_root))
     
     # Configure Flask app with environment variables
-    configure_flask_app(app)
+    with boot_profiler.phase('configure_flask_app'):
+        configure_flask_app(app)
     
     # Set up facades
     Facade.set_facade_application(app)
     
     # Set up view engine
-    view_engine = ViewEngine()
-    view_engine.init_app(app.flask_app, str(project_root))
-    app.instance('view_engine', view_engine)
+    with boot_profiler.phase('ViewEngine'):
+        view_engine = ViewEngine()
+        view_engine.init_app(app.flask_app, str(project_root))
+        app.instance('view_engine', view_engine)
+        setup_view_helpers(app)
     
-    # Register core service providers
-    app.register(AppServiceProvider(app))
+    # Register service providers (deferred ones load on first resolve)
+    with boot_profiler.phase('register_providers'):
+        register_providers(app)
     
     # Set up database
-    setup_database(app)
+    with boot_profiler.phase('setup_database'):
+        setup_database(app)
     
     # Load routes
-    load_routes(app)
+    with boot_profiler.phase('load_routes'):
+        load_routes(app)
 
     # Configure static file serving for build assets
-    setup_static_assets(app)
+    with boot_profiler.phase('setup_static_assets'):
+        setup_static_assets(app)
 
     # Setup security middleware
-    setup_security_middleware(app)
+    with boot_profiler.phase('setup_security_middleware'):
+        setup_security_middleware(app)
+
+    # ETags and 304s for JSON responses
+    with boot_profiler.phase('setup_conditional_responses'):
+        setup_conditional_responses(app)
+
+    boot_profiler.finish()
 
     return app
 
@@ -75,6 +94,11 @@ def configure_flask_app(app):
         flask_app.secret_key = secrets.token_urlsafe(32)
         print("Warning: APP_KEY not set in .env, using generated key")
     
+    # Serialize dict/list responses with the fast JSON provider
+    from config.app import get_app_config
+    from app.Http.JsonProvider import install_json_provider
+    install_json_provider(flask_app, iso_dates=get_app_config()['json_iso_dates'])
+    
     # Set debug mode
     flask_app.debug = os.getenv('APP_DEBUG', 'false').lower() == 'true'
     
@@ -84,7 +108,8 @@ def configure_flask_app(app):
     flask_app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
     
     # Configure logging
-    setup_logging(app)
+    with boot_profiler.phase('setup_logging'):
+        setup_logging(app)
 
 
 def setup_logging(app):
@@ -95,13 +120,20 @@ def setup_logging(app):
     
     # Configure logging
     log_file = logs_dir / 'larapy.log'
+    handlers = [
+        logging.FileHandler(str(log_file)),
+        logging.StreamHandler()
+    ]
+    
+    # Tag every record with the ID of the request being handled
+    from app.Support.Tracing import TraceLogFilter
+    for handler in handlers:
+        handler.addFilter(TraceLogFilter())
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.FileHandler(str(log_file)),
-            logging.StreamHandler()
-        ]
+        format='%(asctime)s [%(levelname)s] [%(request_id)s] %(name)s: %(message)s',
+        handlers=handlers
     )
     
     # Set Flask app logger
@@ -109,6 +141,57 @@ def setup_logging(app):
     app.flask_app.logger.setLevel(logging.INFO)
 
 
+def setup_view_helpers(app):
+    """Configure template caching and replace view helpers with memoized versions"""
+    from config.view import get_view_config
+    from app.View import Vite
+    from app.View.TemplateCache import configure_template_cache
+
+    view_config = get_view_config()
+    jinja_env = app.flask_app.jinja_env
+    jinja_globals = jinja_env.globals
+    vite_config = view_config['vite']
+
+    # {% cache %} fragment caching backed by the configured cache store
+    from config.cache import get_cache_config
+    from app.Support.Cache import cache
+    from app.View.FragmentCache import FragmentCacheExtension
+
+    fragments_config = get_cache_config()['fragments']
+    jinja_env.add_extension(FragmentCacheExtension)
+    if fragments_config['enabled']:
+        jinja_env.fragment_cache = cache(fragments_config['store'])
+
+    # Bytecode cache shared by workers and the view:cache archive
+    configure_template_cache(jinja_env, view_config, debug=app.flask_app.debug)
+
+    # Time template rendering as the 'render' phase of the request trace
+    from app.Support.Tracing import trace_template_rendering
+    trace_template_rendering(app.flask_app)
+
+    # Parse the Vite manifest once; only watch it for rebuilds in debug
+    jinja_globals['vite'] = Vite(
+        vite_config['manifest'],
+        build_url=vite_config['build_url'],
+        hot_file=vite_config['hot_file'],
+        check_mtime=app.flask_app.debug,
+        fallback=jinja_globals.get('vite'),
+    )
+
+
+def register_providers(app):
+    """Register the configured service providers from the cached manifest"""
+    from config.app import get_app_config
+    from app.Support.ProviderRepository import ProviderRepository
+
+    app_config = get_app_config()
+    providers = ProviderRepository(
+        app, app_config['services_manifest'], str(project_root), profiler=boot_profiler
+    )
+    providers.load(app_config['providers'])
+    app.instance('provider_repository', providers)
+
+
 def setup_database(app):
     """Set up database connection"""
     try:
@@ -130,8 +213,31 @@ def setup_models(connection):
 
 def load_routes(app):
     """Load application routes"""
-    # Get router instance
-    router = app.resolve('router')
+    from config.app import get_app_config
+    from app.Http.RouteCache import load_manifest
+    from app.Http.RouteMap import CompiledRouteMap
+    from app.Http.Router import Router
+
+    # Match requests through the precompiled route table
+    app.flask_app.url_map = CompiledRouteMap.from_map(app.flask_app.url_map)
+
+    # Bind every route to the kernel's compiled middleware pipelines
+    try:
+        from app.Http.Kernel import get_kernel
+        pipelines = get_kernel(app).pipelines
+    except ImportError as e:
+        print(f"Warning: Could not load route middleware: {e}")
+        pipelines = None
+
+    # Get router instance (proxied so async controllers can be registered)
+    router = Router(app.resolve('router'), app.flask_app, pipelines)
+    app.instance('route_registrar', router)
+
+    # Register routes from the route:cache manifest when present
+    manifest = load_manifest(get_app_config()['routes_manifest'])
+    if manifest is not None:
+        router.load_manifest(manifest)
+        return
 
     # Load web routes
     try:
@@ -149,15 +255,31 @@ def load_routes(app):
 def setup_static_assets(app):
     """Setup static file serving for Vite build assets"""
     from flask import send_from_directory
-    import os
+    from config.server import get_server_config
+    from app.Http.StaticAssets import AssetIndex, StaticAssets
 
-    build_path = os.path.join(app.base_path(), 'public', 'build')
+    assets_config = get_server_config()['assets']
+    build_path = assets_config['path']
 
     @app.flask_app.route('/build/<path:filename>')
     def build_assets(filename):
-        """Serve Vite build assets"""
+        """Serve Vite build assets not in the index (dev builds, range requests)"""
         return send_from_directory(build_path, filename)
 
+    # Outside debug the build is fixed for the process lifetime, so index it
+    # once and answer asset requests before they reach Flask
+    if not app.flask_app.debug:
+        index = AssetIndex(
+            build_path,
+            immutable_paths=assets_config['immutable_paths'],
+            hashed_pattern=assets_config['hashed_pattern'],
+            max_age=assets_config['max_age'],
+            immutable_max_age=assets_config['immutable_max_age'],
+        ).build()
+        assets = StaticAssets(index, assets_config['prefix'])
+        app.flask_app.wsgi_app = assets.wrap(app.flask_app.wsgi_app)
+        app.instance('static_assets', assets)
+
 
 def setup_security_middleware(app):
     """Setup security middleware for the application"""
@@ -170,6 +292,10 @@ def setup_security_middleware(app):
         # Apply global middleware
         apply_global_middleware(app.flask_app, kernel_instance)
         
+        # Static assets bypass Flask, so give them the same security headers
+        if not app.flask_app.debug:
+            app.resolve('static_assets').headers = kernel_instance.security_headers_for('build_assets')
+        
         # Store kernel in app for access in routes
         app.instance('http_kernel', kernel_instance)  # Use different key to avoid conflicts
         
@@ -180,9 +306,16 @@ def setup_security_middleware(app):
         # Continue without security middleware if import fails
 
 
+def setup_conditional_responses(app):
+    """Add weak ETags to JSON responses and answer matching If-None-Match with 304"""
+    from app.Http.ETag import conditional_json
+    
+    app.flask_app.after_request(conditional_json)
+
+
 # Create the application instance
 app = create_application()
 
 if __name__ == '__main__':
-    # Run the Flask application
+    # Run the Flask development server (use `larapy serve --production` in production)
     app.flask_app.run(debug=True, host='0.0.0.0', port=5000)
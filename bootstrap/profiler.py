@@ -0,0 +1,212 @@
+"""
+Boot Profiler
+
+Measures where application boot time goes: wall time per bootstrap phase
+and import time per module.
+
+Enable it with ``LARAPY_BOOT_PROFILE=1`` or run ``larapy boot:profile``.
+The report is printed to stderr and written as JSON to
+``LARAPY_BOOT_PROFILE_OUTPUT`` (default ``storage/logs/boot-profile.json``).
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class _TimedLoader:
+    """Loader proxy timing exec_module; everything else is delegated"""
+
+    def __init__(self, loader, timer, name):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        return create(spec) if create is not None else None
+
+    def exec_module(self, module):
+        self._timer.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportTimer:
+    """
+    Import Timer
+
+    Meta path finder recording self and cumulative import time per module,
+    similar to ``python -X importtime`` but collected in-process.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self._stack = []
+        self._finding = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._finding:
+            return None
+
+        # Ask the remaining finders, then wrap the loader they return
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.discard(fullname)
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def enter(self):
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self.modules[name] = (cumulative - children, cumulative)
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class BootProfiler:
+    """
+    Boot Profiler
+
+    Collects phase timings and module import times for one boot.
+    """
+
+    def __init__(self, enabled=False, output=None):
+        """
+        Args:
+            enabled: Whether timings are collected at all
+            output: JSON report path written by finish()
+        """
+        self.enabled = enabled
+        self.output = Path(output) if output else None
+        self.phases = []
+        self.imports = ImportTimer()
+        self._depth = 0
+        self._started = time.perf_counter()
+
+    @classmethod
+    def from_env(cls):
+        """Create a profiler configured from LARAPY_BOOT_PROFILE*"""
+        enabled = os.getenv('LARAPY_BOOT_PROFILE', '').lower() in ('1', 'true', 'yes')
+        default_output = Path(__file__).parent.parent / 'storage' / 'logs' / 'boot-profile.json'
+        return cls(enabled, os.getenv('LARAPY_BOOT_PROFILE_OUTPUT', str(default_output)))
+
+    def start(self):
+        """Start timing imports"""
+        if self.enabled:
+            self._started = time.perf_counter()
+            self.imports.install()
+        return self
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a boot phase
+
+        Args:
+            name: Phase name, nested phases are indented in the report
+        """
+        if not self.enabled:
+            yield
+            return
+
+        entry = {'name': name, 'depth': self._depth, 'ms': 0.0}
+        self.phases.append(entry)
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry['ms'] = (time.perf_counter() - started) * 1000
+            self._depth -= 1
+
+    def report(self):
+        """
+        Build the profile report
+
+        Returns:
+            Dictionary with total wall time, phases and imports sorted by
+            cumulative time
+        """
+        imports = [
+            {'module': name, 'self_ms': self_time * 1000, 'cumulative_ms': cumulative * 1000}
+            for name, (self_time, cumulative) in self.imports.modules.items()
+        ]
+        imports.sort(key=lambda entry: entry['cumulative_ms'], reverse=True)
+
+        return {
+            'total_ms': (time.perf_counter() - self._started) * 1000,
+            'phases': [dict(phase) for phase in self.phases],
+            'imports': imports,
+        }
+
+    def format_report(self, report=None, limit=25):
+        """
+        Format a report as plain-text tables
+
+        Args:
+            report: Report dictionary (defaults to the current one)
+            limit: Number of slowest imports to list
+
+        Returns:
+            Printable report
+        """
+        report = report or self.report()
+        lines = [f"Boot time: {report['total_ms']:.1f} ms", "", f"{'Phase':<44} {'ms':>10}"]
+        for phase in report['phases']:
+            label = '  ' * phase['depth'] + phase['name']
+            lines.append(f"{label:<44} {phase['ms']:>10.1f}")
+
+        lines += ["", f"{'Module':<56} {'self ms':>10} {'cumul ms':>10}"]
+        for entry in report['imports'][:limit]:
+            lines.append(f"{entry['module']:<56} {entry['self_ms']:>10.1f} {entry['cumulative_ms']:>10.1f}")
+
+        return "\n".join(lines)
+
+    def finish(self):
+        """Stop timing, print the report and write it as JSON"""
+        if not self.enabled:
+            return None
+
+        self.imports.uninstall()
+        report = self.report()
+        print(self.format_report(report), file=sys.stderr)
+
+        if self.output:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        return report
+
+
+# Profiler for the current process, started by bootstrap/app.py
+boot_profiler = BootProfiler.from_env()
@@ -0,0 +1,326 @@
+"""
+Production Server
+
+Preforking HTTP server for running the Larapy application in production.
+
+The master process imports the bootstrapped application once, binds the
+listening socket and forks the workers, so workers share the preloaded
+application memory copy-on-write and accept connections from the same
+socket.
+
+Signals handled by the master:
+
+- SIGTERM / SIGINT: graceful shutdown, workers finish their current request
+- SIGHUP: graceful reload, a new generation of workers replaces the old one
+"""
+
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+
+class PreforkServer:
+    """
+    Prefork Server
+
+    Supervises a pool of single-threaded worker processes serving a WSGI
+    application from a shared listening socket.
+    """
+
+    HOOKS = ('when_ready', 'post_fork', 'worker_exit', 'on_exit')
+
+    def __init__(self, wsgi_app, host='0.0.0.0', port=8000, workers=2, max_requests=0,
+                 max_requests_jitter=0, graceful_timeout=30, backlog=2048, ready_file=None):
+        """
+        Args:
+            wsgi_app: Preloaded WSGI application
+            host: Interface to bind
+            port: Port to bind
+            workers: Number of worker processes
+            max_requests: Recycle a worker after this many requests (0 disables)
+            max_requests_jitter: Random extra requests per worker so workers
+                do not all recycle at once
+            graceful_timeout: Seconds workers get to finish before being killed
+            backlog: Listen backlog of the shared socket
+            ready_file: File touched once all workers are up, for readiness probes
+        """
+        self.wsgi_app = wsgi_app
+        self.host = host
+        self.port = port
+        self.worker_count = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.ready_file = Path(ready_file) if ready_file else None
+
+        self.hooks = {hook: [] for hook in self.HOOKS}
+        self.workers = {}
+        self.retiring = set()
+        self.socket = None
+        self._signals = []
+        self._stopping = False
+
+    def on(self, hook, callback):
+        """
+        Register a lifecycle hook
+
+        Args:
+            hook: 'when_ready' (master, all workers started),
+                'post_fork' (worker, after fork), 'worker_exit' (master,
+                worker reaped) or 'on_exit' (master, shutting down)
+            callback: Callable receiving the server (and worker pid)
+        """
+        if hook not in self.hooks:
+            raise ValueError(f"Unknown server hook: {hook}")
+        self.hooks[hook].append(callback)
+        return self
+
+    def _run_hooks(self, hook, *args):
+        for callback in self.hooks[hook]:
+            callback(self, *args)
+
+    # Master
+
+    def run(self):
+        """Bind the socket, fork the workers and supervise them until stopped"""
+        self.socket = self._bind()
+        self._install_master_signals()
+
+        print(f"Larapy server listening on http://{self.host}:{self.port} "
+              f"(master {os.getpid()}, {self.worker_count} workers)")
+
+        self._spawn_workers()
+        self._mark_ready()
+
+        try:
+            self._supervise()
+        finally:
+            self._stop()
+
+    def _bind(self):
+        """Create the listening socket shared by all workers"""
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        # Workers poll the socket, so a connection taken by a sibling must
+        # not leave the others blocked in accept()
+        sock.setblocking(False)
+        return sock
+
+    def _install_master_signals(self):
+        self._wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD):
+            signal.signal(signum, lambda signum, frame: self._signals.append(signum))
+
+    def _spawn_workers(self):
+        while len(self.workers) < self.worker_count:
+            self._spawn_worker()
+
+    def _spawn_worker(self):
+        pid = os.fork()
+        if pid:
+            self.workers[pid] = time.monotonic()
+            return pid
+
+        # Worker process
+        exit_code = 0
+        try:
+            exit_code = Worker(self).run()
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _mark_ready(self):
+        """Run readiness hooks once the first generation of workers is up"""
+        if self.ready_file:
+            self.ready_file.parent.mkdir(parents=True, exist_ok=True)
+            self.ready_file.write_text(str(os.getpid()))
+        self._run_hooks('when_ready')
+
+    def _supervise(self):
+        """Reap and respawn workers and react to signals"""
+        while not self._stopping:
+            select.select([self._wakeup_read], [], [], 1.0)
+            try:
+                os.read(self._wakeup_read, 512)
+            except BlockingIOError:
+                pass
+
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum in (signal.SIGTERM, signal.SIGINT):
+                    self._stopping = True
+                elif signum == signal.SIGHUP:
+                    self._reload()
+
+            self._reap_workers()
+            if not self._stopping:
+                self._spawn_workers()
+
+    def _reap_workers(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            self.retiring.discard(pid)
+            if self.workers.pop(pid, None) is not None:
+                self._run_hooks('worker_exit', pid)
+
+    def _reload(self):
+        """Replace every worker with a fresh one without dropping connections"""
+        old_workers = list(self.workers)
+        self.workers.clear()
+        self.retiring.update(old_workers)
+        self._spawn_workers()
+        for pid in old_workers:
+            self._signal_worker(pid, signal.SIGTERM)
+
+    def _signal_worker(self, pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _stop(self):
+        """Stop workers gracefully, killing any that outlive the timeout"""
+        self._stopping = True
+        for pid in list(self.workers):
+            self._signal_worker(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while (self.workers or self.retiring) and time.monotonic() < deadline:
+            self._reap_workers()
+            time.sleep(0.1)
+
+        for pid in list(self.workers) + list(self.retiring):
+            self._signal_worker(pid, signal.SIGKILL)
+        self._reap_workers()
+
+        if self.ready_file and self.ready_file.exists():
+            self.ready_file.unlink()
+        self.socket.close()
+        self._run_hooks('on_exit')
+
+
+class Worker:
+    """
+    Prefork Worker
+
+    Serves requests one at a time from the shared socket until told to stop
+    or until it reaches its request budget.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.alive = True
+        self.handled = 0
+        self.max_requests = server.max_requests
+        if self.max_requests and server.max_requests_jitter:
+            self.max_requests += random.randint(0, server.max_requests_jitter)
+
+    def run(self):
+        """Serve requests until stopped; returns the process exit code"""
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        self.server._run_hooks('post_fork', os.getpid())
+
+        http = _make_http_server(self.server, self._count_requests(self.server.wsgi_app))
+        http.timeout = 1.0
+
+        while self.alive:
+            http.handle_request()
+            if self.max_requests and self.handled >= self.max_requests:
+                # Recycle: exit cleanly and let the master fork a replacement
+                break
+
+        return 0
+
+    def _handle_stop(self, signum, frame):
+        self.alive = False
+
+    def _count_requests(self, wsgi_app):
+        def counted_app(environ, start_response):
+            self.handled += 1
+            return wsgi_app(environ, start_response)
+        return counted_app
+
+
+def _make_http_server(server, wsgi_app):
+    """Create a single-threaded HTTP server on the shared listening socket"""
+    from werkzeug.serving import BaseWSGIServer
+
+    class WorkerHTTPServer(BaseWSGIServer):
+        def get_request(self):
+            connection, address = super().get_request()
+            connection.setblocking(True)
+            return connection, address
+
+    http = WorkerHTTPServer(server.host, server.port, wsgi_app, fd=server.socket.fileno())
+    http.socket.setblocking(False)
+    return http
+
+
+def _import_callable(path):
+    """Import a callable from a 'module.attribute' path"""
+    import importlib
+
+    module_name, _, attribute = path.rpartition('.')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def serve(host=None, port=None, workers=None, max_requests=None):
+    """
+    Preload the application and run it under the prefork server
+
+    Arguments left as None fall back to config/server.py.
+    """
+    project_root = Path(__file__).parent.parent
+    sys.path.insert(0, str(project_root))
+
+    from config.server import get_server_config
+    config = get_server_config()['prefork']
+
+    # Preload before forking so workers share the booted application
+    from bootstrap.app import app
+
+    server = PreforkServer(
+        app.flask_app,
+        host=host or config['host'],
+        port=int(port or config['port']),
+        workers=int(workers or config['workers']),
+        max_requests=int(max_requests if max_requests is not None else config['max_requests']),
+        max_requests_jitter=config['max_requests_jitter'],
+        graceful_timeout=config['graceful_timeout'],
+        backlog=config['backlog'],
+        ready_file=config['ready_file'],
+    )
+
+    # Lifecycle hooks from config, e.g. reconnecting clients after fork
+    for hook, callbacks in config['hooks'].items():
+        for path in callbacks:
+            server.on(hook, _import_callable(path))
+
+    server.run()
+    return 0
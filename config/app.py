@@ -0,0 +1,33 @@
+"""Application configuration for Larapy application"""
+
+import os
+from pathlib import Path
+
+
+def get_app_config():
+    """Get application configuration"""
+    base_path = Path(__file__).parent.parent
+
+    return {
+        'name': os.getenv('APP_NAME', 'Larapy'),
+        'env': os.getenv('APP_ENV', 'production'),
+        'debug': os.getenv('APP_DEBUG', 'false').lower() == 'true',
+
+        # Service providers, in registration order. Providers whose
+        # is_deferred() is true are only registered when one of their
+        # provides() services is first resolved from the container.
+        'providers': [
+            'app.Providers.AppServiceProvider',
+            'app.Providers.PaymentServiceProvider.PaymentServiceProvider',
+        ],
+
+        # Cached eager/deferred provider manifest, rebuilt when 'providers' changes
+        'services_manifest': str(base_path / 'bootstrap' / 'cache' / 'services.json'),
+
+        # Route manifest written by route:cache; when present routes/web.py is not executed
+        'routes_manifest': str(base_path / 'bootstrap' / 'cache' / 'routes.json'),
+
+        # JSON responses encode dates as RFC 822 HTTP dates, like Flask's
+        # default provider; enable to send ISO 8601 strings instead
+        'json_iso_dates': os.getenv('JSON_ISO_DATES', 'false').lower() == 'true',
+    }
@@ -0,0 +1,78 @@
+"""Cache configuration for Larapy application"""
+
+import os
+from pathlib import Path
+
+
+def get_cache_config():
+    """Get cache configuration for the application"""
+    from config.server import get_server_config
+
+    # Several prefork workers need a store they all see for invalidation
+    workers = get_server_config()['prefork']['workers']
+
+    return {
+        # Store used by cache() when no store is named. 'memory' is per
+        # worker; use 'file' when invalidation must reach every worker.
+        'default': os.getenv('CACHE_STORE', 'memory'),
+
+        'prefix': os.getenv('CACHE_PREFIX', 'larapy:'),
+
+        'stores': {
+            'memory': {
+                'driver': 'memory',
+                'maxsize': 10000,
+            },
+            'file': {
+                'driver': 'file',
+                'path': str(Path(__file__).parent.parent / 'storage' / 'framework' / 'cache' / 'data'),
+            },
+            'sqlite': {
+                'driver': 'sqlite',
+                'path': str(Path(__file__).parent.parent / 'storage' / 'framework' / 'cache' / 'cache.sqlite'),
+            },
+        },
+
+        # {% cache %} template fragments
+        'fragments': {
+            'store': os.getenv('VIEW_FRAGMENT_STORE') or None,
+            'enabled': os.getenv('VIEW_FRAGMENT_CACHE', 'true').lower() == 'true',
+        },
+
+        # Model query results cached with .remember(ttl), flushed per table
+        # by model events. Defaults to the shared sqlite store under several
+        # workers, so a write in one worker invalidates every worker's cache.
+        'queries': {
+            'store': os.getenv('QUERY_CACHE_STORE') or ('sqlite' if workers > 1 else None),
+            'enabled': os.getenv('QUERY_CACHE', 'true').lower() == 'true',
+            # Longest TTL in a per-process store, which other workers' writes
+            # cannot flush (also applied to remember() without a TTL)
+            'local_ttl': int(os.getenv('QUERY_CACHE_LOCAL_TTL', '60')),
+        },
+
+        # Full-page cache for anonymous requests (response_cache middleware).
+        # Off by default. Only GET/HEAD requests to the paths below are
+        # cached, and only when they carry no Authorization header, none of
+        # the bypass cookies and no Cache-Control/Pragma no-cache. A
+        # response is stored only when it is a 200 without Set-Cookie,
+        # Cache-Control private/no-store/no-cache or Vary: *, and its
+        # rendering did not write to the session.
+        'responses': {
+            'enabled': os.getenv('RESPONSE_CACHE', 'false').lower() == 'true',
+            'store': os.getenv('RESPONSE_CACHE_STORE') or None,
+            'ttl': int(os.getenv('RESPONSE_CACHE_TTL', '60')),
+            # Seconds a stale page is still served while it is refreshed
+            'stale_while_revalidate': int(os.getenv('RESPONSE_CACHE_SWR', '30')),
+            # Cached path patterns and their surrogate keys
+            'paths': {
+                '/': ['home', 'users'],
+                '/contact': ['contact'],
+                '/api/data': ['api'],
+            },
+            'except': [],
+            'vary_headers': ['Accept', 'Accept-Language'],
+            'vary_cookies': [],
+            # Requests carrying these cookies are never answered from the cache
+            'bypass_cookies': ['session', 'remember_token'],
+        },
+    }
@@ -51,4 +51,8 @@ MIGRATIONS = {
 # Seeds settings
 SEEDS = {
     'path': 'database/seeders',
+    # Rows per multi-row INSERT (BulkFactory.insert / without_events)
+    'chunk_size': int(os.getenv('SEED_CHUNK_SIZE', '1000')),
+    # Extra factory users inserted by UserSeeder for load tests
+    'load_test_users': int(os.getenv('SEED_LOAD_TEST_USERS', '0')),
 }
\ No newline at end of file
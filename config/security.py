@@ -46,7 +46,7 @@ def get_security_config():
             'allowed_methods': ['*'],
             'allowed_headers': ['*'],
             'exposed_headers': [],
-            'max_age': 0,
+            'max_age': int(os.getenv('CORS_MAX_AGE', '0')),  # Seconds browsers may cache preflights
             'supports_credentials': False,
         },
         
@@ -57,13 +57,29 @@ def get_security_config():
             'login': '5,1',       # 5 login attempts per minute
         },
         
+        # Rate limiter backend: 'shared' keeps token buckets in an mmap segment
+        # shared by every worker on the host, 'memory' keeps them per process.
+        # The segment file name gets the layout appended (rate-limits.v1-65536x64.bin)
+        'rate_limiting_backend': {
+            'driver': os.getenv('RATE_LIMIT_DRIVER', 'shared'),
+            'path': os.getenv(
+                'RATE_LIMIT_PATH',
+                str(Path(__file__).parent.parent / 'storage' / 'framework' / 'rate-limits.bin'),
+            ),
+            'slots': int(os.getenv('RATE_LIMIT_SLOTS', '65536')),
+            'shards': 64,
+            'sweep_interval': 60,
+        },
+        
         # Cookie Encryption
         'cookies': {
             'encrypt': True,
             'exclude': [
                 'cookie_consent',
                 'session',
-            ]
+            ],
+            # Ciphertext -> plaintext entries kept to skip repeat decryption
+            'decrypt_cache_size': 4096,
         },
         
         # Security Headers
@@ -77,6 +93,11 @@ def get_security_config():
             'permissions_policy': 'geolocation=(), microphone=(), camera=()',
         },
         
+        # Per-route security header overrides, keyed by endpoint name.
+        # Use None to drop a header for that route, e.g.
+        # 'build_assets': {'content_security_policy': None}
+        'security_header_overrides': {},
+        
         # Password Hashing
         'hashing': {
             'driver': 'bcrypt',
@@ -0,0 +1,82 @@
+"""Server configuration for Larapy application"""
+
+import os
+from pathlib import Path
+
+
+def get_server_config():
+    """Get server configuration for the application"""
+    return {
+        # ASGI entry point (public/asgi.py)
+        'asgi': {
+            # Threads running the sync request lifecycle and sync controllers
+            'threads': int(os.getenv('ASGI_THREADS', '32')),
+            # Request bodies larger than this spill to a temporary file
+            'spool_size': int(os.getenv('ASGI_SPOOL_SIZE', str(1024 * 1024))),
+        },
+        
+        # Preforking production server (larapy serve --production)
+        'prefork': {
+            'host': os.getenv('SERVER_HOST', '0.0.0.0'),
+            'port': int(os.getenv('SERVER_PORT', '8000')),
+            'workers': int(os.getenv('SERVER_WORKERS', str((os.cpu_count() or 1) * 2 + 1))),
+            # Recycle workers after this many requests (0 disables recycling)
+            'max_requests': int(os.getenv('SERVER_MAX_REQUESTS', '0')),
+            'max_requests_jitter': int(os.getenv('SERVER_MAX_REQUESTS_JITTER', '0')),
+            'graceful_timeout': int(os.getenv('SERVER_GRACEFUL_TIMEOUT', '30')),
+            'backlog': 2048,
+            # Touched once all workers are up; point readiness probes here
+            'ready_file': os.getenv(
+                'SERVER_READY_FILE',
+                str(Path(__file__).parent.parent / 'storage' / 'framework' / 'server.ready'),
+            ),
+            # Lifecycle hooks as 'module.function' paths, called with the server:
+            # 'when_ready', 'post_fork', 'worker_exit', 'on_exit'
+            'hooks': {
+                'when_ready': [],
+                'post_fork': [],
+            },
+        },
+        
+        # Vite build output served from an in-memory index (public/build)
+        'assets': {
+            'path': str(Path(__file__).parent.parent / 'public' / 'build'),
+            'prefix': '/build/',
+            # Content-hashed files under these prefixes are cached as immutable
+            'immutable_paths': ['assets/'],
+            'hashed_pattern': r'-[A-Za-z0-9_-]{8,}\.\w+$',
+            'immutable_max_age': 31536000,
+            # Other files (e.g. .vite/manifest.json) are revalidated by ETag
+            'max_age': 0,
+        },
+        
+        # Dynamic response compression (brotli/zstd when installed, else gzip)
+        'compression': {
+            'enabled': os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true',
+            # Preference order when the client accepts several
+            'encodings': ['br', 'zstd', 'gzip'],
+            # Bodies with a known length below this are sent as-is
+            'min_size': int(os.getenv('COMPRESSION_MIN_SIZE', '1024')),
+            'mimetypes': [
+                'text/',
+                'application/json',
+                'application/javascript',
+                'application/xml',
+                'application/manifest+json',
+                'image/svg+xml',
+            ],
+            # Build assets are precompressed by assets:compress
+            'except': ['/build/*'],
+            # Levels per route group, first matching path pattern wins
+            'groups': {
+                'api': {
+                    'paths': ['/api/*'],
+                    'levels': {'br': 4, 'zstd': 3, 'gzip': 5},
+                },
+                'web': {
+                    'paths': ['*'],
+                    'levels': {'br': 5, 'zstd': 6, 'gzip': 6},
+                },
+            },
+        },
+    }
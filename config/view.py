@@ -0,0 +1,40 @@
+"""View configuration for Larapy application"""
+
+import os
+from pathlib import Path
+
+
+def _env_flag(name):
+    """Read a true/false environment variable, None when unset"""
+    value = os.getenv(name)
+    if value is None or value == '':
+        return None
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def get_view_config():
+    """Get view configuration for the application"""
+    base_path = Path(__file__).parent.parent
+    compiled_path = base_path / 'storage' / 'framework' / 'views'
+
+    return {
+        # Vite build manifest used by the vite() template helper
+        'vite': {
+            'manifest': str(base_path / 'public' / 'build' / '.vite' / 'manifest.json'),
+            'build_url': '/build/',
+            # Present while `npm run dev` serves assets
+            'hot_file': str(base_path / 'public' / 'hot'),
+        },
+
+        # Stat templates on every render to pick up edits (defaults to APP_DEBUG)
+        'auto_reload': _env_flag('VIEW_AUTO_RELOAD'),
+
+        # Share compiled template bytecode between workers
+        'bytecode_cache': _env_flag('VIEW_BYTECODE_CACHE') is not False,
+
+        'compiled': {
+            'bytecode': str(compiled_path / 'bytecode'),
+            # Written by `larapy view:cache`, used when auto_reload is off
+            'archive': str(compiled_path / 'compiled.zip'),
+        },
+    }
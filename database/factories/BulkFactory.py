@@ -0,0 +1,20 @@
+"""Factory base inserting large counts with multi-row INSERTs"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
+
+from larapy.database.factory.factory import Factory
+from app.Support.Database import InsertsInBulk
+from config.database import SEEDS
+
+
+class BulkFactory(InsertsInBulk, Factory):
+    """
+    Factory adding insert() and without_events() for large counts
+
+    create() saves models one at a time with their events; call insert(),
+    or without_events().create(), to write them in multi-row INSERTs.
+    """
+
+    chunk_size = SEEDS['chunk_size']
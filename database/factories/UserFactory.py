@@ -4,11 +4,11 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
 
-from larapy.database.factory.factory import Factory
 from app.Models.User import User
+from database.factories.BulkFactory import BulkFactory
 
 
-class UserFactory(Factory):
+class UserFactory(BulkFactory):
     """Factory for creating User model instances"""
     
     def __init__(self, **kwargs):
@@ -7,6 +7,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'packa
 from larapy.database.seeder.seeder import Seeder
 from app.Models.User import User
 from database.factories.UserFactory import UserFactory
+from config.database import SEEDS
 
 
 class UserSeeder(Seeder):
@@ -52,6 +53,11 @@ class UserSeeder(Seeder):
             admin_users = factory.count(2).admin().verified().create()
             print(f"Created {len(admin_users)} admin users")
             
+            # Bulk insert users for load tests (SEED_LOAD_TEST_USERS)
+            if SEEDS['load_test_users']:
+                inserted = UserFactory().count(SEEDS['load_test_users']).insert()
+                print(f"Inserted {inserted} load test users")
+            
         except Exception as e:
             print(f"Factory creation failed (expected in demo): {e}")
             # Fallback to manual creation
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+ASGI Entry Point
+
+Exposes the Larapy application to ASGI servers, next to the WSGI entry
+point in public/index.py:
+
+    uvicorn public.asgi:application --workers 4
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import the bootstrapped application
+from bootstrap.app import app
+from app.Http.Asgi import AsgiApplication
+from config.server import get_server_config
+
+
+asgi_config = get_server_config()['asgi']
+
+application = AsgiApplication(
+    app.flask_app,
+    max_workers=asgi_config['threads'],
+    spool_size=asgi_config['spool_size'],
+)
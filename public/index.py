@@ -45,6 +45,7 @@ def main():
     print("GET  /demo/middleware  - Middleware demo")
     
     print(f"\n🌐 Server starting on http://127.0.0.1:5000")
+    print("Development server only, run `larapy serve --production` in production")
     print("Press Ctrl+C to stop the server")
     print("=" * 50)
     
@@ -1,5 +1,8 @@
 """
 Web Routes - Define application routes with security middleware
+
+Routes must use controller methods (no closures) so `larapy route:cache`
+can write them to the route manifest.
 """
 
 def register_routes(router, app):
@@ -11,27 +14,13 @@ def register_routes(router, app):
     controller = HomeController()
     router.get('/', controller.index)
     router.get('/contact', controller.contact)
-    router.get('/api/data', controller.api_data)
     
-    # Example of a simple secured route using decorator
-    @app.flask_app.route('/dashboard')
-    def dashboard():
-        # This would normally check authentication
-        return {"message": "Welcome to your dashboard!", "status": "success"}
+    # API routes run the 'api' middleware group (rate limiting)
+    with router.group('api'):
+        router.get('/api/data', controller.api_data)
+    
+    # Example of a simple secured route
+    router.match(['GET'], '/dashboard', controller.dashboard)
     
     # Test route to verify CSRF tokens work
-    @app.flask_app.route('/test-csrf', methods=['GET', 'POST'])
-    def test_csrf():
-        from flask import request, render_template_string
-        
-        if request.method == 'GET':
-            form_html = '''
-            <form method="POST">
-                {{ csrf() }}
-                <input type="text" name="test_input" placeholder="Test input">
-                <button type="submit">Submit</button>
-            </form>
-            '''
-            return render_template_string(form_html)
-        else:
-            return {"message": "Form submitted successfully", "data": dict(request.form)}
+    router.match(['GET', 'POST'], '/test-csrf', controller.test_csrf)
@@ -0,0 +1,201 @@
+"""
+SQLite-backed stand-in for the Larapy ORM, shared by the database tests.
+
+The query builder compiles real SQL with ``?`` placeholders and runs it on
+an in-memory sqlite3 connection. It exposes the builder surface the
+app.Support.Database helpers rely on: select, join, where, where_in,
+order_by, limit, to_sql, get_bindings, get, first, insert, update and
+delete. Models hold their row in ``attributes`` and fire saved/deleted
+events to observers registered with ``observe``.
+"""
+
+import sqlite3
+
+
+class Database:
+    """In-memory database recording every statement run through the builder"""
+
+    def __init__(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.statements = []
+
+    def create(self, table, columns, rows=()):
+        """
+        Create a table and fill it
+
+        Args:
+            table: Table name
+            columns: Column definitions, e.g. ['id INTEGER PRIMARY KEY', 'name TEXT']
+            rows: Dicts to insert (not recorded)
+        """
+        self.connection.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+        for row in rows:
+            self.connection.execute(
+                f"INSERT INTO {table} ({', '.join(row)}) VALUES ({', '.join('?' for _ in row)})",
+                list(row.values()),
+            )
+
+    def execute(self, sql, bindings=()):
+        self.statements.append((sql, list(bindings)))
+        return self.connection.execute(sql, list(bindings))
+
+    def rows(self, table):
+        """Get every row of a table as dicts, bypassing the recorder"""
+        cursor = self.connection.execute(f"SELECT * FROM {table} ORDER BY rowid")
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def selects(self):
+        """Get the table of each SELECT run so far"""
+        return [sql.split(' FROM ')[1].split(' ')[0] for sql, _ in self.statements if sql.startswith('SELECT')]
+
+    def reset(self):
+        self.statements.clear()
+
+
+class Query:
+    """Query builder compiling to SQLite"""
+
+    def __init__(self, model):
+        self.model = model
+        self.connection = model.database
+        self.columns = ['*']
+        self.joins = []
+        self.wheres = []
+        self.orders = []
+        self.limit_value = None
+
+    def select(self, *columns):
+        self.columns = list(columns)
+        return self
+
+    def join(self, table, first, operator, second):
+        self.joins.append(f"JOIN {table} ON {first} {operator} {second}")
+        return self
+
+    def where(self, column, operator=None, value=None):
+        if value is None and operator not in ('=', '!=', '<', '>', '<=', '>=', 'like'):
+            operator, value = '=', operator
+        self.wheres.append((f"{column} {operator} ?", [value]))
+        return self
+
+    def where_in(self, column, values):
+        values = list(values)
+        self.wheres.append((f"{column} IN ({', '.join('?' for _ in values)})", values))
+        return self
+
+    def order_by(self, column, direction='asc'):
+        self.orders.append(f"{column} {direction.upper()}")
+        return self
+
+    def limit(self, count):
+        self.limit_value = count
+        return self
+
+    def _where_sql(self):
+        return ' WHERE ' + ' AND '.join(clause for clause, _ in self.wheres) if self.wheres else ''
+
+    def to_sql(self):
+        sql = f"SELECT {', '.join(self.columns)} FROM {self.model.table}"
+        if self.joins:
+            sql += ' ' + ' '.join(self.joins)
+        sql += self._where_sql()
+        if self.orders:
+            sql += ' ORDER BY ' + ', '.join(self.orders)
+        if self.limit_value is not None:
+            sql += f" LIMIT {self.limit_value}"
+        return sql
+
+    def get_bindings(self):
+        return [value for _, values in self.wheres for value in values]
+
+    def get(self):
+        cursor = self.connection.execute(self.to_sql(), self.get_bindings())
+        columns = [column[0] for column in cursor.description]
+        return [self.model.from_row(dict(zip(columns, row))) for row in cursor.fetchall()]
+
+    def first(self):
+        results = self.limit(1).get()
+        return results[0] if results else None
+
+    def insert(self, rows):
+        """Insert a dict, or a list of dicts sharing their keys in one statement"""
+        rows = [rows] if isinstance(rows, dict) else list(rows)
+        columns = list(rows[0])
+        values = ', '.join(f"({', '.join('?' for _ in columns)})" for _ in rows)
+        self.connection.execute(
+            f"INSERT INTO {self.model.table} ({', '.join(columns)}) VALUES {values}",
+            [row[column] for row in rows for column in columns],
+        )
+        return True
+
+    def update(self, values):
+        assignments = ', '.join(f"{column} = ?" for column in values)
+        cursor = self.connection.execute(
+            f"UPDATE {self.model.table} SET {assignments}{self._where_sql()}",
+            list(values.values()) + self.get_bindings(),
+        )
+        return cursor.rowcount
+
+    def delete(self):
+        cursor = self.connection.execute(f"DELETE FROM {self.model.table}{self._where_sql()}", self.get_bindings())
+        return cursor.rowcount
+
+
+class Model:
+    """Model base over a Database; subclasses set ``database`` and ``table``"""
+
+    database = None
+    table = None
+    primary_key = 'id'
+    timestamps = False
+
+    def __init__(self, attributes=None):
+        self.attributes = dict(attributes or {})
+        self.exists = False
+
+    @classmethod
+    def from_row(cls, row):
+        model = cls(row)
+        model.exists = True
+        return model
+
+    @classmethod
+    def query(cls):
+        return Query(cls)
+
+    @classmethod
+    def find(cls, key):
+        return cls.query().where(cls.primary_key, int(key)).first()
+
+    @classmethod
+    def observe(cls, observer):
+        cls.observers = list(cls.__dict__.get('observers', [])) + [observer()]
+
+    def fire(self, event):
+        for observer in getattr(type(self), 'observers', []):
+            handler = getattr(observer, event, None)
+            if handler is not None:
+                handler(self)
+
+    def save(self):
+        query = Query(type(self))
+        key = self.attributes.get(self.primary_key)
+        if self.exists:
+            values = {column: value for column, value in self.attributes.items() if column != self.primary_key}
+            query.where(self.primary_key, key).update(values)
+        else:
+            query.insert(self.attributes)
+            if key is None:
+                self.attributes[self.primary_key] = self.database.connection.execute(
+                    'SELECT last_insert_rowid()'
+                ).fetchone()[0]
+            self.exists = True
+        self.fire('saved')
+        return True
+
+    def delete(self):
+        Query(type(self)).where(self.primary_key, self.attributes[self.primary_key]).delete()
+        self.exists = False
+        self.fire('deleted')
+        return True
@@ -0,0 +1,229 @@
+"""
+Unit tests for async controller support and the ASGI entry point.
+"""
+
+import asyncio
+import functools
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.Asgi import AsgiApplication
+
+try:
+    from flask import Flask, Response, request, stream_with_context
+except ImportError:
+    Flask = None
+from app.Http.Async import ensure_sync, ensure_sync_handle
+
+
+class TestAsyncAdapters(UnitTestCase):
+    """Tests for the sync adapters."""
+
+    def test_async_controller_runs_synchronously(self):
+        """Async controllers are awaited and their result returned."""
+        async def show(id):
+            await asyncio.sleep(0)
+            return {'id': id}
+
+        self.assertEqual(ensure_sync(show)(id=3), {'id': 3})
+
+    def test_sync_controller_is_untouched(self):
+        """Sync callables are returned as-is."""
+        def index():
+            return 'ok'
+
+        self.assertIs(ensure_sync(index), index)
+
+    def test_async_middleware_awaits_next_handler(self):
+        """Async middleware can await next_handler, even into async code."""
+        class Middleware:
+            async def handle(self, request, next_handler):
+                response = await next_handler(request)
+                return f"wrapped({response})"
+
+        async def controller():
+            return 'body'
+
+        handle = ensure_sync_handle(Middleware().handle)
+        route = ensure_sync(controller)
+
+        self.assertEqual(handle('request', lambda request: route()), 'wrapped(body)')
+
+    def test_deeply_nested_async_middleware(self):
+        """Each nesting level runs on its own helper thread, however deep."""
+        class Middleware:
+            async def handle(self, request, next_handler):
+                return f"({await next_handler(request)})"
+
+        async def controller():
+            return 'body'
+
+        handler = lambda request: ensure_sync(controller)()
+        for _ in range(8):
+            handler = functools.partial(ensure_sync_handle(Middleware().handle), next_handler=handler)
+
+        # Run on a daemon thread so a deadlock fails instead of hanging
+        results = []
+        thread = threading.Thread(target=lambda: results.append(handler('request')), daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertEqual(results, ['((((((((body))))))))'])
+
+    def test_nested_calls_from_concurrent_requests(self):
+        """Concurrent nested coroutines are not limited by a shared pool."""
+        barrier = threading.Barrier(6, timeout=5)
+
+        class Middleware:
+            async def handle(self, request, next_handler):
+                return await next_handler(request)
+
+        async def controller():
+            barrier.wait()
+            return 'body'
+
+        handle = ensure_sync_handle(Middleware().handle)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(handle('request', lambda request: ensure_sync(controller)())),
+                daemon=True,
+            )
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(results, ['body'] * 6)
+
+
+class TestAsgiApplication(UnitTestCase):
+    """Tests for the ASGI to WSGI bridge."""
+
+    def run_request(self, wsgi_app, body=b'', **scope):
+        application = AsgiApplication(wsgi_app, max_workers=2)
+        scope = dict({
+            'type': 'http', 'method': 'POST', 'path': '/api/data',
+            'query_string': b'page=2', 'headers': [(b'content-type', b'text/plain')],
+        }, **scope)
+        incoming = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        sent = []
+
+        async def receive():
+            return incoming.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(application(scope, receive, send))
+        application.executor.shutdown()
+        return sent
+
+    def test_request_is_translated_to_wsgi(self):
+        """Method, path, query, headers and body reach the WSGI app."""
+        seen = {}
+
+        def wsgi_app(environ, start_response):
+            seen.update(environ)
+            seen['body'] = environ['wsgi.input'].read()
+            start_response('201 Created', [('Content-Type', 'text/plain')])
+            return [b'one', b'two']
+
+        sent = self.run_request(wsgi_app, body=b'payload')
+
+        self.assertEqual(seen['PATH_INFO'], '/api/data')
+        self.assertEqual(seen['QUERY_STRING'], 'page=2')
+        self.assertEqual(seen['CONTENT_TYPE'], 'text/plain')
+        self.assertEqual(seen['body'], b'payload')
+        self.assertEqual(sent[0]['status'], 201)
+        self.assertEqual([m['body'] for m in sent[1:]], [b'one', b'two'])
+        self.assertEqual([m['more_body'] for m in sent[1:]], [True, False])
+
+    def test_empty_response_body(self):
+        """A response without body chunks still completes."""
+        def wsgi_app(environ, start_response):
+            start_response('204 No Content', [])
+            return []
+
+        sent = self.run_request(wsgi_app)
+
+        self.assertEqual(sent[-1], {'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    def test_legacy_write_is_sent_before_the_body(self):
+        """Data passed to the write() callable precedes the returned chunks."""
+        def wsgi_app(environ, start_response):
+            write = start_response('200 OK', [('Content-Type', 'text/plain')])
+            write(b'head,')
+            return [b'body']
+
+        sent = self.run_request(wsgi_app)
+
+        self.assertEqual([m['body'] for m in sent[1:]], [b'head,', b'body'])
+        self.assertEqual([m['more_body'] for m in sent[1:]], [True, False])
+
+    def test_write_only_response(self):
+        """A response written entirely through write() completes."""
+        def wsgi_app(environ, start_response):
+            write = start_response('200 OK', [])
+            write(b'one')
+            write(b'two')
+            return []
+
+        sent = self.run_request(wsgi_app)
+
+        self.assertEqual([m['body'] for m in sent[1:]], [b'one', b'two'])
+        self.assertEqual(sent[-1]['more_body'], False)
+
+
+    @unittest.skipIf(Flask is None, "streamed responses require Flask")
+    def test_concurrent_streamed_responses(self):
+        """stream_with_context bodies survive being resumed on different executor threads."""
+        app = Flask(__name__)
+
+        @app.route('/stream/<int:number>')
+        def stream(number):
+            def body():
+                for part in range(3):
+                    yield f"{request.view_args['number']}:{part};"
+            return Response(stream_with_context(body()))
+
+        application = AsgiApplication(app.wsgi_app, max_workers=4)
+
+        async def get(number):
+            scope = {'type': 'http', 'method': 'GET', 'path': f'/stream/{number}', 'headers': []}
+            incoming = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+            sent = []
+
+            async def receive():
+                return incoming.pop(0)
+
+            async def send(message):
+                sent.append(message)
+                await asyncio.sleep(0)
+
+            await application(scope, receive, send)
+            return sent
+
+        async def main():
+            return await asyncio.gather(*(get(number) for number in range(8)))
+
+        try:
+            responses = asyncio.run(main())
+        finally:
+            application.executor.shutdown()
+
+        for number, sent in enumerate(responses):
+            self.assertEqual(sent[0]['status'], 200)
+            body = b''.join(message.get('body', b'') for message in sent[1:])
+            self.assertEqual(body, f"{number}:0;{number}:1;{number}:2;".encode('ascii'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for the boot profiler.
+"""
+
+import importlib
+import json
+import tempfile
+import unittest
+import sys
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from bootstrap.profiler import BootProfiler
+
+
+class TestBootProfiler(UnitTestCase):
+    """Tests for BootProfiler."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        sys.path.insert(0, str(self.root))
+
+    def tearDown(self):
+        sys.path.remove(str(self.root))
+        for name in ('profiled_outer', 'profiled_inner'):
+            sys.modules.pop(name, None)
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_disabled_profiler_records_nothing(self):
+        """Phases are no-ops unless profiling is enabled."""
+        profiler = BootProfiler(enabled=False)
+        with profiler.phase('load_routes'):
+            pass
+        self.assertEqual(profiler.phases, [])
+        self.assertIsNone(profiler.finish())
+
+    def test_nested_phases_are_recorded_with_depth(self):
+        """Nested phases keep their nesting level."""
+        profiler = BootProfiler(enabled=True)
+        with profiler.phase('configure_flask_app'):
+            with profiler.phase('setup_logging'):
+                pass
+
+        self.assertEqual(
+            [(phase['name'], phase['depth']) for phase in profiler.phases],
+            [('configure_flask_app', 0), ('setup_logging', 1)],
+        )
+
+    def test_import_times_and_json_report(self):
+        """Imports are timed with self and cumulative time and written as JSON."""
+        (self.root / 'profiled_inner.py').write_text("import time\ntime.sleep(0.02)\n")
+        (self.root / 'profiled_outer.py').write_text("import profiled_inner\n")
+        output = self.root / 'report.json'
+
+        profiler = BootProfiler(enabled=True, output=output).start()
+        importlib.import_module('profiled_outer')
+        with redirect_stderr(StringIO()) as stderr:
+            profiler.finish()
+
+        report = json.loads(output.read_text())
+        imports = {entry['module']: entry for entry in report['imports']}
+        self.assertGreaterEqual(imports['profiled_outer']['cumulative_ms'], 20)
+        self.assertLess(imports['profiled_outer']['self_ms'], imports['profiled_inner']['self_ms'])
+        self.assertEqual(report['imports'][0]['module'], 'profiled_outer')
+        self.assertIn('profiled_inner', stderr.getvalue())
+        self.assertNotIn(profiler.imports, sys.meta_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
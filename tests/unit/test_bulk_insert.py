@@ -0,0 +1,146 @@
+"""
+Unit tests for multi-row bulk inserts.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+from orm import Database, Model
+
+from app.Support.Database import InsertsInBulk, bulk_insert, chunk_rows, model_rows
+
+
+DB = Database()
+DB.create('widgets', ['id INTEGER PRIMARY KEY', 'name TEXT', 'created_at TEXT', 'updated_at TEXT'])
+
+
+class Widget(Model):
+    database = DB
+    table = 'widgets'
+    timestamps = True
+
+
+class Factory:
+    """Stand-in for the Larapy factory: count(), make() and create() with callbacks"""
+
+    def __init__(self, model):
+        self.model = model
+        self._count = 1
+        self.created = []
+
+    def count(self, count):
+        self._count = count
+        return self
+
+    def make(self, attributes=None):
+        models = [self.model(dict({'name': f"widget {index}"}, **(attributes or {}))) for index in range(self._count)]
+        return models[0] if self._count == 1 else models
+
+    def create(self, attributes=None):
+        models = self.make(attributes)
+        models = [models] if hasattr(models, 'attributes') else models
+        for model in models:
+            model.save()
+            self.created.append(model)
+        return models
+
+
+class WidgetFactory(InsertsInBulk, Factory):
+    chunk_size = 2
+
+    def __init__(self):
+        super().__init__(Widget)
+
+
+class TestBulkInsert(UnitTestCase):
+    """Tests for chunk_rows() and bulk_insert()."""
+
+    def setUp(self):
+        super().setUp()
+        DB.connection.execute('DELETE FROM widgets')
+        DB.reset()
+
+    def test_chunks_respect_size_and_binding_limit(self):
+        """Chunks hold chunk_size rows, fewer when columns would exceed the binding limit."""
+        rows = [{'a': index, 'b': index} for index in range(7)]
+        self.assertEqual([len(chunk) for chunk in chunk_rows(rows, chunk_size=3)], [3, 3, 1])
+        self.assertEqual([len(chunk) for chunk in chunk_rows(rows, chunk_size=10, max_bindings=6)], [3, 3, 1])
+
+    def test_chunk_columns_are_aligned(self):
+        """Rows missing a column are padded so a chunk forms one VALUES list."""
+        chunks = list(chunk_rows([{'a': 1}, {'a': 2, 'b': 3}]))
+        self.assertEqual(chunks, [[{'a': 1, 'b': None}, {'a': 2, 'b': 3}]])
+
+    def test_bulk_insert_stamps_and_flushes_once(self):
+        """Rows get timestamps, one insert per chunk, and the table's query cache is flushed."""
+        models = [Widget({'name': f"widget {index}"}) for index in range(5)]
+        with mock.patch('app.Support.Database.BulkInsert.flush_tables') as flush_tables:
+            inserted = bulk_insert(Widget, model_rows(models), chunk_size=2)
+
+        self.assertEqual(inserted, 5)
+        self.assertEqual([len(bindings) for _, bindings in DB.statements], [6, 6, 3])
+        self.assertIn('(name, created_at, updated_at) VALUES (?, ?, ?), (?, ?, ?)', DB.statements[0][0])
+        self.assertEqual([row['name'] for row in DB.rows('widgets')], [f"widget {index}" for index in range(5)])
+        self.assertIsNotNone(DB.rows('widgets')[0]['created_at'])
+        flush_tables.assert_called_once_with('widgets')
+
+    def test_empty_input_inserts_nothing(self):
+        """No rows means no statements and no cache flush."""
+        with mock.patch('app.Support.Database.BulkInsert.flush_tables') as flush_tables:
+            self.assertEqual(bulk_insert(Widget, []), 0)
+        self.assertEqual(DB.statements, [])
+        flush_tables.assert_not_called()
+
+
+class TestInsertsInBulk(UnitTestCase):
+    """Tests for the InsertsInBulk factory concern."""
+
+    def setUp(self):
+        super().setUp()
+        DB.connection.execute('DELETE FROM widgets')
+        DB.reset()
+        patcher = mock.patch('app.Support.Database.BulkInsert.flush_tables')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_saves_each_model_by_default(self):
+        """Large counts still save real models through the factory's create()."""
+        factory = WidgetFactory()
+        models = factory.count(5).create()
+
+        self.assertEqual(len(factory.created), 5)
+        self.assertEqual([model.attributes['id'] for model in models], [1, 2, 3, 4, 5])
+        self.assertTrue(all(model.exists for model in models))
+        self.assertEqual(len(DB.statements), 5)
+
+    def test_without_events_creates_in_bulk(self):
+        """without_events().create() writes chunked multi-row INSERTs and skips create()."""
+        factory = WidgetFactory()
+        models = factory.count(5).without_events().create({'name': 'bulk'})
+
+        self.assertEqual(factory.created, [])
+        self.assertEqual(len(models), 5)
+        self.assertEqual(len(DB.statements), 3)
+        self.assertEqual([row['name'] for row in DB.rows('widgets')], ['bulk'] * 5)
+
+    def test_insert_counts_rows_and_restores_the_count(self):
+        """insert() returns the rows written; the factory's count is restored after chunking."""
+        factory = WidgetFactory().count(5)
+        self.assertEqual(factory.insert(chunk_size=3), 5)
+        self.assertEqual([len(bindings) for _, bindings in DB.statements], [9, 6])
+        self.assertEqual(factory._count, 5)
+        self.assertEqual(len(DB.rows('widgets')), 5)
+
+    def test_single_model_chunks(self):
+        """A make() returning one model is inserted as a one-row chunk."""
+        self.assertEqual(WidgetFactory().insert(), 1)
+        self.assertEqual(DB.rows('widgets')[0]['name'], 'widget 0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for cache stores and the tagged cache repository.
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Support.Cache import FileStore, MemoryStore, Repository, SqliteStore
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCacheRepository(UnitTestCase):
+    """Tests for Repository over the memory and file stores."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def repositories(self):
+        yield 'memory', Repository(MemoryStore(100), 'test:')
+        yield 'file', Repository(FileStore(self.temp_dir.name, clock=self.clock), 'test:')
+        yield 'sqlite', Repository(SqliteStore(Path(self.temp_dir.name) / 'cache.sqlite', clock=self.clock), 'test:')
+
+    def test_put_get_forget(self):
+        """Values round-trip through every store."""
+        for name, repository in self.repositories():
+            with self.subTest(store=name):
+                repository.put('greeting', '<p>hi</p>')
+                self.assertEqual(repository.get('greeting'), '<p>hi</p>')
+                self.assertTrue(repository.forget('greeting'))
+                self.assertEqual(repository.get('greeting', 'missing'), 'missing')
+
+    def test_remember_computes_once(self):
+        """remember() only calls the callback on a miss."""
+        for name, repository in self.repositories():
+            with self.subTest(store=name):
+                calls = []
+                compute = lambda: calls.append(1) or 'value'
+                self.assertEqual(repository.remember('key', 60, compute), 'value')
+                self.assertEqual(repository.remember('key', 60, compute), 'value')
+                self.assertEqual(len(calls), 1)
+
+    def test_flushing_a_tag_invalidates_its_entries(self):
+        """Entries under a flushed tag are gone; other tags are untouched."""
+        for name, repository in self.repositories():
+            with self.subTest(store=name):
+                repository.tags('users').put('card', 'user card')
+                repository.tags('layout').put('nav', 'nav html')
+                repository.tags('users', 'layout').put('both', 'both')
+
+                repository.tags('users').flush()
+
+                self.assertIsNone(repository.tags('users').get('card'))
+                self.assertIsNone(repository.tags('layout', 'users').get('both'))
+                self.assertEqual(repository.tags('layout').get('nav'), 'nav html')
+
+    def test_file_store_expiry_and_sharing(self):
+        """File entries expire by wall clock and are visible to other instances."""
+        store = FileStore(self.temp_dir.name, clock=self.clock)
+        store.put('fragment', 'html', ttl=10)
+
+        other = FileStore(self.temp_dir.name, clock=self.clock)
+        self.assertEqual(other.get('fragment'), 'html')
+
+        self.clock.now += 11
+        self.assertIsNone(other.get('fragment'))
+        self.assertFalse(store.path('fragment').exists())
+
+    def test_sqlite_store_expiry_and_sharing(self):
+        """SQLite entries expire by wall clock and are visible to other instances."""
+        path = Path(self.temp_dir.name) / 'cache.sqlite'
+        store = SqliteStore(path, clock=self.clock)
+        store.put('rows', [{'id': 1}], ttl=10)
+        store.put('forever', 'value')
+
+        other = SqliteStore(path, clock=self.clock)
+        self.assertEqual(other.get('rows'), [{'id': 1}])
+
+        self.clock.now += 11
+        self.assertEqual(store.prune(), 1)
+        self.assertIsNone(other.get('rows'))
+        self.assertEqual(other.get('forever'), 'value')
+
+
+if __name__ == '__main__':
+    unittest.main()
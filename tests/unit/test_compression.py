@@ -0,0 +1,107 @@
+"""
+Unit tests for response compression.
+"""
+
+import gzip
+import unittest
+import zlib
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.Middleware.Compression import CompressResponses
+
+
+CONFIG = {
+    'encodings': ['gzip'],
+    'min_size': 100,
+    'mimetypes': ['text/', 'application/json'],
+    'except': ['/build/*'],
+    'groups': {
+        'api': {'paths': ['/api/*'], 'levels': {'gzip': 1}},
+        'web': {'paths': ['*'], 'levels': {'gzip': 9}},
+    },
+}
+
+HTML = b'<p>Hello from Larapy</p>\n' * 100
+
+
+class TestCompression(UnitTestCase):
+    """Tests for CompressResponses."""
+
+    def request(self, app, path='/', method='GET', accept_encoding='gzip, br'):
+        environ = {'PATH_INFO': path, 'REQUEST_METHOD': method, 'HTTP_ACCEPT_ENCODING': accept_encoding}
+        captured = {}
+
+        def start_response(status, headers, exc_info=None):
+            captured['status'] = status
+            captured['headers'] = dict(headers)
+
+        body = app(environ, start_response)
+        chunks = list(body)
+        if hasattr(body, 'close'):
+            body.close()
+        return captured['headers'], chunks
+
+    @staticmethod
+    def application(body, content_type='text/html; charset=utf-8', streamed=False, etag=None):
+        def app(environ, start_response):
+            headers = [('Content-Type', content_type)]
+            if not streamed:
+                headers.append(('Content-Length', str(len(body))))
+            if etag:
+                headers.append(('ETag', etag))
+            start_response('200 OK', headers)
+            if streamed:
+                return iter([body[:500], body[500:]])
+            return [body]
+        return app
+
+    def test_buffered_response_is_compressed(self):
+        """Known-length bodies get an exact compressed Content-Length and weak ETag."""
+        app = CompressResponses(CONFIG).wrap(self.application(HTML, etag='"abc"'))
+        headers, chunks = self.request(app)
+
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(headers['ETag'], 'W/"abc"')
+        self.assertEqual(int(headers['Content-Length']), len(b''.join(chunks)))
+        self.assertEqual(gzip.decompress(b''.join(chunks)), HTML)
+
+    def test_streamed_response_flushes_each_chunk(self):
+        """Streamed bodies are compressed chunk by chunk and each chunk is decodable."""
+        app = CompressResponses(CONFIG).wrap(self.application(HTML, streamed=True))
+        headers, chunks = self.request(app)
+
+        self.assertNotIn('Content-Length', headers)
+        decoder = zlib.decompressobj(31)
+        self.assertEqual(decoder.decompress(chunks[0]), HTML[:500])
+        self.assertEqual(gzip.decompress(b''.join(chunks)), HTML)
+
+    def test_thresholds_and_exclusions(self):
+        """Small, non-allowlisted, excluded, HEAD and non-accepting requests pass through."""
+        compression = CompressResponses(CONFIG)
+        cases = [
+            (self.application(b'tiny'), {}),
+            (self.application(HTML, content_type='image/png'), {}),
+            (self.application(HTML), {'path': '/build/assets/app.js'}),
+            (self.application(HTML), {'method': 'HEAD'}),
+            (self.application(HTML), {'accept_encoding': 'br;q=1, gzip;q=0'}),
+        ]
+        for app, request in cases:
+            with self.subTest(**request):
+                headers, _ = self.request(compression.wrap(app), **request)
+                self.assertNotIn('Content-Encoding', headers)
+
+    def test_levels_per_route_group(self):
+        """Route groups pick their own compression levels."""
+        compression = CompressResponses(CONFIG)
+        self.assertEqual(compression.levels_for('/api/data')['gzip'], 1)
+        self.assertEqual(compression.levels_for('/contact')['gzip'], 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
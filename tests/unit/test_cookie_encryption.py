@@ -0,0 +1,90 @@
+"""
+Unit tests for lazy cookie decryption and ciphertext reuse.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+try:
+    from app.Http.CookieEncryption import CookieEncrypter, LazyDecryptedCookies, fernet_key_from_app_key
+except ImportError:
+    CookieEncrypter = None
+
+
+@unittest.skipIf(CookieEncrypter is None, "cookie encryption requires cryptography")
+class TestCookieEncryption(UnitTestCase):
+    """Tests for CookieEncrypter and LazyDecryptedCookies."""
+
+    def setUp(self):
+        super().setUp()
+        self.encrypter = CookieEncrypter('base64:' + 'A' * 43 + '=', except_cookies=['plain'])
+        self.session = self.encrypter.encrypt('session-value')
+        self.theme = self.encrypter.encrypt('dark')
+        self.encrypter.decrypted.clear()
+
+    def cookies(self, **raw):
+        return LazyDecryptedCookies(raw, self.encrypter)
+
+    def test_cookies_are_decrypted_when_read(self):
+        """Only the cookies a handler reads are decrypted, each once."""
+        cookies = self.cookies(session=self.session, theme=self.theme)
+        with mock.patch.object(self.encrypter.fernet, 'decrypt', wraps=self.encrypter.fernet.decrypt) as decrypt:
+            self.assertEqual(cookies['session'], 'session-value')
+            self.assertEqual(cookies.get('session'), 'session-value')
+            self.assertEqual(decrypt.call_count, 1)
+
+        self.assertNotIn('theme', cookies._plaintext)
+
+    def test_decrypted_values_are_cached_across_requests(self):
+        """A ciphertext seen before is answered from the LRU."""
+        self.cookies(session=self.session)['session']
+        with mock.patch.object(self.encrypter.fernet, 'decrypt') as decrypt:
+            self.assertEqual(self.cookies(session=self.session)['session'], 'session-value')
+        decrypt.assert_not_called()
+
+    def test_invalid_and_excluded_cookies(self):
+        """Tampered cookies read as absent; excluded cookies pass through."""
+        cookies = self.cookies(session='tampered', plain='visible')
+        self.assertNotIn('session', cookies)
+        self.assertIsNone(cookies.get('session'))
+        self.assertEqual(cookies.to_dict(), {'plain': 'visible'})
+        self.assertEqual(cookies.getlist('plain'), ['visible'])
+
+    def test_unchanged_cookies_reuse_their_ciphertext(self):
+        """Re-setting a value that was read keeps the request's ciphertext."""
+        cookies = self.cookies(session=self.session, theme=self.theme)
+        cookies['session']
+        headers = self.encrypter.encrypt_headers(
+            ['session=session-value; Path=/; HttpOnly', 'theme=dark; Path=/', 'plain=x; Path=/'],
+            cookies,
+        )
+
+        self.assertEqual(headers[0], f"session={self.session}; Path=/; HttpOnly")
+        # Never read during the request, so it is encrypted afresh
+        self.assertNotEqual(headers[1], f"theme={self.theme}; Path=/")
+        self.assertEqual(self.encrypter.decrypt(headers[1].split('=', 1)[1].split(';')[0]), 'dark')
+        self.assertEqual(headers[2], 'plain=x; Path=/')
+
+    def test_changed_cookies_are_encrypted_again(self):
+        """A new value gets a new ciphertext."""
+        cookies = self.cookies(session=self.session)
+        cookies['session']
+        header = self.encrypter.encrypt_headers(['session=other; Path=/'], cookies)[0]
+        ciphertext = header.split('=', 1)[1].split(';')[0]
+        self.assertNotEqual(ciphertext, self.session)
+        self.assertEqual(self.encrypter.decrypt(ciphertext), 'other')
+
+    def test_app_key_derivation(self):
+        """base64: keys of 32 bytes are used as-is; other keys are hashed."""
+        self.assertEqual(fernet_key_from_app_key('base64:' + 'A' * 43 + '='), b'A' * 43 + b'=')
+        self.assertEqual(len(fernet_key_from_app_key('plain secret')), 44)
+
+
+if __name__ == '__main__':
+    unittest.main()
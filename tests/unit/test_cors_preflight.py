@@ -0,0 +1,103 @@
+"""
+Unit tests for the WSGI-level CORS preflight short-circuit.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.Middleware.CorsPreflight import CorsPreflight
+
+
+CORS_CONFIG = {
+    'paths': ['api/*'],
+    'allowed_origins': ['*'],
+    'allowed_methods': ['*'],
+    'allowed_headers': ['*'],
+    'exposed_headers': [],
+    'max_age': 600,
+    'supports_credentials': False,
+}
+
+
+class TestCorsPreflight(UnitTestCase):
+    """Tests for CorsPreflight."""
+
+    def setUp(self):
+        super().setUp()
+        self.app_calls = []
+
+        def app(environ, start_response):
+            self.app_calls.append(environ['PATH_INFO'])
+            start_response('200 OK', [])
+            return [b'app']
+
+        self.app = app
+
+    def call(self, preflight, path, method='OPTIONS', **headers):
+        environ = {'REQUEST_METHOD': method, 'PATH_INFO': path}
+        environ.update(headers)
+        captured = {}
+
+        def start_response(status, response_headers):
+            captured['status'] = status
+            captured['headers'] = dict(response_headers)
+
+        body = preflight.wrap(self.app)(environ, start_response)
+        return captured['status'], captured['headers'], body
+
+    def test_preflight_is_answered_without_reaching_app(self):
+        """Matching preflights short-circuit with the precomputed headers."""
+        status, headers, _ = self.call(
+            CorsPreflight(CORS_CONFIG), '/api/data',
+            HTTP_ORIGIN='https://example.com',
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD='POST',
+            HTTP_ACCESS_CONTROL_REQUEST_HEADERS='authorization, content-type',
+        )
+
+        self.assertEqual(status, '204 No Content')
+        self.assertEqual(self.app_calls, [])
+        self.assertEqual(headers['Access-Control-Allow-Origin'], '*')
+        self.assertEqual(headers['Access-Control-Allow-Methods'], '*')
+        self.assertEqual(headers['Access-Control-Allow-Headers'], 'authorization, content-type')
+        self.assertEqual(headers['Access-Control-Max-Age'], '600')
+
+    def test_other_requests_pass_through(self):
+        """Non-preflight requests and unmatched paths reach the app."""
+        preflight = CorsPreflight(CORS_CONFIG)
+
+        self.call(preflight, '/api/data', method='GET')
+        self.call(preflight, '/contact', HTTP_ACCESS_CONTROL_REQUEST_METHOD='POST')
+        self.call(preflight, '/api/data')
+
+        self.assertEqual(self.app_calls, ['/api/data', '/contact', '/api/data'])
+
+    def test_credentials_echo_allowed_origin_only(self):
+        """With credentials, only listed origins are echoed back."""
+        config = dict(CORS_CONFIG, allowed_origins=['https://app.example.com'], supports_credentials=True)
+        preflight = CorsPreflight(config)
+
+        _, headers, _ = self.call(
+            preflight, '/api/users',
+            HTTP_ORIGIN='https://app.example.com',
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD='DELETE',
+        )
+        self.assertEqual(headers['Access-Control-Allow-Origin'], 'https://app.example.com')
+        self.assertEqual(headers['Access-Control-Allow-Methods'], 'DELETE')
+        self.assertEqual(headers['Access-Control-Allow-Credentials'], 'true')
+        self.assertIn('Origin', headers['Vary'])
+
+        _, headers, _ = self.call(
+            preflight, '/api/users',
+            HTTP_ORIGIN='https://evil.example.com',
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD='DELETE',
+        )
+        self.assertNotIn('Access-Control-Allow-Origin', headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for cursor and keyset streaming.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+from orm import Database, Model
+
+from app.Support.Database import EagerLoading, StreamsQueries, UsesIdentityMap, identity_map
+from app.Support.Database.Cursor import _format_placeholders, raw_connection
+
+
+DB = Database()
+DB.create('members', ['id INTEGER PRIMARY KEY', 'name TEXT', 'active INTEGER'],
+          [{'id': index, 'name': f"member {index}", 'active': index % 2} for index in range(1, 26)])
+
+
+class SqliteModel(Model):
+    database = DB
+
+
+class Member(StreamsQueries, UsesIdentityMap, EagerLoading, SqliteModel):
+    table = 'members'
+
+
+class TestCursor(UnitTestCase):
+    """Tests for cursor(), chunk_by_id() and lazy_by_id()."""
+
+    def setUp(self):
+        super().setUp()
+        DB.reset()
+
+    def test_cursor_streams_hydrated_models(self):
+        """cursor() runs the compiled query once and yields models lazily."""
+        members = Member.query().where('active', 1).cursor(fetch_size=4)
+        first = next(members)
+        self.assertIsInstance(first, Member)
+        self.assertEqual(first.attributes['name'], 'member 1')
+        self.assertEqual(len(list(members)), 12)
+        self.assertEqual(DB.statements, [])
+
+    def test_cursor_bypasses_the_identity_map(self):
+        """Streamed models are not retained by an active identity map."""
+        with identity_map() as identity:
+            self.assertEqual(sum(1 for _ in Member.cursor()), 25)
+            self.assertEqual(len(identity), 0)
+
+    def test_chunk_by_id_pages_with_keyset_queries(self):
+        """Pages continue after the last key instead of using OFFSET."""
+        chunks = list(Member.chunk_by_id(10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual(chunks[1][0].attributes['id'], 11)
+        self.assertEqual(DB.statements[1], ('SELECT * FROM members WHERE id > ? ORDER BY id ASC LIMIT 10', [10]))
+        self.assertEqual(len(DB.statements), 3)
+
+    def test_lazy_by_id_keeps_constraints(self):
+        """Keyset pages keep the query's own constraints."""
+        ids = [member.attributes['id'] for member in Member.query().where('active', 0).lazy_by_id(5)]
+        self.assertEqual(ids, list(range(2, 26, 2)))
+
+    def test_placeholders_and_connection_lookup(self):
+        """? becomes %s outside literals and % is escaped; the DB-API connection is found."""
+        self.assertEqual(
+            _format_placeholders("SELECT * FROM t WHERE a = ? AND b LIKE '50%?' AND c LIKE ?"),
+            "SELECT * FROM t WHERE a = %s AND b LIKE '50%%?' AND c LIKE %s",
+        )
+        self.assertEqual(_format_placeholders("SELECT 10 % ?"), "SELECT 10 %% %s")
+        self.assertIs(raw_connection(Member.query()._query), DB.connection)
+
+
+if __name__ == '__main__':
+    unittest.main()
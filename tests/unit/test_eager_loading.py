@@ -0,0 +1,125 @@
+"""
+Unit tests for relation eager loading.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+from orm import Database, Model
+
+from app.Support.Database import EagerLoading, RelationNotFound
+
+# The package re-exports the class under the module's name
+eager_loading_module = sys.modules['app.Support.Database.EagerLoading']
+
+
+DB = Database()
+DB.create('users', ['id INTEGER PRIMARY KEY', 'name TEXT'],
+          [{'id': 1, 'name': 'Ann'}, {'id': 2, 'name': 'Bob'}, {'id': 3, 'name': 'Cy'}])
+DB.create('posts', ['id INTEGER PRIMARY KEY', 'user_id INTEGER', 'status TEXT'], [
+    {'id': 10, 'user_id': 1, 'status': 'published'},
+    {'id': 11, 'user_id': 1, 'status': 'draft'},
+    {'id': 12, 'user_id': 2, 'status': 'published'},
+])
+DB.create('roles', ['id INTEGER PRIMARY KEY', 'name TEXT'], [{'id': 100, 'name': 'admin'}, {'id': 101, 'name': 'editor'}])
+DB.create('user_roles', ['user_id INTEGER', 'role_id INTEGER'],
+          [{'user_id': 1, 'role_id': 100}, {'user_id': 1, 'role_id': 101}, {'user_id': 2, 'role_id': 101}])
+DB.create('permissions', ['id INTEGER PRIMARY KEY', 'role_id INTEGER', 'name TEXT'], [
+    {'id': 1000, 'role_id': 100, 'name': 'manage'},
+    {'id': 1001, 'role_id': 101, 'name': 'edit'},
+])
+
+
+class SqliteModel(Model):
+    database = DB
+
+
+class Permission(EagerLoading, SqliteModel):
+    table = 'permissions'
+
+
+class Role(EagerLoading, SqliteModel):
+    table = 'roles'
+
+    def permissions(self):
+        return self.has_many('Permission', 'role_id', 'id')
+
+
+class Post(EagerLoading, SqliteModel):
+    table = 'posts'
+
+    def user(self):
+        return self.belongs_to('User', 'user_id', 'id')
+
+    def slug(self):
+        return 'not-a-relation'
+
+
+class User(EagerLoading, SqliteModel):
+    table = 'users'
+
+    def posts(self):
+        return self.has_many('Post', 'user_id', 'id')
+
+    def roles(self):
+        return self.belongs_to_many('Role', 'user_roles', 'user_id', 'role_id')
+
+
+class TestEagerLoading(UnitTestCase):
+    """Tests for EagerLoading."""
+
+    def setUp(self):
+        super().setUp()
+        DB.reset()
+
+    def test_one_query_per_relation_level(self):
+        """Nested relations are loaded with one IN query per level."""
+        users = User.with_('posts', 'roles.permissions').get()
+
+        self.assertEqual(DB.selects(), ['users', 'posts', 'roles', 'permissions'])
+        ann, bob, cy = users
+        self.assertEqual([post.attributes['id'] for post in ann.get_relation('posts')], [10, 11])
+        self.assertEqual(cy.get_relation('posts'), [])
+        self.assertEqual(sorted(role.attributes['name'] for role in ann.get_relation('roles')), ['admin', 'editor'])
+        self.assertEqual(
+            [permission.attributes['name'] for permission in bob.get_relation('roles')[0].get_relation('permissions')],
+            ['edit'],
+        )
+        self.assertIn('JOIN user_roles ON user_roles.role_id = roles.id', DB.statements[2][0])
+
+    def test_constrained_and_belongs_to(self):
+        """Constraints apply to their relation's query; belongs_to attaches a single model."""
+        users = User.with_({'posts': lambda query: query.where('status', 'published')}).where('id', 1).get()
+        self.assertEqual([post.attributes['id'] for post in users[0].get_relation('posts')], [10])
+
+        posts = Post.with_('user').get()
+        self.assertEqual([post.get_relation('user').attributes['name'] for post in posts], ['Ann', 'Ann', 'Bob'])
+
+    def test_batches_keys(self):
+        """Large key sets are split below the bound-parameter limit."""
+        users = User.query().get()
+        DB.reset()
+        with mock.patch.object(eager_loading_module, 'BATCH_SIZE', 2):
+            User.load_relations(users, 'posts')
+        self.assertEqual(DB.selects(), ['posts', 'posts'])
+        self.assertEqual([bindings for _, bindings in DB.statements], [[1, 2], [3]])
+
+    def test_lazy_relation_and_errors(self):
+        """get_relation() loads on first use; non-relations are rejected."""
+        user = User.query().first()
+        DB.reset()
+        self.assertEqual(len(user.get_relation('posts')), 2)
+        self.assertEqual(len(user.get_relation('posts')), 2)
+        self.assertEqual(len(DB.statements), 1)
+
+        with self.assertRaises(RelationNotFound):
+            Post.with_('slug').get()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for ETag helpers.
+"""
+
+import unittest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.ETag import body_etag, conditional_json, etag, etag_matches, version_etag
+
+try:
+    from flask import Flask, Response, jsonify
+except ImportError:
+    Flask = None
+
+try:
+    from app.Http.Controllers.ApiController import ApiController
+    from app.Http.Controllers.HomeController import HomeController
+except ImportError:
+    ApiController = None
+
+
+class VersionedController:
+    """Controller whose actions count how often they run."""
+
+    version = 1
+
+    def __init__(self):
+        self.calls = 0
+
+    @etag(lambda self, id: (self.version, id))
+    def show(self, id):
+        self.calls += 1
+        return {'id': id}
+
+    @etag(lambda self: None)
+    def unversioned(self):
+        self.calls += 1
+        return {'unversioned': True}
+
+
+def conditional_app():
+    """Flask app with conditional_json installed like bootstrap.app does"""
+    flask_app = Flask(__name__)
+    flask_app.after_request(conditional_json)
+    flask_app.add_url_rule('/data', 'data', lambda: {'items': [1, 2, 3]})
+    flask_app.add_url_rule('/missing', 'missing', lambda: (jsonify(error='not found'), 404))
+    flask_app.add_url_rule('/stream', 'stream', lambda: Response(iter([b'[1]']), mimetype='application/json'))
+    return flask_app
+
+
+class TestETag(UnitTestCase):
+    """Tests for the ETag helpers."""
+
+    def test_body_etag_is_stable(self):
+        """Equal bodies hash to the same value; different bodies do not."""
+        self.assertEqual(body_etag(b'{"a": 1}'), body_etag(b'{"a": 1}'))
+        self.assertNotEqual(body_etag(b'{"a": 1}'), body_etag(b'{"a": 2}'))
+
+    def test_version_etag_uses_timestamps(self):
+        """A newer updated_at produces a new ETag."""
+        first = version_etag('ApiController.show', datetime(2024, 1, 1, 12, 0))
+        self.assertEqual(first, version_etag('ApiController.show', datetime(2024, 1, 1, 12, 0)))
+        self.assertNotEqual(first, version_etag('ApiController.show', datetime(2024, 1, 1, 12, 1)))
+        self.assertNotEqual(first, version_etag('ApiController.index', datetime(2024, 1, 1, 12, 0)))
+
+    def test_if_none_match_uses_weak_comparison(self):
+        """Weak and strong forms of the same tag match; lists and * are supported."""
+        self.assertTrue(etag_matches('W/"abc"', 'abc'))
+        self.assertTrue(etag_matches('"xyz", "abc"', 'abc'))
+        self.assertTrue(etag_matches('*', 'abc'))
+        self.assertFalse(etag_matches('W/"abd"', 'abc'))
+        self.assertFalse(etag_matches(None, 'abc'))
+
+
+@unittest.skipIf(Flask is None, "conditional response tests require Flask")
+class TestConditionalJson(UnitTestCase):
+    """Request-level tests for the conditional_json after_request hook."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = conditional_app().test_client()
+
+    def test_json_responses_get_a_weak_etag(self):
+        """A 200 JSON response carries a weak ETag of its body."""
+        response = self.client.get('/data')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['ETag'], f'W/"{body_etag(response.get_data())}"')
+
+    def test_matching_if_none_match_is_answered_with_304(self):
+        """A current client copy gets an empty 304 with the same ETag."""
+        tag = self.client.get('/data').headers['ETag']
+        response = self.client.get('/data', headers={'If-None-Match': tag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), b'')
+        self.assertEqual(response.headers['ETag'], tag)
+
+        self.assertEqual(self.client.get('/data', headers={'If-None-Match': 'W/"stale"'}).status_code, 200)
+
+    def test_head_requests(self):
+        """HEAD gets the GET ETag and honours If-None-Match."""
+        tag = self.client.get('/data').headers['ETag']
+        self.assertEqual(self.client.head('/data').headers['ETag'], tag)
+        self.assertEqual(self.client.head('/data', headers={'If-None-Match': tag}).status_code, 304)
+
+    def test_errors_and_streams_are_left_alone(self):
+        """Non-200 and streamed JSON responses get no ETag and never 304."""
+        response = self.client.get('/missing', headers={'If-None-Match': '*'})
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response.headers)
+
+        response = self.client.get('/stream', headers={'If-None-Match': '*'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b'[1]')
+        self.assertNotIn('ETag', response.headers)
+
+
+@unittest.skipIf(Flask is None, "conditional response tests require Flask")
+class TestEtagDecorator(UnitTestCase):
+    """Request-level tests for the etag decorator."""
+
+    def setUp(self):
+        super().setUp()
+        self.controller = VersionedController()
+        flask_app = conditional_app()
+        flask_app.add_url_rule('/posts/<int:id>', 'show', self.controller.show)
+        flask_app.add_url_rule('/unversioned', 'unversioned', self.controller.unversioned)
+        self.client = flask_app.test_client()
+
+    def test_304_is_answered_before_the_action_runs(self):
+        """A matching version skips the action; a new version runs it again."""
+        response = self.client.get('/posts/3')
+        tag = response.headers['ETag']
+        self.assertEqual(tag, f'W/"{version_etag("VersionedController.show", (1, 3))}"')
+        self.assertEqual(response.get_json(), {'id': 3})
+
+        response = self.client.get('/posts/3', headers={'If-None-Match': tag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.controller.calls, 1)
+
+        self.client.head('/posts/3', headers={'If-None-Match': tag})
+        self.assertEqual(self.controller.calls, 1)
+
+        self.controller.version = 2
+        self.assertEqual(self.client.get('/posts/3', headers={'If-None-Match': tag}).status_code, 200)
+        self.assertEqual(self.controller.calls, 2)
+
+    def test_unversioned_requests_fall_back_to_the_body_etag(self):
+        """A None version runs the action and conditional_json hashes the body."""
+        response = self.client.get('/unversioned')
+        tag = response.headers['ETag']
+        self.assertEqual(tag, f'W/"{body_etag(response.get_data())}"')
+        self.assertEqual(self.client.get('/unversioned', headers={'If-None-Match': tag}).status_code, 304)
+
+
+@unittest.skipIf(Flask is None or ApiController is None, "controller tests require larapy")
+class TestControllerEtags(UnitTestCase):
+    """The API actions answer 304 from their version."""
+
+    def test_api_actions_are_versioned(self):
+        flask_app = conditional_app()
+        flask_app.add_url_rule('/api/data', 'api_data', HomeController().api_data)
+        flask_app.add_url_rule('/api', 'index', ApiController().index)
+        flask_app.add_url_rule('/api/<int:id>', 'show', ApiController().show)
+        client = flask_app.test_client()
+
+        for path in ('/api/data', '/api', '/api/1'):
+            tag = client.get(path).headers['ETag']
+            self.assertEqual(client.get(path, headers={'If-None-Match': tag}).status_code, 304)
+
+
+if __name__ == '__main__':
+    unittest.main()
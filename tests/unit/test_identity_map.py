@@ -0,0 +1,180 @@
+"""
+Unit tests for the per-request identity map.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+from orm import Database, Model
+
+from app.Support.Database import (
+    EagerLoading, UsesIdentityMap, current_identity_map, identity_map, within_identity_map,
+)
+
+try:
+    from flask import Flask, Response, stream_with_context
+except ImportError:
+    Flask = None
+
+try:
+    from app.Http.Middleware.IdentityMap import IdentityMapMiddleware
+except ImportError:
+    IdentityMapMiddleware = None
+
+
+DB = Database()
+DB.create('authors', ['id INTEGER PRIMARY KEY', 'email TEXT'],
+          [{'id': 1, 'email': 'ann@example.com'}, {'id': 2, 'email': 'bob@example.com'}])
+DB.create('articles', ['id INTEGER PRIMARY KEY', 'author_id INTEGER'],
+          [{'id': 10, 'author_id': 1}, {'id': 11, 'author_id': 1}, {'id': 12, 'author_id': 2}])
+DB.create('labels', ['id INTEGER PRIMARY KEY', 'name TEXT'], [{'id': 100, 'name': 'news'}])
+DB.create('article_labels', ['article_id INTEGER', 'label_id INTEGER'],
+          [{'article_id': 10, 'label_id': 100}, {'article_id': 11, 'label_id': 100}])
+
+
+class SqliteModel(Model):
+    database = DB
+
+
+class Author(UsesIdentityMap, EagerLoading, SqliteModel):
+    table = 'authors'
+
+
+class Label(UsesIdentityMap, EagerLoading, SqliteModel):
+    table = 'labels'
+
+
+class Article(UsesIdentityMap, EagerLoading, SqliteModel):
+    table = 'articles'
+
+    def author(self):
+        return self.belongs_to(Author, 'author_id', 'id')
+
+    def labels(self):
+        return self.belongs_to_many(Label, 'article_labels', 'article_id', 'label_id')
+
+
+class TestIdentityMap(UnitTestCase):
+    """Tests for IdentityMap and UsesIdentityMap."""
+
+    def setUp(self):
+        super().setUp()
+        DB.reset()
+
+    def tearDown(self):
+        DB.connection.execute('DELETE FROM authors WHERE id > 2')
+        super().tearDown()
+
+    def test_find_is_served_from_the_map(self):
+        """Repeated finds return the same instance with one query."""
+        with identity_map() as identity:
+            first = Author.find(1)
+            self.assertIs(Author.find('1'), first)
+            self.assertEqual(DB.selects(), ['authors'])
+            self.assertEqual(identity.hits, 1)
+
+        self.assertIsNone(current_identity_map())
+        self.assertIsNot(Author.find(1), first)
+
+    def test_query_results_share_instances(self):
+        """Rows loaded by any query resolve to the mapped instance."""
+        with identity_map():
+            found = Author.find(1)
+            by_email = Author.query().where('email', 'ann@example.com').first()
+            everyone = Author.query().get()
+        self.assertIs(by_email, found)
+        self.assertIs(everyone[0], found)
+
+    def test_partial_rows_stay_out_of_the_map(self):
+        """Column-restricted results are not mapped, so find() still loads the full row."""
+        with identity_map() as identity:
+            partial = Author.query().select('id').first()
+            self.assertEqual(partial.attributes, {'id': 1})
+            self.assertEqual(len(identity), 0)
+
+            found = Author.find(1)
+            self.assertEqual(found.attributes['email'], 'ann@example.com')
+            self.assertIsNot(found, partial)
+
+    def test_belongs_to_skips_loaded_owners(self):
+        """Eager loads only query owners not yet in the map."""
+        with identity_map():
+            ann = Author.find(1)
+            articles = Article.with_('author').get()
+            self.assertEqual(DB.selects(), ['authors', 'articles', 'authors'])
+            self.assertEqual(DB.statements[-1][1], [2])
+            self.assertIs(articles[0].get_relation('author'), ann)
+            self.assertIs(articles[1].get_relation('author'), ann)
+            self.assertIs(articles[2].get_relation('author'), Author.find(2))
+            self.assertEqual(len(DB.statements), 3)
+
+    def test_pivot_columns_stay_off_mapped_models(self):
+        """belongs_to_many rows are matched by pivot key without keeping it as an attribute."""
+        with identity_map():
+            articles = Article.with_('labels').get()
+            news = articles[0].get_relation('labels')[0]
+            self.assertIs(articles[1].get_relation('labels')[0], news)
+            self.assertEqual(news.attributes, {'id': 100, 'name': 'news'})
+            self.assertIs(Label.find(100), news)
+
+    def test_writes_keep_the_map_coherent(self):
+        """Saved models become mapped; deleted ones are forgotten."""
+        with identity_map() as identity:
+            author = Author({'email': 'new@example.com'})
+            author.save()
+            self.assertIs(Author.find(author.attributes['id']), author)
+
+            author.delete()
+            self.assertEqual(len(identity), 0)
+
+    def test_nested_units_share_the_map(self):
+        """An inner unit of work reuses the outer map."""
+        with identity_map() as outer:
+            with identity_map() as inner:
+                self.assertIs(inner, outer)
+
+
+@unittest.skipIf(Flask is None, "streamed responses require Flask")
+class TestWithinIdentityMap(UnitTestCase):
+    """Tests for within_identity_map() around Flask responses."""
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+
+        def body():
+            first = Author.find(1)
+            yield f"{current_identity_map() is not None},"
+            yield f"{Author.find(1) is first}"
+
+        @self.app.route('/streamed')
+        def streamed():
+            return within_identity_map(lambda: Response(stream_with_context(body())))
+
+        @self.app.route('/buffered')
+        def buffered():
+            return within_identity_map(lambda: f"{Author.find(1) is Author.find(1)}")
+
+    def test_streamed_bodies_render_inside_the_map(self):
+        """The map opened for the request is still active while the body streams."""
+        response = self.app.test_client().get('/streamed')
+        self.assertEqual(response.get_data(as_text=True), 'True,True')
+        self.assertIsNone(current_identity_map())
+
+    def test_buffered_responses(self):
+        """Buffered handlers run inside the map."""
+        self.assertEqual(self.app.test_client().get('/buffered').get_data(as_text=True), 'True')
+
+    @unittest.skipIf(IdentityMapMiddleware is None, "middleware requires larapy")
+    def test_middleware_scopes_the_map_to_the_request(self):
+        """IdentityMapMiddleware hands the request to within_identity_map()."""
+        response = IdentityMapMiddleware().handle(None, lambda request: Author.find(1) is Author.find(1))
+        self.assertTrue(response)
+
+
+if __name__ == '__main__':
+    unittest.main()
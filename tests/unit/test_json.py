@@ -0,0 +1,129 @@
+"""
+Unit tests for JSON encoding.
+"""
+
+import datetime
+import decimal
+import json
+import unittest
+import uuid
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http import Json
+
+try:
+    from flask import Flask
+    from app.Http.JsonProvider import FastJSONProvider, install_json_provider
+except ImportError:
+    Flask = None
+
+
+class Record:
+    """Model-like object"""
+
+    def to_dict(self):
+        return {'id': 7, 'name': 'Jane'}
+
+
+VALUE = {
+    'created_at': datetime.datetime(2024, 5, 1, 12, 30, 15),
+    'due': datetime.date(2024, 6, 1),
+    'price': decimal.Decimal('19.990'),
+    'token': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'user': Record(),
+    'tags': ('a', 'b'),
+    'name': 'Zoë',
+}
+
+EXPECTED = {
+    'created_at': 'Wed, 01 May 2024 12:30:15 GMT',
+    'due': 'Sat, 01 Jun 2024 00:00:00 GMT',
+    'price': '19.990',
+    'token': '12345678-1234-5678-1234-567812345678',
+    'user': {'id': 7, 'name': 'Jane'},
+    'tags': ['a', 'b'],
+    'name': 'Zoë',
+}
+
+
+class TestJson(UnitTestCase):
+    """Tests for app.Http.Json."""
+
+    def test_application_types(self):
+        """Both encoders serialize dates, decimals, UUIDs and models alike."""
+        encoded = Json.dumps(VALUE)
+        self.assertEqual(json.loads(encoded), EXPECTED)
+
+        with mock.patch.object(Json, 'orjson', None):
+            fallback = Json.dumps(VALUE)
+        self.assertEqual(json.loads(fallback), EXPECTED)
+        self.assertIn('Zoë'.encode('utf-8'), fallback)
+
+    def test_iso_dates(self):
+        """iso_dates switches datetimes and dates to ISO 8601 in both encoders."""
+        value = {'created_at': VALUE['created_at'], 'due': VALUE['due'], 'at': datetime.time(9, 5)}
+        expected = {'created_at': '2024-05-01T12:30:15', 'due': '2024-06-01', 'at': '09:05:00'}
+
+        self.assertEqual(json.loads(Json.dumps(value, iso_dates=True)), expected)
+        with mock.patch.object(Json, 'orjson', None):
+            self.assertEqual(json.loads(Json.dumps(value, iso_dates=True)), expected)
+        self.assertEqual(json.loads(b''.join(Json.stream_json([value], iso_dates=True))), [expected])
+
+    def test_compact_sorted_and_indented(self):
+        """Output is compact by default; keys sort and indent on request."""
+        with mock.patch.object(Json, 'orjson', None):
+            self.assertEqual(Json.dumps({'b': 1, 'a': [1, 2]}), b'{"b":1,"a":[1,2]}')
+            self.assertEqual(Json.dumps({'b': 1, 'a': 2}, sort_keys=True), b'{"a":2,"b":1}')
+            self.assertIn(b'\n  "b": 1', Json.dumps({'b': 1}, indent=True))
+
+    def test_unserializable_value(self):
+        """Unknown objects raise TypeError."""
+        with self.assertRaises(TypeError):
+            Json.dumps({'value': object()})
+
+    def test_stream_json(self):
+        """Streamed arrays are valid JSON and split at the buffer size."""
+        items = [{'id': index, 'name': f'user {index}'} for index in range(100)]
+        chunks = list(Json.stream_json(items, buffer_size=256))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json.loads(b''.join(chunks)), items)
+        self.assertEqual(b''.join(Json.stream_json([])), b'[]')
+
+
+@unittest.skipIf(Flask is None, "JSON provider tests require Flask")
+class TestJsonProvider(UnitTestCase):
+    """Tests for the provider installed by configure_flask_app."""
+
+    def test_dates_match_flask_by_default(self):
+        """Datetimes and dates are encoded like Flask's default provider."""
+        flask_app = Flask(__name__)
+        value = {'created_at': VALUE['created_at'], 'due': VALUE['due']}
+        flask_output = json.loads(flask_app.json.dumps(value))
+
+        provider = install_json_provider(flask_app)
+        self.assertIsInstance(flask_app.json, FastJSONProvider)
+        self.assertEqual(json.loads(provider.dumps(value)), flask_output)
+        self.assertEqual(flask_output['created_at'], 'Wed, 01 May 2024 12:30:15 GMT')
+
+        with flask_app.test_request_context():
+            response = provider.response(value)
+        self.assertEqual(response.get_json(), flask_output)
+
+    def test_iso_dates_are_opt_in(self):
+        """JSON_ISO_DATES switches responses to ISO 8601."""
+        flask_app = Flask(__name__)
+        provider = install_json_provider(flask_app, iso_dates=True)
+        with flask_app.test_request_context():
+            response = provider.response({'created_at': VALUE['created_at']})
+        self.assertEqual(response.get_json(), {'created_at': '2024-05-01T12:30:15'})
+
+
+if __name__ == '__main__':
+    unittest.main()
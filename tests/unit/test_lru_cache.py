@@ -0,0 +1,66 @@
+"""
+Unit tests for the in-process LRU cache.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Support.Cache import LruCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLruCache(UnitTestCase):
+    """Tests for LruCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Reading an entry protects it from eviction."""
+        cache = LruCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_entries_expire_after_ttl(self):
+        """Entries stored with a TTL expire on read."""
+        clock = FakeClock()
+        cache = LruCache(clock=clock)
+        cache.set('token', 'value', ttl=10)
+
+        clock.now = 9.9
+        self.assertIn('token', cache)
+        clock.now = 10.0
+        self.assertNotIn('token', cache)
+
+    def test_delete_and_clear(self):
+        """Entries can be removed individually or all at once."""
+        cache = LruCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        self.assertTrue(cache.delete('a'))
+        self.assertFalse(cache.delete('a'))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
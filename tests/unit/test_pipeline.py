@@ -0,0 +1,151 @@
+"""
+Unit tests for the compiled middleware pipeline.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.Pipeline import PipelineCompiler
+from app.Http.Router import Router
+
+try:
+    from flask import Flask
+except ImportError:
+    Flask = None
+
+
+class RecordingMiddleware:
+    """Middleware recording the order it runs in."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def handle(self, request, next_handler):
+        self.log.append(f"{self.name}:before")
+        response = next_handler(request)
+        self.log.append(f"{self.name}:after")
+        return response
+
+
+class TestPipelineCompiler(UnitTestCase):
+    """Tests for PipelineCompiler."""
+
+    def setUp(self):
+        super().setUp()
+        self.log = []
+        self.groups = {
+            'global': (RecordingMiddleware('headers', self.log), RecordingMiddleware('cors', self.log)),
+            'api': (RecordingMiddleware('throttle', self.log),),
+        }
+        self.compiler = PipelineCompiler(lambda group: self.groups.get(group, ()))
+
+    def test_chain_runs_in_group_order(self):
+        """Middleware run outermost first and unwind in reverse."""
+        def route(id):
+            self.log.append(f"route:{id}")
+            return 'ok'
+
+        pipeline = self.compiler.compile(['global', 'api'])
+        dispatch = pipeline.then(route, request_resolver=lambda: 'request')
+
+        self.assertEqual(dispatch(id=7), 'ok')
+        self.assertEqual(self.log, [
+            'headers:before', 'cors:before', 'throttle:before',
+            'route:7',
+            'throttle:after', 'cors:after', 'headers:after',
+        ])
+
+    def test_pipelines_are_cached_by_group_tuple(self):
+        """The same group combination compiles to one shared pipeline."""
+        self.assertIs(self.compiler.compile(['global', 'api']), self.compiler.compile(('global', 'api')))
+        self.assertIsNot(self.compiler.compile(['global']), self.compiler.compile(['global', 'api']))
+
+    def test_dump_lists_chain_per_endpoint(self):
+        """Bound routes are reported with their groups and middleware."""
+        self.compiler.bind(lambda: None, ['global', 'api'], endpoint='api.data')
+
+        self.assertEqual(self.compiler.dump(), {
+            'api.data': {
+                'groups': ['global', 'api'],
+                'middleware': ['RecordingMiddleware'] * 3,
+            }
+        })
+
+
+class FlaskRouter:
+    """Larapy-like router registering GET routes on a Flask app."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+
+    def get(self, path, handler):
+        self.flask_app.add_url_rule(path, handler.__name__, handler, methods=['GET'])
+
+
+class HomeController:
+    """Controller used as a route target."""
+
+    def index(self):
+        return 'home'
+
+    def data(self):
+        return {'data': []}
+
+
+@unittest.skipIf(Flask is None, "route registration tests require Flask")
+class TestRouteRegistration(UnitTestCase):
+    """Tests for routes bound to compiled pipelines by the application router."""
+
+    def setUp(self):
+        super().setUp()
+        self.log = []
+        self.groups = {
+            'web': (RecordingMiddleware('session', self.log),),
+            'api': (RecordingMiddleware('throttle', self.log),),
+        }
+        self.compiler = PipelineCompiler(lambda group: self.groups.get(group, ()))
+        self.flask_app = Flask(__name__)
+        self.router = Router(FlaskRouter(self.flask_app), self.flask_app, self.compiler)
+
+        controller = HomeController()
+        self.router.get('/', controller.index)
+        with self.router.group('api'):
+            self.router.get('/api/data', controller.data)
+        self.router.match(['GET', 'POST'], '/contact', controller.index, 'contact')
+
+    def test_registered_routes_are_dumped(self):
+        """Every route is bound to the pipeline of its groups under its endpoint."""
+        self.assertEqual(self.compiler.dump(), {
+            'contact': {'groups': ['web'], 'middleware': ['RecordingMiddleware']},
+            'data': {'groups': ['api'], 'middleware': ['RecordingMiddleware']},
+            'index': {'groups': ['web'], 'middleware': ['RecordingMiddleware']},
+        })
+        self.assertEqual([route.groups for route in self.router.routes], [('web',), ('api',), ('web',)])
+
+    def test_middleware_runs_once_per_request(self):
+        """A request passes through its route's chain exactly once."""
+        client = self.flask_app.test_client()
+
+        self.assertEqual(client.get('/').get_data(as_text=True), 'home')
+        self.assertEqual(self.log, ['session:before', 'session:after'])
+
+        self.log.clear()
+        self.assertEqual(client.get('/api/data').get_json(), {'data': []})
+        self.assertEqual(self.log, ['throttle:before', 'throttle:after'])
+
+    def test_routes_without_pipelines_are_not_wrapped(self):
+        """Without a compiler, routes are registered without middleware."""
+        flask_app = Flask(__name__)
+        Router(FlaskRouter(flask_app), flask_app).get('/', HomeController().index)
+        self.assertEqual(flask_app.test_client().get('/').get_data(as_text=True), 'home')
+        self.assertEqual(self.log, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
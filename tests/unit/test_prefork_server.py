@@ -0,0 +1,167 @@
+"""
+Unit tests for the preforking production server.
+"""
+
+import os
+import signal
+import socket
+import tempfile
+import time
+import unittest
+import sys
+import urllib.request
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from bootstrap.server import PreforkServer, Worker, _import_callable
+
+try:
+    from app.console.commands.serve_command import ServeCommand
+except ImportError:
+    ServeCommand = None
+
+
+def pid_app(environ, start_response):
+    """WSGI app answering with the pid of the worker serving it"""
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [str(os.getpid()).encode('ascii')]
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+@unittest.skipIf(not hasattr(os, 'fork'), "the prefork server requires fork()")
+class TestPreforkServer(UnitTestCase):
+    """Tests for PreforkServer run in a forked master process."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ready_file = Path(self.tmp.name) / 'server.ready'
+        self.forks_file = Path(self.tmp.name) / 'forks'
+        self.port = free_port()
+        self.master = None
+
+    def tearDown(self):
+        if self.master is not None:
+            self.stop()
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def start(self, **options):
+        """Fork a master running the server and wait until it is ready"""
+        server = PreforkServer(pid_app, host='127.0.0.1', port=self.port, ready_file=self.ready_file,
+                               graceful_timeout=5, **options)
+
+        def record_fork(server, pid):
+            with self.forks_file.open('a') as forks:
+                forks.write(f"{pid}\n")
+
+        server.on('post_fork', record_fork)
+
+        self.master = os.fork()
+        if self.master == 0:
+            sys.stdout = open(os.devnull, 'w')
+            try:
+                server.run()
+            finally:
+                os._exit(0)
+
+        deadline = time.monotonic() + 10
+        while not self.ready_file.exists():
+            self.assertLess(time.monotonic(), deadline, "server did not become ready")
+            time.sleep(0.05)
+
+    def stop(self):
+        """Stop the master gracefully and wait for it"""
+        os.kill(self.master, signal.SIGTERM)
+        _, status = os.waitpid(self.master, 0)
+        self.master = None
+        return status
+
+    def get(self):
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/", timeout=10) as response:
+            return int(response.read())
+
+    def forked(self):
+        return [int(line) for line in self.forks_file.read_text().split()] if self.forks_file.exists() else []
+
+    def test_workers_serve_the_shared_socket(self):
+        """Requests are answered by forked workers; the ready file tracks the master."""
+        self.start(workers=2)
+        self.assertEqual(int(self.ready_file.read_text()), self.master)
+
+        served = {self.get() for _ in range(4)}
+        self.assertTrue(served <= set(self.forked()))
+        self.assertNotIn(self.master, served)
+
+        self.assertEqual(self.stop(), 0)
+        self.assertFalse(self.ready_file.exists())
+
+    def test_workers_are_recycled_after_max_requests(self):
+        """A worker exits after its request budget and a replacement is forked."""
+        self.start(workers=1, max_requests=1)
+        first = self.get()
+        second = self.get()
+        self.assertNotEqual(first, second)
+        self.assertGreaterEqual(len(self.forked()), 2)
+
+    def test_sighup_replaces_the_workers(self):
+        """A reload forks a new generation and retires the old one."""
+        self.start(workers=1)
+        before = self.get()
+        os.kill(self.master, signal.SIGHUP)
+
+        deadline = time.monotonic() + 10
+        while self.get() == before:
+            self.assertLess(time.monotonic(), deadline, "workers were not replaced")
+            time.sleep(0.1)
+
+
+class TestPreforkServerSetup(UnitTestCase):
+    """Tests for server hooks and worker settings."""
+
+    def test_unknown_hooks_are_rejected(self):
+        """Only the documented lifecycle hooks can be registered."""
+        server = PreforkServer(pid_app)
+        self.assertIs(server.on('when_ready', print), server)
+        with self.assertRaises(ValueError):
+            server.on('pre_fork', print)
+
+    def test_request_budget_jitter(self):
+        """Workers add up to max_requests_jitter requests to their budget."""
+        server = PreforkServer(pid_app, max_requests=100, max_requests_jitter=10)
+        budgets = {Worker(server).max_requests for _ in range(50)}
+        self.assertTrue(all(100 <= budget <= 110 for budget in budgets))
+        self.assertEqual(Worker(PreforkServer(pid_app, max_requests_jitter=10)).max_requests, 0)
+
+    def test_hooks_are_imported_by_path(self):
+        """Config hooks are 'module.function' paths."""
+        self.assertIs(_import_callable('os.path.join'), os.path.join)
+
+
+@unittest.skipIf(ServeCommand is None, "console commands require larapy")
+class TestServeCommand(UnitTestCase):
+    """Tests for serve --production."""
+
+    def test_production_option_runs_the_prefork_server(self):
+        """--production hands the options to bootstrap.server.serve()."""
+        options = {'production': True, 'port': '9000', 'workers': '3', 'max-requests': '500'}
+        command = ServeCommand()
+        command.option = lambda name, default=None: options.get(name, default)
+        command.info = mock.Mock()
+
+        with mock.patch('bootstrap.server.serve', return_value=0) as serve:
+            self.assertEqual(command.handle(), 0)
+        serve.assert_called_once_with(host=None, port='9000', workers='3', max_requests='500')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for deferred service provider loading.
+"""
+
+import json
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Support.ProviderRepository import ProviderRepository, provider_name
+
+
+class FakeContainer:
+    """Minimal container with bind/register/resolve."""
+
+    def __init__(self):
+        self.bindings = {}
+        self.registered = []
+
+    def bind(self, key, factory):
+        self.bindings[key] = factory
+
+    def register(self, provider):
+        self.registered.append(type(provider).__name__)
+        provider.register()
+        provider.boot()
+
+    def resolve(self, key):
+        return self.bindings[key](self)
+
+
+class EagerProvider:
+    def __init__(self, app):
+        self.app = app
+
+    def register(self):
+        self.app.bind('eager', lambda app: 'eager-service')
+
+    def boot(self):
+        pass
+
+    def provides(self):
+        return []
+
+    def is_deferred(self):
+        return False
+
+
+class PaymentsProvider(EagerProvider):
+    def register(self):
+        self.app.bind('payments', lambda app: 'payments-service')
+        self.app.bind('refunds', lambda app: 'refunds-service')
+
+    def provides(self):
+        return ['payments', 'refunds']
+
+    def is_deferred(self):
+        return True
+
+
+class BrokenProvider(PaymentsProvider):
+    def register(self):
+        pass
+
+    def provides(self):
+        return ['broken']
+
+
+class TestProviderRepository(UnitTestCase):
+    """Tests for ProviderRepository."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / 'cache' / 'services.json'
+        self.container = FakeContainer()
+        self.repository = ProviderRepository(self.container, self.manifest_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_deferred_provider_registers_on_first_resolve(self):
+        """Deferred providers stay unregistered until a service is resolved."""
+        self.repository.load([EagerProvider, PaymentsProvider])
+
+        self.assertEqual(self.container.registered, ['EagerProvider'])
+        self.assertEqual(self.container.resolve('payments'), 'payments-service')
+        self.assertEqual(self.container.registered, ['EagerProvider', 'PaymentsProvider'])
+
+        # Sibling services are bound by the same registration
+        self.assertEqual(self.container.resolve('refunds'), 'refunds-service')
+        self.assertEqual(self.container.registered.count('PaymentsProvider'), 1)
+
+    def test_manifest_is_written_and_reused(self):
+        """The manifest is cached and only rebuilt when providers change."""
+        self.repository.load([EagerProvider, PaymentsProvider])
+        manifest = json.loads(self.manifest_path.read_text())
+        self.assertEqual(manifest['eager'], [provider_name(EagerProvider)])
+        self.assertEqual(manifest['deferred']['refunds'], provider_name(PaymentsProvider))
+
+        calls = []
+        repository = ProviderRepository(FakeContainer(), self.manifest_path)
+        repository.compile_manifest = lambda names: calls.append(names)
+        repository.load([EagerProvider, PaymentsProvider])
+        self.assertEqual(calls, [])
+
+    def test_provider_list_change_recompiles(self):
+        """Adding a provider invalidates the cached manifest."""
+        self.repository.load([EagerProvider])
+        repository = ProviderRepository(FakeContainer(), self.manifest_path)
+        manifest = repository.load([EagerProvider, PaymentsProvider])
+        self.assertIn('payments', manifest['deferred'])
+
+    def test_provider_not_binding_its_service_raises(self):
+        """A deferred provider that never binds its service fails loudly."""
+        self.repository.load([BrokenProvider])
+        with self.assertRaises(LookupError):
+            self.container.resolve('broken')
+
+
+if __name__ == '__main__':
+    unittest.main()
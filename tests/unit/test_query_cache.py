@@ -0,0 +1,136 @@
+"""
+Unit tests for the model query result cache.
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+from orm import Database, Model
+
+from app.Support.Cache import MemoryStore, Repository, SqliteStore
+from app.Support.Database import CachesQueries, EagerLoading, flush_tables, identity_map
+from app.Support.Database.QueryCache import effective_ttl
+
+
+DB = Database()
+DB.create('categories', ['id INTEGER PRIMARY KEY', 'name TEXT'], [{'id': 1, 'name': 'Books'}, {'id': 2, 'name': 'Music'}])
+DB.create('tags', ['id INTEGER PRIMARY KEY', 'name TEXT'], [{'id': 1, 'name': 'new'}])
+
+
+class SqliteModel(Model):
+    database = DB
+
+
+class Category(CachesQueries, EagerLoading, SqliteModel):
+    table = 'categories'
+
+
+class Tag(CachesQueries, SqliteModel):
+    table = 'tags'
+
+
+class TestQueryCache(UnitTestCase):
+    """Tests for CachesQueries and EagerQuery.remember()."""
+
+    def setUp(self):
+        super().setUp()
+        DB.reset()
+        self.repository = Repository(MemoryStore(), 'test:')
+        for name, value in (('query_cache', self.repository), ('local_ttl', 60)):
+            patcher = mock.patch(f'app.Support.Database.QueryCache.{name}', return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        DB.connection.execute('DELETE FROM categories WHERE id > 2')
+        DB.connection.execute("UPDATE categories SET name = 'Books' WHERE id = 1")
+        super().tearDown()
+
+    def test_results_are_cached_per_sql_and_bindings(self):
+        """Identical queries hit the cache; different bindings do not."""
+        first = Category.remember(60).where('name', 'Books').get()
+        again = Category.remember(60).where('name', 'Books').get()
+        Category.remember(60).where('name', 'Music').get()
+
+        self.assertEqual(len(DB.statements), 2)
+        self.assertEqual(again[0].attributes, first[0].attributes)
+        self.assertIsNot(again[0], first[0])
+        self.assertTrue(again[0].exists)
+
+    def test_unremembered_queries_skip_the_cache(self):
+        """Only queries calling remember() are cached."""
+        Category.query().get()
+        Category.query().get()
+        self.assertEqual(len(DB.statements), 2)
+
+    def test_model_events_flush_only_their_table(self):
+        """Saving a model invalidates cached queries of its table."""
+        Category.remember().get()
+        Tag.remember().get()
+        Category({'name': 'Film'}).save()
+        DB.reset()
+
+        self.assertEqual(len(Category.remember().get()), 3)
+        Tag.remember().get()
+        self.assertEqual(DB.selects(), ['categories'])
+
+    def test_builder_writes_need_an_explicit_flush(self):
+        """Builder-level update() fires no events; flush_tables() invalidates."""
+        Category.remember().where('id', 1).first()
+        Category.query().where('id', 1).update({'name': 'Comics'})
+        self.assertEqual(Category.remember().where('id', 1).first().attributes['name'], 'Books')
+
+        flush_tables('categories')
+        self.assertEqual(Category.remember().where('id', 1).first().attributes['name'], 'Comics')
+
+    def test_first_and_misses_are_remembered(self):
+        """first() is cached separately and an empty result is cached too."""
+        self.assertEqual(Category.remember().first().attributes['name'], 'Books')
+        self.assertIsNone(Category.remember().where('name', 'Toys').first())
+        self.assertIsNone(Category.remember().where('name', 'Toys').first())
+        self.assertEqual(len(DB.statements), 2)
+
+    def test_hits_go_through_the_identity_map(self):
+        """Cached rows resolve to instances already loaded in the unit of work."""
+        Category.remember().get()
+        with identity_map():
+            loaded = Category.query().first()
+            cached = Category.remember().get()
+        self.assertIs(cached[0], loaded)
+
+
+class TestEffectiveTtl(UnitTestCase):
+    """Tests for the TTL cap of per-process stores."""
+
+    @mock.patch('app.Support.Database.QueryCache.local_ttl', return_value=30)
+    def test_process_local_stores_cap_the_ttl(self, local_ttl):
+        """Memory stores never keep results longer than local_ttl; shared stores do."""
+        memory = Repository(MemoryStore())
+        self.assertEqual(effective_ttl(memory, None), 30)
+        self.assertEqual(effective_ttl(memory, 600), 30)
+        self.assertEqual(effective_ttl(memory, 10), 10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            shared = Repository(SqliteStore(Path(directory) / 'cache.sqlite'))
+            self.assertIsNone(effective_ttl(shared, None))
+            self.assertEqual(effective_ttl(shared, 600), 600)
+
+    def test_memory_entries_expire_without_a_ttl(self):
+        """remember() without a TTL still expires in a memory store."""
+        repository = Repository(MemoryStore())
+        with mock.patch('app.Support.Database.QueryCache.local_ttl', return_value=30), \
+                mock.patch('app.Support.Database.QueryCache.query_cache', return_value=repository), \
+                mock.patch.object(repository.store, 'put', wraps=repository.store.put) as put:
+            DB.reset()
+            Tag.remember().get()
+        self.assertEqual(put.call_args.args[2], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the token-bucket rate limiter backends.
+"""
+
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.RateLimiter import (
+    SharedTokenBucketTable, TokenBucketTable, fcntl, parse_rate_limit,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketBehaviour:
+    """Behaviour shared by both token-bucket tables."""
+
+    def make_table(self, clock):
+        raise NotImplementedError
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        self.table = self.make_table(self.clock)
+
+    def test_allows_up_to_capacity_then_rejects(self):
+        """A burst is allowed up to the bucket capacity."""
+        capacity, rate = parse_rate_limit('5,1')
+        results = [self.table.attempt('login|1.2.3.4', capacity, rate) for _ in range(6)]
+
+        self.assertTrue(all(r.allowed for r in results[:5]))
+        self.assertEqual(results[4].remaining, 0)
+        self.assertFalse(results[5].allowed)
+        self.assertAlmostEqual(results[5].retry_after, 12.0)
+
+    def test_tokens_refill_over_time(self):
+        """Tokens come back at the configured rate."""
+        capacity, rate = parse_rate_limit('5,1')
+        for _ in range(5):
+            self.table.attempt('login|1.2.3.4', capacity, rate)
+
+        self.clock.now += 12.0
+        self.assertTrue(self.table.attempt('login|1.2.3.4', capacity, rate).allowed)
+        self.assertFalse(self.table.attempt('login|1.2.3.4', capacity, rate).allowed)
+
+    def test_keys_are_independent(self):
+        """One client exhausting its bucket does not affect another."""
+        for _ in range(3):
+            self.table.attempt('api|a', 2, 1.0)
+
+        self.assertTrue(self.table.attempt('api|b', 2, 1.0).allowed)
+
+
+class TestTokenBucketTable(TokenBucketBehaviour, UnitTestCase):
+    """Tests for the in-process table."""
+
+    def make_table(self, clock):
+        return TokenBucketTable(shards=4, sweep_interval=60.0, clock=clock)
+
+    def test_sweep_drops_full_buckets(self):
+        """Buckets that refilled completely are swept."""
+        self.table.attempt('api|a', 10, 1.0)
+        self.assertEqual(len(self.table), 1)
+
+        self.clock.now += 1.0
+        self.table.sweep()
+        self.assertEqual(len(self.table), 0)
+
+
+@unittest.skipIf(fcntl is None, "shared table requires fcntl")
+class TestSharedTokenBucketTable(TokenBucketBehaviour, UnitTestCase):
+    """Tests for the mmap-backed table."""
+
+    def make_table(self, clock):
+        self.tmp = tempfile.TemporaryDirectory()
+        return SharedTokenBucketTable(Path(self.tmp.name) / 'limits.bin', slots=64, shards=4, clock=clock)
+
+    def tearDown(self):
+        self.table.close()
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_tables_on_same_segment_share_budget(self):
+        """Two handles on the same file (as in two workers) share buckets."""
+        other = SharedTokenBucketTable(self.table.path, slots=64, shards=4, clock=self.clock)
+        try:
+            self.table.attempt('api|a', 2, 1.0)
+            self.table.attempt('api|a', 2, 1.0)
+            self.assertFalse(other.attempt('api|a', 2, 1.0).allowed)
+        finally:
+            other.close()
+
+    def test_layout_changes_use_a_separate_file(self):
+        """A table with another layout leaves the mapped segment untouched."""
+        self.table.attempt('api|a', 2, 1.0)
+        other = SharedTokenBucketTable(self.table.path, slots=128, shards=4, clock=self.clock)
+        try:
+            self.assertNotEqual(other.segment_path, self.table.segment_path)
+            self.assertTrue(other.attempt('api|a', 2, 1.0).allowed)
+            self.assertEqual(self.table.attempt('api|a', 2, 1.0).remaining, 0)
+        finally:
+            other.close()
+
+    def test_damaged_segment_is_replaced_not_truncated(self):
+        """A bad header is swapped for a fresh file; existing mappings keep working."""
+        self.table.attempt('api|a', 2, 1.0)
+        with open(self.table.segment_path, 'r+b') as segment:
+            segment.write(b'XXXX')
+
+        other = SharedTokenBucketTable(self.table.path, slots=64, shards=4, clock=self.clock)
+        try:
+            self.assertEqual(other.attempt('api|a', 2, 1.0).remaining, 1)
+            self.assertEqual(self.table.attempt('api|a', 2, 1.0).remaining, 0)
+            self.assertEqual(sorted(os.listdir(self.tmp.name)), [other.segment_path.name])
+        finally:
+            other.close()
+
+    def test_full_shard_still_serves_new_keys(self):
+        """Probing evicts when every slot in a shard is taken."""
+        for i in range(200):
+            self.assertTrue(self.table.attempt(f'api|{i}', 5, 1.0).allowed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Unit tests for the full-page response cache.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.ResponseCache import REVALIDATE_ENVIRON_KEY, ResponseCache, revalidate
+from app.Support.Cache import MemoryStore, Repository
+
+try:
+    from flask import Flask, Response, g, request, session, stream_with_context
+except ImportError:
+    Flask = None
+
+
+class TestResponseCache(UnitTestCase):
+    """Tests for ResponseCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.now = 1000.0
+        self.cache = ResponseCache(
+            Repository(MemoryStore()),
+            ttl=60,
+            stale_while_revalidate=30,
+            paths={'/': ['home', 'users'], '/api/*': ['api']},
+            except_paths=['/api/private'],
+            vary_headers=['Accept-Language'],
+            bypass_cookies=['session'],
+            clock=lambda: self.now,
+        )
+
+    def test_only_anonymous_reads_of_listed_paths(self):
+        """Writes, signed-in requests and unlisted paths bypass the cache."""
+        self.assertTrue(self.cache.cacheable_request('GET', '/', {}, {}))
+        self.assertTrue(self.cache.cacheable_request('HEAD', '/api/data', {}, {}))
+        self.assertFalse(self.cache.cacheable_request('POST', '/', {}, {}))
+        self.assertFalse(self.cache.cacheable_request('GET', '/', {}, {'session': 'abc'}))
+        self.assertFalse(self.cache.cacheable_request('GET', '/', {'Authorization': 'Bearer x'}, {}))
+        self.assertFalse(self.cache.cacheable_request('GET', '/dashboard', {}, {}))
+        self.assertFalse(self.cache.cacheable_request('GET', '/api/private', {}, {}))
+
+    def test_personal_responses_are_not_stored(self):
+        """Cookies, private Cache-Control and non-200 responses are refused."""
+        self.assertTrue(self.cache.cacheable_response(200, [('Content-Type', 'text/html')]))
+        self.assertFalse(self.cache.cacheable_response(200, [('Set-Cookie', 'session=abc')]))
+        self.assertFalse(self.cache.cacheable_response(200, [('Cache-Control', 'private, max-age=0')]))
+        self.assertFalse(self.cache.cacheable_response(404, []))
+
+    def test_key_varies_on_configured_headers_and_query(self):
+        """Query order is normalised; vary headers select separate entries."""
+        english = self.cache.key('/', b'b=2&a=1', {'Accept-Language': 'en'}, {})
+        self.assertEqual(english, self.cache.key('/', 'a=1&b=2', {'Accept-Language': 'en', 'X-Other': '1'}, {}))
+        self.assertNotEqual(english, self.cache.key('/', 'a=1&b=2', {'Accept-Language': 'fr'}, {}))
+
+    def test_fresh_stale_and_expired(self):
+        """Entries are fresh for ttl, then stale for the revalidation window."""
+        key = self.cache.key('/', '', {}, {})
+        self.cache.store(key, 200, [('Content-Type', 'text/html'), ('Date', 'x')], b'<html>', ['path:/'])
+
+        entry, state = self.cache.lookup(key)
+        self.assertEqual(state, 'hit')
+        self.assertEqual(entry['headers'], [('Content-Type', 'text/html')])
+
+        self.now += 75
+        self.assertEqual(self.cache.lookup(key)[1], 'stale')
+        self.assertEqual(self.cache.age(entry), 75)
+
+        self.now += 30
+        self.assertEqual(self.cache.lookup(key), (None, None))
+
+    def test_purge_by_surrogate_key(self):
+        """Purging a key drops exactly the pages tagged with it."""
+        keys = self.cache.surrogate_keys('/', ['posts'])
+        self.assertEqual(keys, ['path:/', 'home', 'users', 'posts'])
+
+        home = self.cache.key('/', '', {}, {})
+        api = self.cache.key('/api/data', '', {}, {})
+        self.cache.store(home, 200, [], b'home', keys)
+        self.cache.store(api, 200, [], b'api', self.cache.surrogate_keys('/api/data'))
+
+        self.cache.purge('users')
+        self.assertEqual(self.cache.lookup(home), (None, None))
+        self.assertEqual(self.cache.lookup(api)[1], 'hit')
+
+    def test_single_revalidation_per_key(self):
+        """Only one refresh of a stale entry runs at a time."""
+        self.assertTrue(self.cache.begin_revalidation('response:x'))
+        self.assertFalse(self.cache.begin_revalidation('response:x'))
+        self.cache.end_revalidation('response:x')
+        self.assertTrue(self.cache.begin_revalidation('response:x'))
+
+
+@unittest.skipIf(Flask is None, "internal requests require Flask")
+class TestRevalidate(UnitTestCase):
+    """Tests for revalidate() re-rendering pages with an internal request."""
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+        self.app.secret_key = 'testing'
+        self.seen = []
+        self.drained = []
+
+        @self.app.route('/')
+        def index():
+            session['visited'] = True
+            self.seen.append((request.environ.get(REVALIDATE_ENVIRON_KEY), request.full_path, 'outer' in g))
+
+            def body():
+                yield 'page'
+                self.drained.append(True)
+            return Response(stream_with_context(body()))
+
+    def test_refresh_runs_as_a_fresh_request(self):
+        """The refresh gets its own context and a copied environ, and its stream is drained."""
+        done = []
+        with self.app.test_request_context('/?page=2'):
+            g.outer = True
+            revalidate(self.app.wsgi_app, request.environ, lambda: done.append(True)).join()
+            self.assertNotIn(REVALIDATE_ENVIRON_KEY, request.environ)
+            self.assertNotIn('visited', session)
+
+        self.assertEqual(self.seen, [(True, '/?page=2', False)])
+        self.assertEqual(self.drained, [True])
+        self.assertEqual(done, [True])
+
+    def test_failures_release_the_claim(self):
+        """on_complete runs even when the app raises."""
+        def broken(environ, start_response):
+            raise RuntimeError('boom')
+
+        done = []
+        with self.assertLogs('app.Http.ResponseCache', 'ERROR'):
+            revalidate(broken, {'PATH_INFO': '/'}, lambda: done.append(True)).join()
+        self.assertEqual(done, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Unit tests for the route manifest.
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.Pipeline import PipelineCompiler
+from app.Http.RouteCache import (
+    UncacheableRoute, build_manifest, handler_reference, lazy_handler, load_manifest, write_manifest,
+)
+from app.Http.Router import Router
+
+try:
+    from flask import Flask
+except ImportError:
+    Flask = None
+
+
+class DemoController:
+    """Controller used as a route target."""
+
+    created = 0
+
+    def __init__(self):
+        DemoController.created += 1
+
+    def index(self):
+        return 'index'
+
+    def show(self, post_id):
+        return f"post {post_id}"
+
+
+def health():
+    return 'ok'
+
+
+class FakeRouter:
+    """Records calls made by the application router."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, path, handler):
+        self.calls.append(('get', path, handler))
+
+
+class FlaskRouter:
+    """Larapy-like router registering GET routes on a Flask app."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+
+    def get(self, path, handler):
+        self.flask_app.add_url_rule(path, handler.__name__, handler, methods=['GET'])
+
+
+class CountingMiddleware:
+    """Middleware counting the requests it handles."""
+
+    def __init__(self, counts):
+        self.counts = counts
+
+    def handle(self, request, next_handler):
+        self.counts.append(request.path)
+        return next_handler(request)
+
+
+class FakeFlaskApp:
+    """Records add_url_rule calls."""
+
+    def __init__(self):
+        self.rules = []
+
+    def add_url_rule(self, path, endpoint, view_func, methods=None):
+        self.rules.append((path, endpoint, view_func, methods))
+
+
+class TestRouteCache(UnitTestCase):
+    """Tests for route manifest building and loading."""
+
+    def test_handler_references(self):
+        """Controller methods and functions are referenced by import path."""
+        self.assertEqual(
+            handler_reference(DemoController().index),
+            f"{__name__}:DemoController@index",
+        )
+        self.assertEqual(handler_reference(health), f"{__name__}:health")
+
+        with self.assertRaises(UncacheableRoute):
+            handler_reference(lambda: 'closure')
+
+    def test_manifest_round_trip_registers_lazy_handlers(self):
+        """Cached routes register without importing or building controllers."""
+        fake_router = FakeRouter()
+        router = Router(fake_router, FakeFlaskApp())
+        router.get('/', DemoController().index)
+        router.match(['GET', 'POST'], '/health', health)
+
+        rules = [
+            SimpleNamespace(rule='/', methods={'GET', 'HEAD'}, endpoint='index', _converters={}),
+            SimpleNamespace(rule='/health', methods={'GET', 'POST'}, endpoint='health', _converters={}),
+        ]
+        manifest = build_manifest(router.routes, SimpleNamespace(iter_rules=lambda: rules),
+                                  {'index': {'groups': ['web']}})
+        self.assertEqual(manifest['routes'][0]['endpoint'], 'index')
+        self.assertEqual(manifest['routes'][0]['middleware'], {'groups': ['web']})
+        self.assertEqual(manifest['routes'][1]['methods'], ['GET', 'POST'])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'routes.json'
+            write_manifest(path, manifest)
+            manifest = load_manifest(path)
+
+        created = DemoController.created
+        cached_router = FakeRouter()
+        flask_app = FakeFlaskApp()
+        Router(cached_router, flask_app).load_manifest(manifest)
+
+        verb, path, handler = cached_router.calls[0]
+        self.assertEqual((verb, path, handler.__name__), ('get', '/', 'index'))
+        self.assertEqual(flask_app.rules[0][:2], ('/health', 'health'))
+        self.assertEqual(DemoController.created, created)
+
+        self.assertEqual(handler(), 'index')
+        self.assertEqual(DemoController.created, created + 1)
+
+    def test_lazy_handler_shares_controller_instances(self):
+        """Routes to the same controller share one instance."""
+        instances = {}
+        index = lazy_handler(f"{__name__}:DemoController@index", instances)
+        show = lazy_handler(f"{__name__}:DemoController@show", instances)
+
+        created = DemoController.created
+        self.assertEqual(index(), 'index')
+        self.assertEqual(show(3), 'post 3')
+        self.assertEqual(DemoController.created, created + 1)
+
+
+@unittest.skipIf(Flask is None, "route middleware tests require Flask")
+class TestRouteCacheMiddleware(UnitTestCase):
+    """Tests for middleware chains kept across route:cache."""
+
+    def boot(self):
+        """Create a Flask app and a router bound to fresh compiled pipelines"""
+        counts = []
+        groups = {'web': (), 'api': (CountingMiddleware(counts),)}
+        compiler = PipelineCompiler(lambda group: groups.get(group, ()))
+        flask_app = Flask(__name__)
+        return Router(FlaskRouter(flask_app), flask_app, compiler), flask_app, compiler, counts
+
+    def test_routes_keep_their_middleware_after_caching(self):
+        """Cached routes are bound to the same chains as routes registered from the route files."""
+        router, flask_app, compiler, _ = self.boot()
+        router.get('/', DemoController().index)
+        with router.group('api'):
+            router.match(['GET'], '/health', health)
+
+        manifest = build_manifest(router.routes, flask_app.url_map, compiler.dump())
+        self.assertEqual(manifest['routes'][1]['middleware'], {'groups': ['api'], 'middleware': ['CountingMiddleware']})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'routes.json'
+            write_manifest(path, manifest)
+            manifest = load_manifest(path)
+
+        cached_router, cached_app, cached_compiler, counts = self.boot()
+        cached_router.load_manifest(manifest)
+        self.assertEqual(cached_compiler.dump(), compiler.dump())
+
+        client = cached_app.test_client()
+        self.assertEqual(client.get('/health').get_data(as_text=True), 'ok')
+        self.assertEqual(client.get('/').get_data(as_text=True), 'index')
+        self.assertEqual(counts, ['/health'])
+
+    def test_unbound_routes_record_their_groups(self):
+        """Without compiled pipelines the manifest still names each route's groups."""
+        router = Router(FakeRouter(), FakeFlaskApp())
+        with router.group('api'):
+            router.get('/', DemoController().index)
+        manifest = build_manifest(router.routes)
+        self.assertEqual(manifest['routes'][0]['middleware'], {'groups': ['api'], 'middleware': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
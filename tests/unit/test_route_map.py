@@ -0,0 +1,77 @@
+"""
+Unit tests for the compiled route map on a real Flask app.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+try:
+    from flask import Flask
+except ImportError:
+    Flask = None
+
+
+@unittest.skipIf(Flask is None, "route map requires Flask")
+class TestCompiledRouteMap(UnitTestCase):
+    """Tests for CompiledRouteMap and CompiledMapAdapter."""
+
+    def setUp(self):
+        super().setUp()
+        from app.Http.RouteMap import CompiledMapAdapter, CompiledRouteMap
+
+        self.adapter_class = CompiledMapAdapter
+        self.app = Flask(__name__)
+        # Installed before routes are registered, as load_routes() does
+        self.app.url_map = CompiledRouteMap.from_map(self.app.url_map)
+
+        self.app.add_url_rule('/contact', 'contact', lambda: 'contact')
+        self.app.add_url_rule('/contact', 'contact.store', lambda: 'stored', methods=['POST'])
+        self.app.add_url_rule('/posts/<int:post_id>', 'posts.show', lambda post_id: f"post {post_id}")
+
+        def page(page):
+            return f"page {page}"
+
+        self.app.add_url_rule('/d/', 'page', page, defaults={'page': 1})
+        self.app.add_url_rule('/d/<int:page>', 'page', page)
+        self.client = self.app.test_client()
+
+    def test_requests_match_through_the_compiled_adapter(self):
+        """Requests go through CompiledMapAdapter and reach their views."""
+        with self.app.test_request_context('/posts/7') as context:
+            self.assertIsInstance(context.url_adapter, self.adapter_class)
+            self.assertEqual(context.request.view_args, {'post_id': 7})
+
+        self.assertEqual(self.client.get('/contact').get_data(as_text=True), 'contact')
+        self.assertEqual(self.client.post('/contact').get_data(as_text=True), 'stored')
+        self.assertEqual(self.client.get('/posts/7').get_data(as_text=True), 'post 7')
+        self.assertIsNotNone(self.app.url_map.route_table())
+
+    def test_misses_and_method_errors_are_left_to_werkzeug(self):
+        """404, 405 and strict-slash redirects behave as with a plain map."""
+        self.assertEqual(self.client.get('/posts/abc').status_code, 404)
+        self.assertEqual(self.client.delete('/contact').status_code, 405)
+        self.assertEqual(self.client.get('/contact/').status_code, 404)
+        self.assertEqual(self.client.get('/d').status_code, 308)
+
+    def test_redirect_defaults_are_honored(self):
+        """A URL equal to a rule's defaults redirects like Flask's own map."""
+        response = self.client.get('/d/1')
+        self.assertEqual(response.status_code, 308)
+        self.assertTrue(response.headers['Location'].endswith('/d/'))
+        self.assertEqual(self.client.get('/d/2').get_data(as_text=True), 'page 2')
+        self.assertEqual(self.client.get('/d/').get_data(as_text=True), 'page 1')
+
+    def test_websocket_flag_is_kept(self):
+        """Adapters bound to ws:// keep their websocket flag."""
+        adapter = self.app.url_map.bind('localhost', url_scheme='ws')
+        self.assertIsInstance(adapter, self.adapter_class)
+        self.assertTrue(adapter.websocket)
+
+
+if __name__ == '__main__':
+    unittest.main()
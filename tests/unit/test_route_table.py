@@ -0,0 +1,105 @@
+"""
+Unit tests for the precompiled route table.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.RouteTable import RouteTable, UnsupportedRoute
+
+
+class Converter:
+    """Werkzeug-like converter."""
+
+    def __init__(self, regex='[^/]+', weight=100, to_python=str, part_isolating=True):
+        self.regex = regex
+        self.weight = weight
+        self.part_isolating = part_isolating
+        self._to_python = to_python
+
+    def to_python(self, value):
+        return self._to_python(value)
+
+
+def int_converter():
+    return Converter(r'\d+', 50, int)
+
+
+class TestRouteTable(UnitTestCase):
+    """Tests for RouteTable."""
+
+    def setUp(self):
+        super().setUp()
+        self.table = RouteTable()
+
+    def test_static_paths_match_by_method(self):
+        """Static paths are looked up directly and filtered by method."""
+        self.table.add('/contact', {'GET', 'HEAD'}, 'contact')
+        self.table.add('/contact', {'POST'}, 'contact.store')
+
+        self.assertEqual(self.table.match('/contact', 'GET'), ('contact', {}))
+        self.assertEqual(self.table.match('/contact', 'POST'), ('contact.store', {}))
+        self.assertIsNone(self.table.match('/contact', 'DELETE'))
+        self.assertIsNone(self.table.match('/contact/', 'GET'))
+
+    def test_parameters_are_converted(self):
+        """Dynamic segments are matched by regex and converted."""
+        self.table.add('/posts/<int:post_id>/comments/<slug>', None, 'comment',
+                       {'post_id': int_converter(), 'slug': Converter()})
+
+        self.assertEqual(
+            self.table.match('/posts/12/comments/first', 'GET'),
+            ('comment', {'post_id': 12, 'slug': 'first'}),
+        )
+        self.assertIsNone(self.table.match('/posts/abc/comments/first', 'GET'))
+
+    def test_static_segment_wins_over_parameter(self):
+        """A static segment is preferred to a parameter at the same depth."""
+        self.table.add('/posts/<slug>', None, 'show', {'slug': Converter()})
+        self.table.add('/posts/<int:post_id>', None, 'show.id', {'post_id': int_converter()})
+        self.table.add('/posts/create/<step>', None, 'create', {'step': Converter()})
+
+        self.assertEqual(self.table.match('/posts/create/1', 'GET'), ('create', {'step': '1'}))
+        # Lower converter weight is tried first, as in Werkzeug
+        self.assertEqual(self.table.match('/posts/7', 'GET'), ('show.id', {'post_id': 7}))
+        self.assertEqual(self.table.match('/posts/hello', 'GET'), ('show', {'slug': 'hello'}))
+
+    def test_backtracks_on_method_mismatch(self):
+        """A branch that matches the path but not the method is abandoned."""
+        self.table.add('/items/new', {'GET'}, 'new')
+        self.table.add('/items/<name>', {'POST'}, 'store', {'name': Converter()})
+
+        self.assertEqual(self.table.match('/items/new', 'POST'), ('store', {'name': 'new'}))
+
+    def test_path_converter_consumes_remaining_segments(self):
+        """Multi-segment converters match the rest of the path."""
+        self.table.add('/build/<path:filename>', None, 'build',
+                       {'filename': Converter('[^/].*?', 200, part_isolating=False)})
+
+        self.assertEqual(
+            self.table.match('/build/assets/app-1a2b.js', 'GET'),
+            ('build', {'filename': 'assets/app-1a2b.js'}),
+        )
+        self.assertIsNone(self.table.match('/build/', 'GET'))
+
+    def test_validation_error_is_a_miss(self):
+        """A converter rejecting a value makes the route not match."""
+        def reject(value):
+            raise ValueError(value)
+
+        self.table.add('/users/<user>', None, 'user', {'user': Converter(to_python=reject)})
+        self.assertIsNone(self.table.match('/users/1', 'GET'))
+
+    def test_mixed_segments_are_unsupported(self):
+        """Segments mixing text and placeholders are left to Werkzeug."""
+        with self.assertRaises(UnsupportedRoute):
+            self.table.add('/files/report-<int:year>.pdf', None, 'report', {'year': int_converter()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for precompiled security headers.
+"""
+
+import importlib.util
+import os
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from werkzeug.datastructures import Headers
+
+from app.Http.SecurityHeaders import SecurityHeaderBundles, compile_security_headers
+
+try:
+    from app.Http.Kernel import HttpKernel
+except ImportError:
+    HttpKernel = None
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def default_headers_config(**environ):
+    """The 'security_headers' section of config/security.py under the given environment"""
+    # tests/config.py shadows the config package, so load the file directly
+    spec = importlib.util.spec_from_file_location('security_config', PROJECT_ROOT / 'config' / 'security.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with mock.patch.dict(os.environ, environ):
+        return module.get_security_config()['security_headers']
+
+
+def legacy_headers(headers_config):
+    """Headers set by the per-request after_request hook the bundle replaced"""
+    headers = Headers()
+    if headers_config.get('x_frame_options'):
+        headers['X-Frame-Options'] = headers_config['x_frame_options']
+    if headers_config.get('x_content_type_options'):
+        headers['X-Content-Type-Options'] = headers_config['x_content_type_options']
+    if headers_config.get('x_xss_protection'):
+        headers['X-XSS-Protection'] = headers_config['x_xss_protection']
+    if headers_config.get('strict_transport_security'):
+        headers['Strict-Transport-Security'] = headers_config['strict_transport_security']
+    if headers_config.get('content_security_policy'):
+        headers['Content-Security-Policy'] = headers_config['content_security_policy']
+    if headers_config.get('referrer_policy'):
+        headers['Referrer-Policy'] = headers_config['referrer_policy']
+    if headers_config.get('permissions_policy'):
+        headers['Permissions-Policy'] = headers_config['permissions_policy']
+    return headers
+
+
+class TestSecurityHeaders(UnitTestCase):
+    """Tests for compile_security_headers and SecurityHeaderBundles."""
+
+    def test_bundle_matches_per_request_headers(self):
+        """The compiled bundle sets exactly the headers of the old hook, in production and development."""
+        for environ in ({'APP_ENV': 'production', 'APP_DEBUG': 'false'}, {'APP_ENV': 'local'}):
+            with self.subTest(**environ):
+                headers_config = default_headers_config(**environ)
+                headers = Headers([('X-Frame-Options', 'DENY')])
+                headers.update(compile_security_headers(headers_config))
+
+                expected = Headers([('X-Frame-Options', 'DENY')])
+                expected.update(legacy_headers(headers_config))
+                self.assertEqual(list(headers.items()), list(expected.items()))
+
+        production = dict(compile_security_headers(default_headers_config(APP_ENV='production', APP_DEBUG='false')))
+        self.assertIn('Content-Security-Policy', production)
+        self.assertNotIn('Strict-Transport-Security', dict(compile_security_headers(default_headers_config(APP_ENV='local'))))
+
+    def test_overrides_replace_and_remove_headers(self):
+        """A route override replaces values or drops headers for that endpoint only."""
+        bundles = SecurityHeaderBundles(
+            {'x_frame_options': 'SAMEORIGIN', 'content_security_policy': "default-src 'self'"},
+            {'build_assets': {'content_security_policy': None}},
+        )
+        bundles.override('embed', {'x_frame_options': 'ALLOWALL'})
+
+        self.assertEqual(bundles.for_endpoint('build_assets'), (('X-Frame-Options', 'SAMEORIGIN'),))
+        self.assertEqual(dict(bundles.for_endpoint('embed'))['X-Frame-Options'], 'ALLOWALL')
+        self.assertIs(bundles.for_endpoint('home'), bundles.default)
+        self.assertIs(bundles.for_endpoint(None), bundles.default)
+        self.assertEqual(len(bundles.default), 2)
+
+    def test_bundles_are_immutable(self):
+        """Bundles are tuples and later config changes do not leak into them."""
+        headers_config = {'x_frame_options': 'SAMEORIGIN'}
+        bundles = SecurityHeaderBundles(headers_config)
+        headers_config['x_frame_options'] = 'DENY'
+        bundles.override('embed', {'referrer_policy': 'no-referrer'})
+
+        self.assertIsInstance(bundles.default, tuple)
+        self.assertEqual(bundles.default, (('X-Frame-Options', 'SAMEORIGIN'),))
+        self.assertEqual(bundles.for_endpoint('embed')[0], ('X-Frame-Options', 'SAMEORIGIN'))
+        with self.assertRaises(TypeError):
+            bundles.default[0] = ('X-Frame-Options', 'DENY')
+
+
+@unittest.skipIf(HttpKernel is None, "the HTTP kernel requires larapy")
+class TestKernelSecurityHeaders(UnitTestCase):
+    """Tests for the kernel's security header methods."""
+
+    def test_kernel_serves_compiled_bundles(self):
+        kernel = HttpKernel()
+        self.assertEqual(kernel.security_headers_for(None),
+                         compile_security_headers(kernel.security_config['security_headers']))
+        kernel.override_security_headers('embed', {'x_frame_options': None})
+        self.assertNotIn('X-Frame-Options', dict(kernel.security_headers_for('embed')))
+        self.assertIs(kernel.security_headers_for('home'), kernel.security_header_bundle)
+
+
+if __name__ == '__main__':
+    unittest.main()
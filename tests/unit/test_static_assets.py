@@ -0,0 +1,110 @@
+"""
+Unit tests for static asset serving.
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Http.StaticAssets import AssetIndex, StaticAssets, accepted_encodings, compress_assets
+
+
+class TestStaticAssets(UnitTestCase):
+    """Tests for AssetIndex and StaticAssets."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / 'assets').mkdir()
+        (self.root / 'assets' / 'app-B7x9kQ2a.js').write_text('console.log("app");\n' * 200)
+        (self.root / 'manifest.json').write_text('{}')
+        self.fallback_calls = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def fallback(self, environ, start_response):
+        self.fallback_calls.append(environ['PATH_INFO'])
+        start_response('404 Not Found', [])
+        return [b'']
+
+    def request(self, app, path, method='GET', **headers):
+        environ = {'PATH_INFO': path, 'REQUEST_METHOD': method}
+        environ.update({f"HTTP_{name.upper()}": value for name, value in headers.items()})
+        captured = {}
+
+        def start_response(status, response_headers):
+            captured['status'] = status
+            captured['headers'] = dict(response_headers)
+
+        body = app(environ, start_response)
+        data = b''.join(body)
+        if hasattr(body, 'close'):
+            body.close()
+        return captured['status'], captured['headers'], data
+
+    def test_hashed_assets_are_immutable(self):
+        """Only content-hashed files get immutable caching."""
+        index = AssetIndex(self.root).build()
+        self.assertIn('immutable', index.get('assets/app-B7x9kQ2a.js').cache_control)
+        self.assertIn('must-revalidate', index.get('manifest.json').cache_control)
+
+    def test_serves_precompressed_variant_and_304s(self):
+        """Compressed siblings are negotiated and ETags answer 304 from memory."""
+        written = compress_assets(self.root)
+        self.assertIn(str(self.root / 'assets' / 'app-B7x9kQ2a.js.gz'), written)
+
+        app = StaticAssets(AssetIndex(self.root).build(), headers=[('X-Content-Type-Options', 'nosniff')])
+        app = app.wrap(self.fallback)
+
+        status, headers, body = self.request(app, '/build/assets/app-B7x9kQ2a.js', accept_encoding='gzip, br;q=0')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(headers['X-Content-Type-Options'], 'nosniff')
+        self.assertTrue(gzip.decompress(body).startswith(b'console.log'))
+
+        os.remove(self.root / 'assets' / 'app-B7x9kQ2a.js')
+        status, headers, body = self.request(
+            app, '/build/assets/app-B7x9kQ2a.js', if_none_match=headers['ETag'], accept_encoding='gzip'
+        )
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, b'')
+
+    def test_identity_response_and_fallthrough(self):
+        """Unknown files and range requests are left to the application."""
+        app = StaticAssets(AssetIndex(self.root).build()).wrap(self.fallback)
+
+        status, headers, body = self.request(app, '/build/manifest.json')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(body, b'{}')
+        self.assertNotIn('Content-Encoding', headers)
+
+        self.request(app, '/build/missing.js')
+        self.request(app, '/build/manifest.json', range='bytes=0-1')
+        self.assertEqual(self.fallback_calls, ['/build/missing.js', '/build/manifest.json'])
+
+    def test_digest_index_is_reused(self):
+        """Digests written by compress_assets are reused for unchanged files."""
+        compress_assets(self.root)
+        digest = AssetIndex(self.root).build().get('manifest.json').digest
+
+        (self.root / 'manifest.json').write_text('{"changed": true}')
+        self.assertNotEqual(AssetIndex(self.root).build().get('manifest.json').digest, digest)
+
+    def test_accepted_encodings(self):
+        """Encodings with q=0 are refused."""
+        self.assertEqual(accepted_encodings('gzip;q=0.5, br;q=0, identity'), {'gzip', 'identity'})
+
+
+if __name__ == '__main__':
+    unittest.main()
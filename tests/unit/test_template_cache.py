@@ -0,0 +1,148 @@
+"""
+Unit tests for compiled template caching.
+"""
+
+import os
+import tempfile
+import types
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from jinja2 import Environment, FileSystemLoader, TemplateSyntaxError
+
+from app.View.TemplateCache import clear_compiled_views, compile_views, configure_template_cache
+
+try:
+    from app.console.commands.view_cache_command import ViewCacheCommand
+    from app.console.commands.view_clear_command import ViewClearCommand
+except ImportError:
+    ViewCacheCommand = None
+
+
+class TemplateCacheTestCase(UnitTestCase):
+    """Template sources and compiled paths in a temporary directory."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.views = root / 'views'
+        self.views.mkdir()
+        (self.views / 'page.html').write_text('Hello {{ name }}')
+        (self.views / 'notes.txt').write_text('not a template')
+        self.config = {
+            'auto_reload': None,
+            'bytecode_cache': True,
+            'compiled': {
+                'bytecode': str(root / 'compiled' / 'bytecode'),
+                'archive': str(root / 'compiled' / 'compiled.zip'),
+            },
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def environment(self, debug=False):
+        env = Environment(loader=FileSystemLoader(str(self.views)))
+        configure_template_cache(env, self.config, debug=debug)
+        return env
+
+
+class TestTemplateCache(TemplateCacheTestCase):
+    """Tests for configure_template_cache, compile_views and clear_compiled_views."""
+
+    def test_bytecode_is_shared_on_disk(self):
+        """Compiled bytecode is written to the shared directory and reused by new environments."""
+        self.assertEqual(self.environment().get_template('page.html').render(name='Ann'), 'Hello Ann')
+        self.assertEqual(len(os.listdir(self.config['compiled']['bytecode'])), 1)
+
+        env = self.environment()
+        with mock.patch.object(env, 'compile', wraps=env.compile) as compile:
+            env.get_template('page.html')
+        compile.assert_not_called()
+
+    def test_auto_reload_follows_debug(self):
+        """Without VIEW_AUTO_RELOAD, templates are re-checked only in debug mode."""
+        self.assertTrue(self.environment(debug=True).auto_reload)
+        self.assertFalse(self.environment(debug=False).auto_reload)
+        self.config['auto_reload'] = True
+        self.assertTrue(self.environment(debug=False).auto_reload)
+
+    def test_precompiled_archive_replaces_sources(self):
+        """Without auto-reload, templates come from the archive written by compile_views()."""
+        self.assertEqual(compile_views(self.environment(), self.config['compiled']['archive']), 1)
+        (self.views / 'page.html').write_text('Edited {{ name }}')
+
+        self.assertEqual(self.environment().get_template('page.html').render(name='Ann'), 'Hello Ann')
+        self.assertEqual(self.environment(debug=True).get_template('page.html').render(name='Ann'), 'Edited Ann')
+
+    def test_syntax_errors_leave_no_archive(self):
+        """A broken template aborts compilation without a partial archive."""
+        (self.views / 'broken.html').write_text('{% if %}')
+        archive = self.config['compiled']['archive']
+        with self.assertRaises(TemplateSyntaxError):
+            compile_views(self.environment(), archive)
+        self.assertEqual(os.listdir(Path(archive).parent), ['bytecode'])
+
+    def test_clear_removes_archive_and_bytecode(self):
+        """clear_compiled_views() reports whether anything was removed."""
+        env = self.environment()
+        env.get_template('page.html')
+        compile_views(env, self.config['compiled']['archive'])
+
+        self.assertTrue(clear_compiled_views(self.config))
+        self.assertFalse(os.path.exists(self.config['compiled']['archive']))
+        self.assertFalse(os.path.exists(self.config['compiled']['bytecode']))
+        self.assertFalse(clear_compiled_views(self.config))
+
+
+@unittest.skipIf(ViewCacheCommand is None, "console commands require larapy")
+class TestViewCommands(TemplateCacheTestCase):
+    """Tests for view:cache and view:clear."""
+
+    def run_command(self, command_class, env=None):
+        command = command_class()
+        for method in ('info', 'success', 'error'):
+            setattr(command, method, mock.Mock())
+        modules = {'config.view': types.SimpleNamespace(get_view_config=lambda: self.config)}
+        if env is not None:
+            modules['bootstrap.app'] = types.SimpleNamespace(
+                app=types.SimpleNamespace(flask_app=types.SimpleNamespace(jinja_env=env)),
+            )
+        with mock.patch.dict(sys.modules, modules):
+            return command.handle(), command
+
+    def test_view_cache_compiles_every_template(self):
+        """view:cache writes the archive and reports the template count."""
+        code, command = self.run_command(ViewCacheCommand, self.environment())
+        self.assertEqual(code, 0)
+        self.assertTrue(os.path.exists(self.config['compiled']['archive']))
+        command.success.assert_called_once_with(f"Compiled 1 templates to {self.config['compiled']['archive']}")
+
+    def test_view_cache_reports_syntax_errors(self):
+        """A broken template fails the command with its location."""
+        (self.views / 'broken.html').write_text('{% if %}')
+        code, command = self.run_command(ViewCacheCommand, self.environment())
+        self.assertEqual(code, 1)
+        self.assertIn('broken.html:1', command.error.call_args.args[0])
+
+    def test_view_clear(self):
+        """view:clear removes compiled views and says when there were none."""
+        compile_views(self.environment(), self.config['compiled']['archive'])
+        code, command = self.run_command(ViewClearCommand)
+        self.assertEqual(code, 0)
+        command.success.assert_called_once_with("Compiled views cleared")
+
+        _, command = self.run_command(ViewClearCommand)
+        command.info.assert_called_once_with("No compiled views to clear")
+
+
+if __name__ == '__main__':
+    unittest.main()
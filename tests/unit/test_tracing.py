@@ -0,0 +1,124 @@
+"""
+Unit tests for the request tracing context.
+"""
+
+import logging
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.Support.Tracing import (
+    TraceLogFilter, current_request_id, current_trace, end_trace, instrument, measure, start_trace, trace_body,
+    traced,
+)
+
+
+class TestTracing(UnitTestCase):
+    """Tests for app.Support.Tracing."""
+
+    def test_ids_are_monotonic_w3c_ids(self):
+        """Generated trace IDs are 32 hex digits and increase."""
+        first, token = start_trace()
+        end_trace(token)
+        second, token = start_trace()
+        end_trace(token)
+
+        self.assertRegex(first.trace_id, r'^[0-9a-f]{32}$')
+        self.assertRegex(first.span_id, r'^[0-9a-f]{16}$')
+        self.assertLess(first.trace_id, second.trace_id)
+        self.assertEqual(first.request_id, first.trace_id)
+
+    def test_incoming_headers_are_honored(self):
+        """A valid traceparent is continued; unsafe request IDs are replaced."""
+        trace, token = start_trace('req-42', '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01')
+        end_trace(token)
+        self.assertEqual(trace.request_id, 'req-42')
+        self.assertEqual(trace.trace_id, '4bf92f3577b34da6a3ce929d0e0e4736')
+        self.assertEqual(trace.parent_id, '00f067aa0ba902b7')
+        self.assertTrue(trace.traceparent().startswith('00-4bf92f3577b34da6a3ce929d0e0e4736-'))
+
+        trace, token = start_trace('bad\r\nid', '00-' + '0' * 32 + '-00f067aa0ba902b7-01')
+        end_trace(token)
+        self.assertEqual(trace.request_id, trace.trace_id)
+        self.assertIsNone(trace.parent_id)
+
+    def test_phases_and_server_timing(self):
+        """Phases measured in the context appear in Server-Timing."""
+
+        class Connection:
+            def select(self, sql):
+                return [sql]
+
+        connection = Connection()
+        self.assertEqual(instrument(connection, ('select', 'missing')), ['select'])
+
+        controller = traced(lambda: connection.select('select 1'))
+        trace, token = start_trace()
+        try:
+            self.assertEqual(current_request_id(), trace.request_id)
+            controller()
+            with measure('render'):
+                time.sleep(0.001)
+        finally:
+            end_trace(token)
+
+        self.assertIsNone(current_trace.get())
+        self.assertEqual(trace.counts, {'db': 1, 'controller': 1, 'render': 1})
+
+        header = trace.server_timing(total_ns=50_000_000)
+        names = [metric.split(';')[0] for metric in header.split(', ')]
+        self.assertEqual(names, ['total', 'middleware', 'controller', 'db', 'render'])
+        self.assertIn('total;dur=50.00', header)
+        self.assertIn('db;dur=', header)
+        self.assertIn('desc="1 queries"', header)
+
+    def test_untraced_calls_are_not_measured(self):
+        """Outside a request measure() and traced() do nothing."""
+        with measure('db'):
+            pass
+        self.assertEqual(traced(lambda: 'ok')(), 'ok')
+
+    def test_streamed_bodies_are_timed(self):
+        """trace_body() times the body as 'render', inside the trace, and logs the full timing."""
+        closed = []
+
+        def body():
+            try:
+                with measure('db'):
+                    pass
+                yield b'chunk'
+                yield b''
+            finally:
+                closed.append(True)
+
+        trace, token = start_trace()
+        end_trace(token)
+        with self.assertLogs('app.Support.Tracing', 'DEBUG') as logs:
+            self.assertEqual(list(trace_body(body(), trace)), [b'chunk', b''])
+
+        self.assertIsNone(current_trace.get())
+        self.assertEqual(trace.counts, {'db': 1, 'render': 1})
+        self.assertEqual(closed, [True])
+        self.assertIn('render;dur=', logs.output[0])
+
+    def test_log_filter(self):
+        """Log records carry the current request ID."""
+        record = logging.LogRecord('app', logging.INFO, __file__, 1, 'message', None, None)
+        TraceLogFilter().filter(record)
+        self.assertEqual(record.request_id, '-')
+
+        trace, token = start_trace('req-7')
+        try:
+            TraceLogFilter().filter(record)
+        finally:
+            end_trace(token)
+        self.assertEqual(record.request_id, 'req-7')
+
+
+if __name__ == '__main__':
+    unittest.main()
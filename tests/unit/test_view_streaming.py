@@ -0,0 +1,105 @@
+"""
+Unit tests for streamed view rendering.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.View.View import View, buffer_chunks
+
+try:
+    import secrets
+    from flask import Flask, flash, get_flashed_messages, session
+    from jinja2 import DictLoader
+    from markupsafe import Markup
+except ImportError:
+    Flask = None
+
+
+class TestBufferChunks(UnitTestCase):
+    """Tests for buffer_chunks."""
+
+    def test_head_is_flushed_immediately(self):
+        """Output up to </head> is sent before the body is buffered."""
+        chunks = ['<html><head>', '<link rel="stylesheet">', '</head>\n<body>', 'a', 'b', '</body>']
+        output = list(buffer_chunks(chunks, buffer_size=1024))
+
+        self.assertEqual(output, [
+            b'<html><head><link rel="stylesheet"></head>\n<body>',
+            b'ab</body>',
+        ])
+
+    def test_body_is_flushed_by_size(self):
+        """Rows are grouped into chunks of roughly buffer_size characters."""
+        rows = [f"<tr><td>{index}</td></tr>" for index in range(100)]
+        output = list(buffer_chunks(rows, buffer_size=200))
+
+        self.assertGreaterEqual(len(output), 9)
+        self.assertTrue(all(len(chunk) < 200 + len(rows[-1]) for chunk in output))
+        self.assertEqual(b''.join(output), ''.join(rows).encode('utf-8'))
+
+    def test_encodes_utf8_and_skips_empty_chunks(self):
+        """Empty chunks are ignored and text is UTF-8 encoded."""
+        self.assertEqual(list(buffer_chunks(['', 'café', ''])), ['café'.encode('utf-8')])
+
+
+@unittest.skipIf(Flask is None, "streamed responses require Flask")
+class TestStreamSession(UnitTestCase):
+    """Tests for session writes made while a view streams."""
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+        self.app.secret_key = 'testing'
+        self.app.jinja_loader = DictLoader({
+            'page.html': (
+                '<html><head>{{ csrf_meta() }}</head><body>'
+                '{% for message in get_flashed_messages() %}<p>{{ message }}</p>{% endfor %}'
+                '</body></html>'
+            ),
+        })
+
+        def csrf_meta():
+            # Like the Larapy helper: the token is created on first use
+            token = session.setdefault('_token', secrets.token_hex(8))
+            return Markup(f'<meta name="csrf-token" content="{token}">')
+
+        self.app.jinja_env.globals.update(csrf_meta=csrf_meta, get_flashed_messages=get_flashed_messages)
+
+        @self.app.route('/')
+        def page():
+            return View('page.html', {}).stream()
+
+        @self.app.route('/flash')
+        def flashed():
+            flash('Saved')
+            return ''
+
+        @self.app.route('/token')
+        def token():
+            return session.get('_token', '')
+
+    def test_token_created_on_first_visit_is_kept(self):
+        """The CSRF token rendered in the head is saved in the session cookie."""
+        client = self.app.test_client()
+        page = client.get('/').get_data(as_text=True)
+        token = client.get('/token').get_data(as_text=True)
+
+        self.assertTrue(token)
+        self.assertIn(f'content="{token}"', page)
+
+    def test_flashed_messages_are_shown_once(self):
+        """Messages popped by a streamed page are removed from the session."""
+        client = self.app.test_client()
+        client.get('/flash')
+        self.assertIn('<p>Saved</p>', client.get('/').get_data(as_text=True))
+        self.assertNotIn('<p>Saved</p>', client.get('/').get_data(as_text=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
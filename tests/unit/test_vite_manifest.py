@@ -0,0 +1,99 @@
+"""
+Unit tests for the memoized Vite helper.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the base test class to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from base import UnitTestCase
+
+from app.View import Vite
+
+
+MANIFEST = {
+    'resources/js/app.js': {
+        'file': 'assets/app-1a2b3c4d.js',
+        'isEntry': True,
+        'imports': ['_vendor-5e6f7a8b.js'],
+        'css': ['assets/app-9c0d1e2f.css'],
+    },
+    '_vendor-5e6f7a8b.js': {
+        'file': 'assets/vendor-5e6f7a8b.js',
+        'imports': ['_runtime-aaaabbbb.js'],
+        'css': ['assets/vendor-33334444.css'],
+    },
+    '_runtime-aaaabbbb.js': {
+        'file': 'assets/runtime-aaaabbbb.js',
+    },
+    'resources/css/app.css': {
+        'file': 'assets/app-11112222.css',
+        'isEntry': True,
+    },
+}
+
+
+class TestVite(UnitTestCase):
+    """Tests for Vite."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / 'manifest.json'
+        self.manifest_path.write_text(json.dumps(MANIFEST))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_renders_preloads_styles_and_scripts(self):
+        """The transitive import graph is preloaded and its CSS linked."""
+        html = Vite(self.manifest_path).tags(['resources/js/app.js'])
+
+        self.assertEqual(html.splitlines(), [
+            '<link rel="modulepreload" href="/build/assets/vendor-5e6f7a8b.js">',
+            '<link rel="modulepreload" href="/build/assets/runtime-aaaabbbb.js">',
+            '<link rel="stylesheet" href="/build/assets/app-9c0d1e2f.css">',
+            '<link rel="stylesheet" href="/build/assets/vendor-33334444.css">',
+            '<script type="module" src="/build/assets/app-1a2b3c4d.js"></script>',
+        ])
+
+    def test_css_entry_renders_stylesheet(self):
+        """A CSS entry renders a single stylesheet link."""
+        html = Vite(self.manifest_path).tags('resources/css/app.css')
+        self.assertEqual(html, '<link rel="stylesheet" href="/build/assets/app-11112222.css">')
+
+    def test_manifest_is_read_once_in_production(self):
+        """Without mtime checks the manifest and tags are memoized."""
+        vite = Vite(self.manifest_path)
+        first = vite.tags(['resources/css/app.css'])
+
+        self.manifest_path.unlink()
+        self.assertIs(vite.tags(['resources/css/app.css']), first)
+
+    def test_manifest_reloads_on_change_in_debug(self):
+        """With mtime checks a rebuilt manifest replaces cached tags."""
+        vite = Vite(self.manifest_path, check_mtime=True)
+        vite.tags(['resources/css/app.css'])
+
+        manifest = dict(MANIFEST, **{'resources/css/app.css': {'file': 'assets/app-99998888.css'}})
+        self.manifest_path.write_text(json.dumps(manifest))
+        stat = os.stat(self.manifest_path)
+        os.utime(self.manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertIn('app-99998888.css', vite.tags(['resources/css/app.css']))
+
+    def test_missing_manifest_and_unknown_entry(self):
+        """No manifest renders nothing; unknown entries fail loudly."""
+        self.assertIsNone(Vite(Path(self.temp_dir.name) / 'missing.json').tags(['resources/js/app.js']))
+        with self.assertRaises(KeyError):
+            Vite(self.manifest_path).tags(['resources/js/missing.js'])
+
+
+if __name__ == '__main__':
+    unittest.main()